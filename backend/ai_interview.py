@@ -1,21 +1,37 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from datetime import datetime, timezone
 import json
+import time
 from zoneinfo import ZoneInfo
-from openai import OpenAI
 
-from backend.database import supabase
-from backend.services.email_service import email_service
-from backend.config import config
+from backend.repository import candidate_repo, interview_repo, session_repo
+from backend.services.email_service import email_service, is_real_email
 from backend.services.ai_service import ai_service
+from backend.services.answer_scoring import answer_scorer
+from backend.services.circuit_breaker import CircuitOpenError
+from backend.services.interview_context import clip, count_tokens, interview_context, record_prompt_tokens
+from backend.services.interview_planner import interview_planner
+from backend.services.job_queue import job_worker
+from backend.services.interview_sessions import LiveInterview, live_interviews
+from backend.services.metrics import metrics
 
 router = APIRouter()
 
-client = OpenAI(api_key=config.OPENAI_API_KEY)
-
 MAX_QUESTIONS = 10
 
+# Asked while the LLM provider is unavailable so a live interview can go on
+FALLBACK_QUESTIONS = [
+    "Walk me through a recent project from your resume and the part you personally owned.",
+    "Describe a difficult bug or failure you dealt with. How did you find the root cause?",
+    "Tell me about a technical decision where you had to weigh trade-offs. What did you choose and why?",
+    "How would you approach a task in this role when the requirements are unclear?",
+    "Describe a time you disagreed with a teammate. How was it resolved?",
+    "What is a skill from the job requirements you have used in production, and how?"
+]
+
 
 
 class InterviewPayload(BaseModel):
@@ -27,32 +43,42 @@ class TokenPayload(BaseModel):
     token: str
 
 
+async def _db(call, *args):
+    # supabase-py is synchronous; keep its round-trips off the event loop
+    return await run_in_threadpool(call, *args)
+
+
+async def _load_candidate_and_vacancy(candidate_id: str):
+    candidate_data, vacancy_data = await _db(candidate_repo.get_with_vacancy, candidate_id)
+
+    if not candidate_data:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    return candidate_data, vacancy_data
+
+
+def _fallback_question(transcript: list) -> str:
+    asked = " ".join(t.get("question", "") for t in transcript)
+    unused = [q for q in FALLBACK_QUESTIONS if q not in asked]
+    return (unused or FALLBACK_QUESTIONS)[0]
+
+
 
 
 
 @router.post("/ai-interview/validate")
-def validate_interview(payload: TokenPayload):
+async def validate_interview(payload: TokenPayload):
     token = payload.token
 
     # 1️⃣ Fetch ONLY active session
-    res = (
-        supabase
-        .table("ai_interview_sessions")
-        .select("*")
-        .eq("interview_token", token)
-        .eq("is_active", True)   # 🔥 CRITICAL
-        .single()
-        .execute()
-    )
+    session = await _db(session_repo.active_by_token, token)
 
-    if not res.data:
+    if not session:
         raise HTTPException(
             status_code=403,
             detail="Interview link is invalid or expired"
         )
 
-    session = res.data
-
     # 2️⃣ Current time (UTC)
     now_utc = datetime.now(timezone.utc)
 
@@ -74,9 +100,9 @@ def validate_interview(payload: TokenPayload):
 
     # 5️⃣ AFTER EXPIRY
     if now_utc > expires_at_utc:
-        supabase.table("ai_interview_sessions").update({
+        await _db(session_repo.update, session["id"], {
             "is_active": False
-        }).eq("id", session["id"]).execute()
+        })
 
         raise HTTPException(
             status_code=403,
@@ -85,9 +111,15 @@ def validate_interview(payload: TokenPayload):
 
     # 6️⃣ Mark started ONCE
     if not session.get("started_at"):
-        supabase.table("ai_interview_sessions").update({
+        await _db(session_repo.update, session["id"], {
             "started_at": now_utc.isoformat()
-        }).eq("id", session["id"]).execute()
+        })
+
+    # 7️⃣ Plan the questions while the candidate gets ready
+    await interview_planner.prepare(
+        session["candidate_id"],
+        lambda: _load_candidate_and_vacancy(session["candidate_id"])
+    )
 
     return {
         "success": True,
@@ -99,83 +131,17 @@ def validate_interview(payload: TokenPayload):
 # =====================================================
 # NEXT QUESTION
 # =====================================================
-@router.post("/ai-interview/next")
-def next_question(payload: InterviewPayload):
-    
-
-    # 1️⃣ Load or create session
-    session_res = (
-        supabase
-        .table("ai_interview_sessions")
-        .select("*")
-        .eq("candidate_id", payload.candidate_id)
-        .eq("is_active", True)
-        .execute()
-    )
-
-    if not session_res.data:
-        raise HTTPException(status_code=403, detail="Interview session inactive")
-
-    session = session_res.data[0]
-
-
-
-    if session:
-        question_count = session["question_count"]
-        transcript = session.get("transcript", [])
-    
-
-    # If last question answer just submitted → trigger evaluation
-    if question_count >= MAX_QUESTIONS:
-        return {
-            "completed": True,
-            "message": "Interview completed. Generating final evaluation..."
-        }
-
-
-
-    
-    if payload.answer and transcript:
-        transcript[-1]["answer"] = payload.answer
-
-
+async def _question_prompt(candidate_data: dict, vacancy_data: dict, transcript: list, question_count: int) -> str:
     last_answer = (
-        transcript[-1]["answer"]
+        clip(transcript[-1]["answer"], interview_context.history_tokens // 2)
         if transcript and transcript[-1].get("answer")
         else "No previous answer yet."
     )
 
-    
-    candidate_res = (
-        supabase.table("candidates")
-        .select("*")
-        .eq("id", payload.candidate_id)
-        .single()
-        .execute()
-    )
-
-    candidate_data = candidate_res.data
-
-    vacancy_id = candidate_data.get("vacancy_id")
-
-    if not vacancy_id:
-        return {
-            "completed": True,
-            "error": "Candidate is not linked to any vacancy"
-        }
-
-
-
-    vacancy_res = (
-        supabase.table("vacancies")
-        .select("*")
-        .eq("id", vacancy_id)
-        .single()
-        .execute()
-    )
-
-    vacancy_data = vacancy_res.data
-
+    # Bounded: a cached resume profile and a rolling summary of earlier turns
+    resume_text = candidate_data.get('resume_text', 'Resume not available')
+    profile = await interview_context.resume_profile(resume_text)
+    history = await interview_context.history(candidate_data["id"], transcript)
 
     # 4️⃣ Generate next question (GPT-5-mini SAFE)
     prompt = f"""
@@ -191,8 +157,8 @@ Required Skills: {', '.join(vacancy_data.get('required_skills', [])) if vacancy_
 Job Description:
 {vacancy_data.get('description', 'N/A')}
 Culture Traits: {', '.join(vacancy_data.get('culture_traits', [])) if vacancy_data.get('culture_traits') else 'Not specified'}
-Candidate Resume:
-{candidate_data.get('resume_text', 'Resume not available')}
+Candidate Resume (profile):
+{profile}
 
 ━━━━━━━━━━━━━━━━━━━━━━
 INTERVIEW STATE
@@ -206,7 +172,7 @@ Previous Answer (if any):
 {last_answer}
 
 Previously Asked Questions:
-{[t['question'] for t in transcript]}
+{history}
 
 ━━━━━━━━━━━━━━━━━━━━━━
 CRITICAL INTERVIEW RULES (NON-NEGOTIABLE)
@@ -270,9 +236,81 @@ No markdown.
 
     """
 
-    question = ai_service.generate_completion(prompt)
+    record_prompt_tokens(
+        "question",
+        prompt,
+        count_tokens(prompt) - count_tokens(profile + history)
+        + count_tokens(resume_text + str([t['question'] for t in transcript])),
+        turn=question_count + 1
+    )
+
+    return prompt
 
 
+async def _prepare_next(payload: InterviewPayload):
+    """
+    Loads the session, records the submitted answer and builds the prompt
+    for the next question. Returns (response, None) when there is no next
+    question to ask, otherwise (None, turn).
+    """
+
+    # 1️⃣ Load or create session
+    session = await _db(session_repo.active_for_candidate, payload.candidate_id)
+
+    if not session:
+        raise HTTPException(status_code=403, detail="Interview session inactive")
+
+
+
+    if session:
+        question_count = session["question_count"]
+        transcript = session.get("transcript", [])
+    
+
+    # If last question answer just submitted → trigger evaluation
+    if question_count >= MAX_QUESTIONS:
+        return {
+            "completed": True,
+            "message": "Interview completed. Generating final evaluation..."
+        }, None
+
+
+
+    
+    if payload.answer and transcript:
+        transcript[-1]["answer"] = payload.answer
+
+
+    candidate_data, vacancy_data = await _load_candidate_and_vacancy(payload.candidate_id)
+
+    if not vacancy_data:
+        return {
+            "completed": True,
+            "error": "Candidate is not linked to any vacancy"
+        }, None
+
+    if payload.answer and transcript:
+        answer_scorer.schedule(
+            payload.candidate_id,
+            len(transcript) - 1,
+            transcript[-1].get("question"),
+            payload.answer,
+            vacancy_data,
+            candidate_data.get("resume_text")
+        )
+
+    return None, {
+        "candidate": candidate_data,
+        "vacancy": vacancy_data,
+        "question_count": question_count,
+        "transcript": transcript,
+        "fallback": f"Question {question_count + 1}: {_fallback_question(transcript)}"
+    }
+
+
+async def _save_question(candidate_id: str, turn: dict, question: str) -> dict:
+    question_count = turn["question_count"]
+    transcript = turn["transcript"]
 
     # 5️⃣ Append new question
     transcript.append({
@@ -281,11 +319,10 @@ No markdown.
     })
 
     # 6️⃣ Update session
-    supabase.table("ai_interview_sessions").update({
+    await _db(session_repo.update_for_candidate, candidate_id, {
         "question_count": question_count + 1,
-        "transcript": transcript,
-        "updated_at": datetime.utcnow().isoformat()
-    }).eq("candidate_id", payload.candidate_id).execute()
+        "transcript": transcript
+    })
 
     return {
         "completed": False,
@@ -295,171 +332,348 @@ No markdown.
     }
 
 
-# =====================================================
-# FINAL EVALUATION
-# =====================================================
-@router.post("/ai-interview/evaluate")
-def evaluate_interview(payload: InterviewPayload):
-    
-    candidate_res = (
-        supabase.table("candidates")
-        .select("*")
-        .eq("id", payload.candidate_id)
-        .single()
-        .execute()
+async def _planned_question(turn: dict) -> str | None:
+    return await interview_planner.next_question(
+        turn["candidate"]["id"],
+        turn["transcript"],
+        turn["question_count"]
     )
 
-    candidate_data = candidate_res.data
 
+async def _question_deltas(turn: dict, started: float, mode: str):
+    """
+    Streams the next question. A question from the interview plan is sent
+    as one delta. While the AI circuit is open and nothing has been sent
+    yet, the fallback question is sent as one delta.
+    """
 
-    vacancy_id = candidate_data.get("vacancy_id")
+    planned = await _planned_question(turn)
+    if planned:
+        metrics.observe("interview.first_text_seconds", time.perf_counter() - started, mode=mode)
+        yield planned
+        return
 
-    if not vacancy_id:
-        raise HTTPException(
-            status_code=400,
-            detail="Candidate is not linked to any vacancy"
-        )
+    prompt = await _question_prompt(turn["candidate"], turn["vacancy"], turn["transcript"], turn["question_count"])
+    sent = False
+
+    try:
+        async for delta in ai_service.astream_completion(prompt, priority="interactive"):
+            if not sent:
+                metrics.observe("interview.first_text_seconds", time.perf_counter() - started, mode=mode)
+                sent = True
+            yield delta
 
+    except CircuitOpenError as e:
+        if sent:
+            raise
 
-    vacancy_res = (
-        supabase.table("vacancies")
-        .select("*")
-        .eq("id", vacancy_id)
-        .single()
-        .execute()
-    )
+        print("⚠️ AI unavailable, using fallback:", e)
+        metrics.incr("llm.fallbacks")
+        yield turn["fallback"]
 
-    vacancy_data = vacancy_res.data
 
-    session_res = (
-        supabase.table("ai_interview_sessions")
-        .select("*")
-        .eq("candidate_id", payload.candidate_id)
-        .execute()
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/ai-interview/next")
+async def next_question(payload: InterviewPayload):
+    started = time.perf_counter()
+
+    response, turn = await _prepare_next(payload)
+    if response:
+        return response
+
+    question = await _planned_question(turn) or await ai_service.agenerate_completion(
+        await _question_prompt(turn["candidate"], turn["vacancy"], turn["transcript"], turn["question_count"]),
+        priority="interactive",
+        fallback=turn["fallback"]
     )
 
-    if not session_res.data:
-        raise HTTPException(status_code=400, detail="Interview session not found")
+    # The candidate sees nothing until the whole question is back
+    elapsed = time.perf_counter() - started
+    metrics.observe("interview.first_text_seconds", elapsed, mode="full")
+    metrics.observe("interview.question_seconds", elapsed, mode="full")
 
-    session = session_res.data[0]
+    return await _save_question(payload.candidate_id, turn, question)
 
 
+@router.post("/ai-interview/next/stream")
+async def next_question_stream(payload: InterviewPayload):
+    """
+    Same turn as /ai-interview/next as server-sent events: `delta` events
+    carry the question text as the model writes it, then `done` carries
+    the body /ai-interview/next would return (or `error`).
+    """
 
-    transcript = session["transcript"]
+    started = time.perf_counter()
 
-    # 🔒 Save last answer
-    if payload.answer and transcript:
-        transcript[-1]["answer"] = payload.answer
+    response, turn = await _prepare_next(payload)
+
+    async def events():
+        if response:
+            yield _sse("done", response)
+            return
+
+        parts = []
+
+        try:
+            async for delta in _question_deltas(turn, started, "stream"):
+                parts.append(delta)
+                yield _sse("delta", {"text": delta})
+
+        except Exception as e:
+            print("❌ Question stream failed:", e)
+            yield _sse("error", {"detail": "Question generation failed"})
+            return
+
+        question = "".join(parts).strip()
+        metrics.observe("interview.question_seconds", time.perf_counter() - started, mode="stream")
 
-    transcript_text = "\n\n".join(
-        f"Q: {t['question']}\nA: {t['answer']}"
-        for t in transcript if t.get("answer")
+        yield _sse("done", await _save_question(payload.candidate_id, turn, question))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
-    eval_prompt = f"""
-You are a senior hiring panel conducting a final interview evaluation.
 
-Your task is to evaluate the candidate’s interview performance
-in relation to the job requirements and their resume background.
+# =====================================================
+# INTERVIEW WEBSOCKET
+# =====================================================
+async def _load_live_interview(candidate_id: str) -> LiveInterview:
+    # A previous socket of this candidate may still be writing its transcript
+    previous = live_interviews.get(candidate_id)
+    if previous:
+        await previous.flush()
 
-━━━━━━━━━━━━━━━━━━━━━━
-JOB CONTEXT
-━━━━━━━━━━━━━━━━━━━━━━
-Role: {vacancy_data['job_role']}
-Experience Level Target: {vacancy_data.get('experience_level', 'Not specified')}
-Required Skills: {', '.join(vacancy_data.get('required_skills', [])) if vacancy_data.get('required_skills') else 'Not specified'}
-Culture Traits: {', '.join(vacancy_data.get('culture_traits', [])) if vacancy_data.get('culture_traits') else 'Not specified'}
-Job Description:
-{vacancy_data.get('description', 'N/A')}
+    session = await _db(session_repo.active_for_candidate, candidate_id)
 
-━━━━━━━━━━━━━━━━━━━━━━
-CANDIDATE DATA
-━━━━━━━━━━━━━━━━━━━━━━
-Resume (BACKGROUND ONLY — NOT PROOF):
-{candidate_data.get('resume_text', '')}
+    if not session:
+        raise HTTPException(status_code=403, detail="Interview session inactive")
 
-Interview Transcript (PRIMARY EVIDENCE):
-{transcript_text}
+    candidate_data, vacancy_data = await _load_candidate_and_vacancy(candidate_id)
 
-━━━━━━━━━━━━━━━━━━━━━━
-EVALUATION RULES (STRICT)
-━━━━━━━━━━━━━━━━━━━━━━
-1. Base scores PRIMARILY on interview answers.
-2. Resume may be used ONLY to:
-   - check consistency
-   - validate claims made during interview
-3. If a skill appears on resume but is NOT demonstrated → do NOT reward it.
-4. Penalize:
-   - vague responses
-   - buzzwords without explanation
-   - theoretical answers without practical examples
-5. Reward:
-   - clear reasoning
-   - concrete examples
-   - decision trade-offs
-   - ownership
-6. Be strict, realistic, and conservative.
-7. Do NOT inflate scores.
+    return LiveInterview(session, candidate_data, vacancy_data)
 
-━━━━━━━━━━━━━━━━━━━━━━
-SCORING SYSTEM (MANDATORY)
-━━━━━━━━━━━━━━━━━━━━━━
 
-Each category MUST be scored out of 25.
+async def _socket_turn(websocket: WebSocket, live: LiveInterview, answer: str | None) -> bool:
+    """
+    Records the answer and pushes the next question. False once the
+    interview has no next question.
+    """
 
-Categories:
-- Skill (0–25)
-- Communication (0–25)
-- Problem Solving (0–25)
-- Culture Fit (0–25)
+    started = time.perf_counter()
 
-⚠️ Hard Constraints:
-- No category can exceed 25.
-- No decimals.
-- No negative values.
+    live.record_answer(answer)
 
-━━━━━━━━━━━━━━━━━━━━━━
-OVERALL SCORE
-━━━━━━━━━━━━━━━━━━━━━━
+    if answer and live.transcript:
+        answer_scorer.schedule(
+            live.candidate_id,
+            len(live.transcript) - 1,
+            live.transcript[-1].get("question"),
+            answer,
+            live.vacancy,
+            live.candidate.get("resume_text")
+        )
 
-Overall Score MUST equal:
+    if live.question_count >= MAX_QUESTIONS:
+        # /ai-interview/evaluate reads the transcript from the database
+        if not await live.flush():
+            # Submitting again records the answer and retries the write
+            await websocket.send_json({"type": "error", "detail": "Interview could not be saved, please submit again"})
+            return True
 
-Skill + Communication + Problem Solving + Culture Fit
+        await websocket.send_json({
+            "type": "done",
+            "completed": True,
+            "message": "Interview completed. Generating final evaluation..."
+        })
+        return False
 
-Overall Score MUST be out of 100.
-It MUST be the exact mathematical sum.
+    if not live.vacancy:
+        await websocket.send_json({
+            "type": "done",
+            "completed": True,
+            "error": "Candidate is not linked to any vacancy"
+        })
+        return False
+
+    turn = {
+        "candidate": live.candidate,
+        "vacancy": live.vacancy,
+        "question_count": live.question_count,
+        "transcript": live.transcript,
+        "fallback": f"Question {live.question_count + 1}: {_fallback_question(live.transcript)}"
+    }
 
-━━━━━━━━━━━━━━━━━━━━━━
-RECOMMENDATION LOGIC
-━━━━━━━━━━━━━━━━━━━━━━
+    parts = []
 
-80–100 → Strong Fit  
-70–79  → Moderate Fit  
-Below 70 → Not Recommended  
+    try:
+        async for delta in _question_deltas(turn, started, "socket"):
+            parts.append(delta)
+            await websocket.send_json({"type": "delta", "text": delta})
 
-Do NOT mention numeric cutoffs in output.
+    except WebSocketDisconnect:
+        raise
+
+    except Exception as e:
+        print("❌ Question stream failed:", e)
+        await websocket.send_json({"type": "error", "detail": "Question generation failed"})
+        return True
+
+    question = "".join(parts).strip()
+    metrics.observe("interview.question_seconds", time.perf_counter() - started, mode="socket")
+
+    live.add_question(question)
+
+    await websocket.send_json({
+        "type": "done",
+        "completed": False,
+        "question": question,
+        "current": live.question_count,
+        "total": MAX_QUESTIONS
+    })
+    return True
 
-━━━━━━━━━━━━━━━━━━━━━━
-RETURN STRICT JSON ONLY
-━━━━━━━━━━━━━━━━━━━━━━
-Return JSON in this format:
-{{
-  "skill_score": <0-25>,
-  "communication_score": <0-25>,
-  "problem_solving_score": <0-25>,
-  "culture_fit_score": <0-25>,
-  "overall_score": <0-100>,
-  "recommendation": "<Strong Fit | Moderate Fit | Not Recommended>",
-  "evaluation_notes": "<3-5 sentence professional explanation>"
-}}
 
+@router.websocket("/ai-interview/ws")
+async def interview_socket(websocket: WebSocket, candidate_id: str):
     """
+    The whole interview over one socket. The next question is pushed on
+    connect and after every {"answer": "..."} message, as `delta` messages
+    followed by a `done` message with the /ai-interview/next body.
+    """
+
+    await websocket.accept()
+
+    try:
+        live = await _load_live_interview(candidate_id)
+    except HTTPException as e:
+        await websocket.send_json({"type": "error", "detail": e.detail})
+        await websocket.close(code=4403)
+        return
 
-    raw = ai_service.generate_completion(eval_prompt)
+    live_interviews[candidate_id] = live
+    metrics.gauge("interview.live_sessions", len(live_interviews))
 
     try:
-        evaluation = json.loads(raw)
-    except Exception:
+        answer = None
+
+        while await _socket_turn(websocket, live, answer):
+            message = await websocket.receive_json()
+            answer = message.get("answer")
+
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        pass
+
+    finally:
+        if not await live.flush():
+            print(f"❌ Transcript of {candidate_id} not fully saved")
+
+        if live_interviews.get(candidate_id) is live:
+            del live_interviews[candidate_id]
+        metrics.gauge("interview.live_sessions", len(live_interviews))
+
+
+# =====================================================
+# FINAL EVALUATION
+# =====================================================
+FINALIZE_QUEUE = "interview.finalize"
+
+
+def _finalize_interview(job: dict):
+    """
+    Follow-up of an evaluated interview: close the session, move the
+    candidate on and send the Calendly or rejection email. Runs on the
+    job queue, so every step must be safe to repeat; the email goes last
+    so a failed send retries without redoing anything visible.
+    """
+
+    candidate_id = job["candidate_id"]
+    recommended = job["overall_score"] >= 80
+
+    # 3️⃣ Close session
+    session_repo.update_for_candidate(candidate_id, {
+        "transcript": job["transcript"],
+        "is_active": False
+    })
+
+    # 4️⃣ Update candidate
+    candidate = candidate_repo.set_status(
+        candidate_id,
+        "recommended" if recommended else "rejected",
+        returning="email, name"
+    )
+
+    # 5️⃣ Auto-Calendly
+    if not candidate or not is_real_email(candidate.get("email")):
+        # Retrying cannot fix a missing candidate or address
+        print("⚠️ Follow-up email skipped, no deliverable address:", candidate_id)
+        return
+
+    send = (
+        email_service.send_final_interview_schedule
+        if recommended
+        else email_service.send_rejection_email
+    )
+    result = send(candidate_id, candidate["email"], candidate["name"])
+
+    if not result.get("success"):
+        label = "Calendly" if recommended else "Rejection"
+
+        if result.get("retryable"):
+            raise RuntimeError(f"{label} email failed: {result.get('error')}")
+
+        print(f"❌ {label} email rejected for {candidate_id}: {result.get('error')}")
+
+
+job_worker.register(FINALIZE_QUEUE, _finalize_interview)
+
+
+@router.post("/ai-interview/evaluate")
+async def evaluate_interview(payload: InterviewPayload):
+    request_started = time.perf_counter()
+
+    candidate_data, vacancy_data = await _load_candidate_and_vacancy(payload.candidate_id)
+
+    if not vacancy_data:
+        raise HTTPException(
+            status_code=400,
+            detail="Candidate is not linked to any vacancy"
+        )
+
+    vacancy_id = vacancy_data["id"]
+
+    session = await _db(session_repo.for_candidate, payload.candidate_id)
+
+    if not session:
+        raise HTTPException(status_code=400, detail="Interview session not found")
+
+
+
+    transcript = session["transcript"]
+
+    # 🔒 Save last answer
+    if payload.answer and transcript:
+        transcript[-1]["answer"] = payload.answer
+
+    # Merge of the per-answer scores stored while the interview ran
+    started = time.perf_counter()
+
+    evaluation = await answer_scorer.evaluate(
+        payload.candidate_id,
+        transcript,
+        vacancy_data,
+        candidate_data.get("resume_text")
+    )
+
+    metrics.observe("interview.evaluate_seconds", time.perf_counter() - started)
+
+    if evaluation is None:
         evaluation = {
             "skill_score": 15,
             "communication_score": 15,
@@ -470,19 +684,10 @@ Return JSON in this format:
             "evaluation_notes": "Fallback evaluation"
         }
 
-    # 1️⃣ Fetch candidate
-    candidate = (
-        supabase.table("candidates")
-        .select("id, email, name, vacancy_id")
-        .eq("id", payload.candidate_id)
-        .single()
-        .execute()
-    ).data
-
-    # 2️⃣ Store interview
-    supabase.table("ai_interviews").insert({
+    # 1️⃣ Store interview (the only write the candidate waits for)
+    await _db(interview_repo.create, {
         "candidate_id": payload.candidate_id,
-        "vacancy_id": candidate["vacancy_id"],
+        "vacancy_id": vacancy_id,
         "interview_transcript": transcript,
         "skill_score": evaluation["skill_score"],
         "communication_score": evaluation["communication_score"],
@@ -494,55 +699,23 @@ Return JSON in this format:
         "started_at": session.get("started_at") or session["scheduled_at"],
 
         "completed_at": datetime.utcnow().isoformat()
-    }).execute()
-
-    # 3️⃣ Close session
-    supabase.table("ai_interview_sessions").update({
-        "transcript": transcript,
-        "updated_at": datetime.utcnow().isoformat()
-    }).eq("candidate_id", payload.candidate_id).execute()
-
-    # 4️⃣ Update candidate
-    supabase.table("candidates").update({
-        "status": "interviewed",
-        "updated_at": datetime.utcnow().isoformat()
-    }).eq("id", payload.candidate_id).execute()
-
-    supabase.table("ai_interview_sessions").update({
-        "is_active": False
-    }).eq("candidate_id", payload.candidate_id).execute()
-
-    # 5️⃣ Auto-Calendly
-    if evaluation["overall_score"] >= 80:
-        try:
-            email_service.send_final_interview_schedule(
-                payload.candidate_id,
-                candidate["email"],
-                candidate["name"]
-            )
-
-        except Exception as e:
-            print("⚠️ Calendly email failed:", e)
-
-        supabase.table("candidates").update({
-            "status": "recommended"
-        }).eq("id", payload.candidate_id).execute()
+    })
 
-    else:
-   
-        try:
-            email_service.send_rejection_email(
-                payload.candidate_id,
-                candidate["email"],
-                candidate["name"]
-            )
-        except Exception as e:
-            print("⚠️ Rejection email failed:", e)
+    # 2️⃣ Session, candidate status and email run as a retried background job
+    await run_in_threadpool(
+        job_worker.enqueue,
+        FINALIZE_QUEUE,
+        {
+            "candidate_id": payload.candidate_id,
+            "transcript": transcript,
+            "overall_score": evaluation["overall_score"]
+        }
+    )
 
-        supabase.table("candidates").update({
-            "status": "rejected",
-            "updated_at": datetime.utcnow().isoformat()
-        }).eq("id", payload.candidate_id).execute()
+    await _db(interview_context.forget, payload.candidate_id)
+    await _db(interview_planner.forget, payload.candidate_id)
+    await _db(answer_scorer.forget, payload.candidate_id)
 
+    metrics.observe("interview.evaluate_response_seconds", time.perf_counter() - request_started)
 
     return {"success": True, "evaluation": evaluation}
@@ -0,0 +1,146 @@
+"""
+Per-turn question latency with and without the pre-generated interview plan.
+
+The LLM is a local stub whose latency grows with the prompt: `--base`
+seconds plus `--per-1k-tokens` seconds per 1000 prompt tokens. Each of
+`--interviews` concurrent interviews runs 10 turns, once generating every
+question with the full prompt and once from a plan generated up front
+(not timed per turn, as it happens at validate time). A `--weak-ratio`
+share of answers is weak, which costs a short follow-up call in plan mode.
+No tokens are spent; local state goes to a temporary STATE_DIR.
+
+    python -m backend.benchmarks.interview_planner --interviews 20 --weak-ratio 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+# Pacing would only add noise to a latency benchmark
+os.environ["LLM_RATE_LIMIT_RPM"] = "0"
+os.environ["LLM_RATE_LIMIT_TPM"] = "0"
+os.environ["LLM_PROVIDERS"] = "stub"
+os.environ["STATE_DIR"] = tempfile.mkdtemp(prefix="interview_planner_")
+
+from backend import ai_interview  # noqa: E402
+from backend.services.interview_planner import TOPICS, interview_planner  # noqa: E402
+from backend.services.llm_client import llm_client  # noqa: E402
+from backend.services.llm_providers import Completion, LLMProvider, StubProvider  # noqa: E402
+from backend.services.rate_limiter import estimate_tokens  # noqa: E402
+
+
+VACANCY = {
+    "job_role": "Backend Engineer",
+    "experience_level": "Mid Level",
+    "required_skills": ["Python", "FastAPI", "PostgreSQL"],
+    "culture_traits": ["Ownership"],
+    "description": "Build and run APIs."
+}
+
+RESUME = "Backend Engineer, Acme Corp (2021 - 2024). " + " ".join(
+    f"Built service {i} on FastAPI and PostgreSQL, owned its on-call and scaling work." for i in range(25)
+)
+
+STRONG_ANSWER = " ".join(["I profiled the query, added a covering index and batched the writes."] * 4)
+WEAK_ANSWER = "Not sure, I think it was fine."
+
+
+class PromptSizedStub(StubProvider):
+    # Streams arrive in one piece, after the full latency
+    stream = LLMProvider.stream
+
+    def __init__(self, base: float, per_1k_tokens: float):
+        super().__init__("stub", latency=base)
+        self.per_1k_tokens = per_1k_tokens
+
+    async def complete(self, prompt: str, max_tokens: int) -> Completion:
+        self.calls += 1
+        await asyncio.sleep(self.latency + estimate_tokens(prompt, 0) / 1000 * self.per_1k_tokens)
+
+        if "mapping each topic" in prompt:
+            text = json.dumps({
+                topic: [f"{topic}: planned question {i}?" for i in range(3)] for topic in TOPICS
+            })
+        else:
+            text = "Question 1: How did you find the slow query and what did you change?"
+
+        return Completion(text, None)
+
+
+def _percentile(samples, q: float) -> float:
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(len(samples) * q))], 3)
+
+
+async def _interview(i: int, planned: bool, args, rng: random.Random, latencies: list):
+    candidate = {"id": f"{'plan' if planned else 'full'}-{i}", "resume_text": RESUME}
+
+    if planned:
+        await interview_planner.generate(candidate["id"], candidate, VACANCY)
+
+    transcript = []
+
+    for n in range(ai_interview.MAX_QUESTIONS):
+        turn = {
+            "candidate": candidate,
+            "vacancy": VACANCY,
+            "question_count": n,
+            "transcript": transcript,
+            "fallback": "Question: fallback"
+        }
+
+        started = time.perf_counter()
+        parts = [d async for d in ai_interview._question_deltas(turn, started, "benchmark")]
+        latencies.append(time.perf_counter() - started)
+
+        answer = WEAK_ANSWER if rng.random() < args.weak_ratio else STRONG_ANSWER
+        transcript.append({"question": "".join(parts), "answer": answer})
+
+
+def _run(planned: bool, args, stub: PromptSizedStub) -> dict:
+    latencies = []
+    rng = random.Random(args.seed)
+    calls_before = stub.calls
+    interview_planner.enabled = planned
+
+    async def main():
+        await asyncio.gather(*(
+            _interview(i, planned, args, rng, latencies) for i in range(args.interviews)
+        ))
+
+    asyncio.run(main())
+
+    return {
+        "mode": "plan" if planned else "full",
+        "turns": len(latencies),
+        "p50": _percentile(latencies, 0.5),
+        "p95": _percentile(latencies, 0.95),
+        "max": round(max(latencies), 3),
+        "llm_calls": stub.calls - calls_before
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interviews", type=int, default=20)
+    parser.add_argument("--base", type=float, default=0.8)
+    parser.add_argument("--per-1k-tokens", type=float, default=0.4)
+    parser.add_argument("--weak-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    stub = PromptSizedStub(args.base, args.per_1k_tokens)
+    llm_client.providers["stub"] = stub
+
+    for planned in (False, True):
+        print(json.dumps(_run(planned, args, stub)))
+
+    llm_client.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Tail latency of interactive completions with and without hedging.
+
+Two local StubProviders stand in for OpenAI / Anthropic: each answers in
+`--latency` seconds, except a `--tail-ratio` share of calls that take
+`--tail-latency`. The same calls are run through LLMClient once with
+hedging off and once with it on, and the latency percentiles and the
+number of upstream calls (the cost of hedging) are reported. No tokens
+are spent.
+
+    python -m backend.benchmarks.llm_hedging --calls 400 --tail-ratio 0.04
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+# Pacing would only add noise to a latency benchmark
+os.environ["LLM_RATE_LIMIT_RPM"] = "0"
+os.environ["LLM_RATE_LIMIT_TPM"] = "0"
+
+from backend.services.llm_client import LLMClient  # noqa: E402
+from backend.services.llm_providers import StubProvider  # noqa: E402
+
+
+def _percentile(samples, q: float) -> float:
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(len(samples) * q))], 3)
+
+
+def _run(hedge: bool, args) -> dict:
+    stubs = [
+        StubProvider(
+            name,
+            latency=latency,
+            tail_latency=args.tail_latency,
+            tail_ratio=args.tail_ratio,
+            seed=seed
+        )
+        for name, latency, seed in (
+            ("primary", args.latency, 1),
+            ("backup", args.latency * 1.5, 2)
+        )
+    ]
+
+    client = LLMClient(
+        providers=stubs,
+        timeout=30,
+        max_in_flight=args.concurrency,
+        aging_seconds=30,
+        preferred="primary",
+        hedge_priorities=["interactive"] if hedge else [],
+        hedge_min_delay=args.hedge_min_delay,
+        routing_min_samples=20
+    )
+
+    latencies = []
+
+    async def one(i: int, slots: asyncio.Semaphore):
+        async with slots:
+            started = time.perf_counter()
+            await client.acomplete(f"question {i}", priority="interactive")
+            latencies.append(time.perf_counter() - started)
+
+    async def main():
+        slots = asyncio.Semaphore(args.concurrency)
+        await asyncio.gather(*(one(i, slots) for i in range(args.calls)))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    elapsed = time.perf_counter() - started
+    client.shutdown()
+
+    upstream = sum(s.calls for s in stubs)
+
+    return {
+        "hedging": hedge,
+        "calls": args.calls,
+        "p50": _percentile(latencies, 0.5),
+        "p95": _percentile(latencies, 0.95),
+        "p99": _percentile(latencies, 0.99),
+        "max": round(max(latencies), 3),
+        "upstream_calls": upstream,
+        "extra_call_ratio": round(upstream / args.calls - 1, 3),
+        "elapsed_seconds": round(elapsed, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--tail-latency", type=float, default=2.0)
+    parser.add_argument("--tail-ratio", type=float, default=0.04)
+    parser.add_argument("--hedge-min-delay", type=float, default=0.25)
+    args = parser.parse_args()
+
+    for hedge in (False, True):
+        print(json.dumps(_run(hedge, args)))
+
+
+if __name__ == "__main__":
+    main()
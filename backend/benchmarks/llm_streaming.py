@@ -0,0 +1,94 @@
+"""
+Time to first text of an interview question, streamed vs. full response.
+
+A local StubProvider answers with a `--words` word question over
+`--latency` seconds, the first word arriving after `--first-token`
+seconds (prompt processing). Each call is made once through
+LLMClient.acomplete, where the candidate sees the question only when it
+is complete, and once through LLMClient.astream, where the first delta
+can be rendered (and the first sentence spoken). No tokens are spent.
+
+    python -m backend.benchmarks.llm_streaming --calls 50 --latency 3 --first-token 0.4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+# Pacing would only add noise to a latency benchmark
+os.environ["LLM_RATE_LIMIT_RPM"] = "0"
+os.environ["LLM_RATE_LIMIT_TPM"] = "0"
+
+from backend.services.llm_client import LLMClient  # noqa: E402
+from backend.services.llm_providers import StubProvider  # noqa: E402
+
+
+def _percentile(samples, q: float) -> float:
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(len(samples) * q))], 3)
+
+
+def _summary(samples) -> dict:
+    return {"p50": _percentile(samples, 0.5), "p95": _percentile(samples, 0.95)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=3.0)
+    parser.add_argument("--first-token", type=float, default=0.4)
+    parser.add_argument("--words", type=int, default=40)
+    args = parser.parse_args()
+
+    question = "Question 1: " + " ".join(["word"] * args.words) + "?"
+
+    client = LLMClient(
+        providers=[StubProvider(
+            "stub",
+            latency=args.latency,
+            first_token_latency=args.first_token,
+            respond=lambda _: question
+        )],
+        timeout=60,
+        max_in_flight=args.concurrency,
+        aging_seconds=30,
+        coalesce=False
+    )
+
+    full, first_text, streamed = [], [], []
+
+    async def one_full(i: int, slots: asyncio.Semaphore):
+        async with slots:
+            started = time.perf_counter()
+            await client.acomplete(f"prompt {i}")
+            full.append(time.perf_counter() - started)
+
+    async def one_stream(i: int, slots: asyncio.Semaphore):
+        async with slots:
+            started = time.perf_counter()
+            first = None
+
+            async for _ in client.astream(f"prompt {i}"):
+                if first is None:
+                    first = time.perf_counter() - started
+
+            first_text.append(first)
+            streamed.append(time.perf_counter() - started)
+
+    async def run(one):
+        slots = asyncio.Semaphore(args.concurrency)
+        await asyncio.gather(*(one(i, slots) for i in range(args.calls)))
+
+    asyncio.run(run(one_full))
+    asyncio.run(run(one_stream))
+    client.shutdown()
+
+    print(json.dumps({"mode": "full", "first_text": _summary(full), "complete": _summary(full)}))
+    print(json.dumps({"mode": "stream", "first_text": _summary(first_text), "complete": _summary(streamed)}))
+
+
+if __name__ == "__main__":
+    main()
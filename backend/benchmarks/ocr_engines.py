@@ -0,0 +1,96 @@
+"""
+Per-page latency / throughput of the OCR engines behind ResumeParser.
+
+Pages of every PDF in the corpus are rendered once up front, then each
+engine recognizes all of them: first one page at a time (latency), then
+with `--threads` concurrent callers (throughput). `--parse-mode` runs the
+ocr_preprocess preset on every page first (off = raw 300 DPI colour pages),
+so presets can be compared on the same corpus.
+
+    python -m backend.benchmarks.ocr_engines path/to/scanned_pdfs --threads 4
+    python -m backend.benchmarks.ocr_engines path/to/scanned_pdfs --parse-mode off
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pdf2image import convert_from_path
+
+from backend.config import config
+from backend.services.ocr_preprocess import preprocess
+from backend.services.ocr_engine import (
+    PytesseractEngine,
+    TesserocrPoolEngine,
+    tesserocr
+)
+
+
+def _measure(engine, images, threads: int, parse_mode: str):
+    latencies = []
+
+    for img in images:
+        started = time.perf_counter()
+        engine.recognize(img)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(engine.recognize, images))
+    parallel = time.perf_counter() - started
+
+    latencies.sort()
+
+    return {
+        "engine": engine.name,
+        "parse_mode": parse_mode,
+        "pages": len(images),
+        "latency_avg": round(statistics.mean(latencies), 3),
+        "latency_p50": round(latencies[len(latencies) // 2], 3),
+        "latency_p95": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+        "sequential_pages_per_second": round(len(images) / sum(latencies), 2),
+        "threads": threads,
+        "parallel_pages_per_second": round(len(images) / parallel, 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("corpus", help="directory of image-only PDFs")
+    parser.add_argument("--threads", type=int, default=config.OCR_PAGE_WORKERS)
+    parser.add_argument("--dpi", type=int, default=config.OCR_DPI)
+    parser.add_argument("--parse-mode", default=config.OCR_PARSE_MODE,
+                        help="fast | accurate | off")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.corpus, "*.pdf")))
+    if not paths:
+        raise SystemExit(f"No PDFs found in {args.corpus}")
+
+    images = []
+    for path in paths:
+        images.extend(convert_from_path(path, dpi=args.dpi))
+
+    started = time.perf_counter()
+    images = [preprocess(img, args.parse_mode) for img in images]
+    print(json.dumps({
+        "parse_mode": args.parse_mode,
+        "preprocess_seconds_per_page": round((time.perf_counter() - started) / len(images), 3)
+    }))
+
+    engines = [PytesseractEngine(config.OCR_LANG)]
+    if tesserocr is not None:
+        engines.append(TesserocrPoolEngine(args.threads, config.OCR_LANG))
+    else:
+        print("tesserocr not installed; only pytesseract is measured")
+
+    for engine in engines:
+        print(json.dumps(_measure(engine, images, args.threads, args.parse_mode)))
+
+
+if __name__ == "__main__":
+    main()
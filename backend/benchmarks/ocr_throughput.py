@@ -0,0 +1,106 @@
+"""
+OCR throughput / memory benchmark over a local corpus of image-only PDFs.
+
+Each mode runs in a fresh process so peak RSS (ru_maxrss of the process
+plus its pdftoppm / tesseract children) is not shared between modes.
+
+    python -m backend.benchmarks.ocr_throughput path/to/scanned_pdfs --workers 4
+
+Modes:
+  legacy     render every page at once, then OCR sequentially (old parse_pdf)
+  streaming  ResumeParser.ocr_pdf with the given workers / early stop
+
+The parse cache is off unless --cache is passed, so repeated runs measure
+OCR rather than cached page reads.
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import resource
+import time
+
+from pdf2image import convert_from_bytes, pdfinfo_from_bytes
+import pytesseract
+
+from backend.config import config
+from backend.services.resume_parser import ResumeParser
+
+
+def _legacy_ocr(file_content: bytes) -> str:
+    images = convert_from_bytes(file_content, dpi=300)
+    return "\n".join(
+        pytesseract.image_to_string(img, config="--psm 6") for img in images
+    )
+
+
+def _run_mode(mode: str, paths, workers: int, early_stop: int, cache: bool, out):
+    config.PARSE_CACHE_ENABLED = cache
+
+    pages = 0
+    chars = 0
+    started = time.perf_counter()
+
+    for path in paths:
+        with open(path, "rb") as f:
+            content = f.read()
+
+        pages += pdfinfo_from_bytes(content)["Pages"]
+
+        if mode == "legacy":
+            text = _legacy_ocr(content)
+        else:
+            text = ResumeParser.ocr_pdf(
+                content, workers=workers, early_stop_chars=early_stop
+            )
+
+        chars += len(text)
+
+    elapsed = time.perf_counter() - started
+
+    out.put({
+        "mode": mode,
+        "cache": cache,
+        "files": len(paths),
+        "pages": pages,
+        "chars": chars,
+        "seconds": round(elapsed, 2),
+        "pages_per_second": round(pages / elapsed, 2) if elapsed else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "peak_child_rss_mb": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1)
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("corpus", help="directory of image-only PDFs")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--early-stop", type=int, default=0,
+                        help="stop OCR after this many characters (0 = off)")
+    parser.add_argument("--modes", default="legacy,streaming")
+    parser.add_argument("--cache", action="store_true",
+                        help="keep the parse cache on (measures warm reads)")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.corpus, "*.pdf")))
+    if not paths:
+        raise SystemExit(f"No PDFs found in {args.corpus}")
+
+    ctx = multiprocessing.get_context("spawn")
+
+    for mode in args.modes.split(","):
+        out = ctx.Queue()
+        proc = ctx.Process(
+            target=_run_mode,
+            args=(mode, paths, args.workers, args.early_stop, args.cache, out)
+        )
+        proc.start()
+        result = out.get()
+        proc.join()
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Calls-per-resume benchmark for AIService.analyze_resume.
+
+generate_completion is replaced by a counting stub with a fixed latency,
+so no tokens are spent; only the number and kind of LLM round-trips is
+measured, for the separate-call and combined extraction modes.
+
+    python -m backend.benchmarks.screening_calls --latency 0.5
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+
+from backend.config import config
+from backend.services.ai_service import AIService
+from backend.services.resume_parser import ResumeParser
+
+
+VACANCY = {
+    "job_role": "Backend Engineer",
+    "experience_level": "Mid Level",
+    "required_skills": ["Python", "FastAPI", "PostgreSQL"],
+    "culture_traits": ["Ownership"],
+    "description": "Build and run APIs."
+}
+
+BODY = """
+Experience
+Backend Engineer, Acme Corp (2021 - 2024)
+- Built FastAPI services on PostgreSQL
+Skills: Python, FastAPI, PostgreSQL, Docker
+"""
+
+CORPUS = {
+    "clean": "Priya Nair\npriya.nair@gmail.com | +91 98765 43210\n" + BODY,
+    "ocr_split_email": "Rahul Verma\nrahul verma 97@gmail.com\n" + BODY,
+    "no_header_name": "CURRICULUM VITAE\nEmail: anita.k@outlook.com\nMs. ANITA K\n" + BODY,
+    "both_broken": "RESUME\nPhone 98765 43210\nanita k 01 @ yahoo.com\n" + BODY,
+}
+
+
+class CountingStub:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = Counter()
+
+    def __call__(self, prompt: str, max_tokens: int = 1500) -> str:
+        time.sleep(self.latency)
+
+        if "email correction engine" in prompt:
+            self.calls["email_repair"] += 1
+            return "rahul.verma97@gmail.com"
+
+        if "FULL NAME" in prompt:
+            self.calls["name"] += 1
+            return "Anita Kumar"
+
+        self.calls["scoring"] += 1
+        data = {
+            "screening_score": 91,
+            "extracted_skills": ["Python", "FastAPI"],
+            "experience_years": 3,
+            "screening_notes": "Strong match"
+        }
+        if '"candidate_email"' in prompt:
+            data["candidate_email"] = "rahul.verma97@gmail.com"
+        if '"candidate_name"' in prompt:
+            data["candidate_name"] = "Anita Kumar"
+        return json.dumps(data)
+
+
+def run(combined: bool, latency: float):
+    config.SCREENING_COMBINED_EXTRACTION = combined
+    config.SCREENING_CACHE_ENABLED = False
+
+    service = AIService()
+    stub = CountingStub(latency)
+    service.generate_completion = stub
+
+    started = time.perf_counter()
+
+    for raw in CORPUS.values():
+        # Same starting point as create_candidate
+        text = ResumeParser._normalize_email_context(raw)
+        info = ResumeParser.extract_basic_info(text)
+        service.analyze_resume(
+            text, VACANCY, info.get("email"), info.get("name") or "Candidate"
+        )
+
+    elapsed = time.perf_counter() - started
+    total = sum(stub.calls.values())
+
+    return {
+        "mode": "combined" if combined else "separate",
+        "calls_per_resume": round(total / len(CORPUS), 2),
+        "calls": dict(stub.calls),
+        "seconds_per_resume": round(elapsed / len(CORPUS), 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.5,
+                        help="simulated seconds per LLM call")
+    args = parser.parse_args()
+
+    original = (config.SCREENING_COMBINED_EXTRACTION, config.SCREENING_CACHE_ENABLED)
+    try:
+        for combined in (False, True):
+            print(json.dumps(run(combined, args.latency)))
+    finally:
+        config.SCREENING_COMBINED_EXTRACTION, config.SCREENING_CACHE_ENABLED = original
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,145 @@
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-class Config:
-    SUPABASE_URL = os.getenv("SUPABASE_URL")
-    SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
-    SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
-
-    SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
-    SENDGRID_FROM_EMAIL = os.getenv("SENDGRID_FROM_EMAIL")
-    SENDGRID_FROM_NAME = os.getenv("SENDGRID_FROM_NAME", "Futuready HR")
-
-    GOOGLE_SHEETS_CREDENTIALS = os.getenv("GOOGLE_SHEETS_CREDENTIALS")
-    GOOGLE_FORM_SHEET_ID = os.getenv("GOOGLE_FORM_SHEET_ID")
-
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-
-    AI_PROVIDER = os.getenv("AI_PROVIDER", "openai")
-    AI_MODEL = os.getenv("AI_MODEL", "gpt-4-turbo-preview")
-
-    FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:8501")
-    GOOGLE_FORM_URL = os.getenv("GOOGLE_FORM_URL")
-    CALENDLY_LINK = os.getenv("CALENDLY_LINK")
-    INTERVIEW_UI_URL = "https://ai-screening-six.vercel.app/index.html"
-
-
-config = Config()
-
-
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class Config:
+    SUPABASE_URL = os.getenv("SUPABASE_URL")
+    SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
+    SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
+
+    SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
+    SENDGRID_FROM_EMAIL = os.getenv("SENDGRID_FROM_EMAIL")
+    SENDGRID_FROM_NAME = os.getenv("SENDGRID_FROM_NAME", "Futuready HR")
+
+    GOOGLE_SHEETS_CREDENTIALS = os.getenv("GOOGLE_SHEETS_CREDENTIALS")
+    GOOGLE_FORM_SHEET_ID = os.getenv("GOOGLE_FORM_SHEET_ID")
+
+    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+
+    AI_PROVIDER = os.getenv("AI_PROVIDER", "openai")
+    AI_MODEL = os.getenv("AI_MODEL", "gpt-4-turbo-preview")
+    ANTHROPIC_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
+
+    # LLM providers in use (openai, anthropic, stub); AI_PROVIDER is preferred until
+    # latency samples say otherwise. Hedged priorities fire a second provider after
+    # the first one's p95 latency (at least LLM_HEDGE_MIN_DELAY_SECONDS).
+    LLM_PROVIDERS = os.getenv("LLM_PROVIDERS", AI_PROVIDER)
+    LLM_HEDGE_PRIORITIES = os.getenv("LLM_HEDGE_PRIORITIES", "interactive")
+    LLM_HEDGE_MIN_DELAY_SECONDS = float(os.getenv("LLM_HEDGE_MIN_DELAY_SECONDS", "1"))
+    LLM_ROUTING_MIN_SAMPLES = int(os.getenv("LLM_ROUTING_MIN_SAMPLES", "20"))
+
+    # Identical prompts in flight at the same time share one upstream call
+    LLM_COALESCE_ENABLED = os.getenv("LLM_COALESCE_ENABLED", "true").lower() == "true"
+
+    # Shared async LLM client: pooled HTTP connections and per-call timeout
+    LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+    LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+
+    # Priority dispatch: calls admitted at once (interactive before batch), and
+    # how long a batch call waits before it outranks new interactive calls
+    LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "32"))
+    LLM_PRIORITY_AGING_SECONDS = float(os.getenv("LLM_PRIORITY_AGING_SECONDS", "30"))
+
+    # Retries of transient LLM failures (timeouts, 429, 5xx): attempts, backoff
+    # bounds, and the overall deadline after which no retry is started
+    LLM_RETRY_MAX_ATTEMPTS = int(os.getenv("LLM_RETRY_MAX_ATTEMPTS", "4"))
+    LLM_RETRY_BASE_DELAY_SECONDS = float(os.getenv("LLM_RETRY_BASE_DELAY_SECONDS", "1"))
+    LLM_RETRY_MAX_DELAY_SECONDS = float(os.getenv("LLM_RETRY_MAX_DELAY_SECONDS", "20"))
+    LLM_RETRY_DEADLINE_SECONDS = float(os.getenv("LLM_RETRY_DEADLINE_SECONDS", "120"))
+
+    # Circuit breaker: consecutive provider failures before failing fast,
+    # seconds before a trial call, and trial calls allowed while half-open
+    LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+    LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+    LLM_BREAKER_HALF_OPEN_CALLS = int(os.getenv("LLM_BREAKER_HALF_OPEN_CALLS", "1"))
+
+    # Provider budgets shared by all workers on this host (0 = unlimited);
+    # tokens are estimated from the prompt plus this many completion tokens
+    LLM_RATE_LIMIT_RPM = int(os.getenv("LLM_RATE_LIMIT_RPM", "500"))
+    LLM_RATE_LIMIT_TPM = int(os.getenv("LLM_RATE_LIMIT_TPM", "200000"))
+    LLM_RATE_LIMIT_COMPLETION_TOKENS = int(os.getenv("LLM_RATE_LIMIT_COMPLETION_TOKENS", "1000"))
+
+    # One LLM call per resume: email/name extraction folded into the scoring prompt
+    SCREENING_COMBINED_EXTRACTION = os.getenv("SCREENING_COMBINED_EXTRACTION", "true").lower() == "true"
+
+    # Batch screening: total worker threads, and max in-flight LLM calls per provider
+    SCREENING_BATCH_WORKERS = int(os.getenv("SCREENING_BATCH_WORKERS", "8"))
+    AI_PROVIDER_MAX_CONCURRENCY = int(os.getenv("AI_PROVIDER_MAX_CONCURRENCY", "4"))
+
+    # Local SQLite state (jobs, caches) shared by all workers on this host
+    STATE_DIR = os.getenv("STATE_DIR", "data")
+    SCREENING_JOB_STALE_SECONDS = int(os.getenv("SCREENING_JOB_STALE_SECONDS", "60"))
+
+    # Resume parsing (PyPDF2 / OCR) process pool
+    RESUME_PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", "2"))
+    RESUME_PARSE_MAX_QUEUE = int(os.getenv("RESUME_PARSE_MAX_QUEUE", "16"))
+    RESUME_PARSE_TIMEOUT_SECONDS = float(os.getenv("RESUME_PARSE_TIMEOUT_SECONDS", "180"))
+
+    # OCR fallback: pages OCRed in parallel per resume, render DPI,
+    # and stop once this many characters were recovered (0 = OCR every page)
+    OCR_PAGE_WORKERS = int(os.getenv("OCR_PAGE_WORKERS", "2"))
+    OCR_DPI = int(os.getenv("OCR_DPI", "300"))
+    OCR_EARLY_STOP_CHARS = int(os.getenv("OCR_EARLY_STOP_CHARS", "0"))
+
+    # OCR engine: auto | tesserocr (pooled, needs `pip install tesserocr`) | pytesseract
+    OCR_ENGINE = os.getenv("OCR_ENGINE", "auto")
+    OCR_ENGINE_POOL_SIZE = int(os.getenv("OCR_ENGINE_POOL_SIZE", os.getenv("OCR_PAGE_WORKERS", "2")))
+    OCR_ENGINE_ACQUIRE_TIMEOUT = float(os.getenv("OCR_ENGINE_ACQUIRE_TIMEOUT", "60"))
+    OCR_LANG = os.getenv("OCR_LANG", "eng")
+
+    # Page image preprocessing before OCR: fast | accurate (adds deskew) | off
+    OCR_PARSE_MODE = os.getenv("OCR_PARSE_MODE", "accurate")
+
+    # Per-page OCR decision: pages with less text-layer text than this are OCRed
+    # (image pages get the higher threshold so a text footer does not hide them)
+    OCR_TEXT_PAGE_MIN_CHARS = int(os.getenv("OCR_TEXT_PAGE_MIN_CHARS", "50"))
+    OCR_IMAGE_PAGE_MIN_CHARS = int(os.getenv("OCR_IMAGE_PAGE_MIN_CHARS", "300"))
+
+    # Parsed resume / OCR page cache (keyed by SHA-256 of the uploaded file)
+    PARSE_CACHE_ENABLED = os.getenv("PARSE_CACHE_ENABLED", "true").lower() == "true"
+    PARSE_CACHE_MAX_BYTES = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+
+    # Screening result cache (keyed by resume + vacancy + model + prompt version)
+    SCREENING_CACHE_ENABLED = os.getenv("SCREENING_CACHE_ENABLED", "true").lower() == "true"
+    SCREENING_CACHE_TTL_SECONDS = int(os.getenv("SCREENING_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    SCREENING_CACHE_MAX_ENTRIES = int(os.getenv("SCREENING_CACHE_MAX_ENTRIES", "5000"))
+
+    # Interview prompt budget: resume profile, earlier-turn notes + recent
+    # questions, and how many of the latest questions are kept verbatim
+    INTERVIEW_PROFILE_TOKENS = int(os.getenv("INTERVIEW_PROFILE_TOKENS", "600"))
+    INTERVIEW_HISTORY_TOKENS = int(os.getenv("INTERVIEW_HISTORY_TOKENS", "700"))
+    INTERVIEW_RECENT_TURNS = int(os.getenv("INTERVIEW_RECENT_TURNS", "3"))
+
+    # Interview question plan generated at validate time: questions per topic,
+    # and answers shorter than this many words get an adapted follow-up
+    INTERVIEW_PLAN_ENABLED = os.getenv("INTERVIEW_PLAN_ENABLED", "true").lower() == "true"
+    INTERVIEW_PLAN_QUESTIONS_PER_TOPIC = int(os.getenv("INTERVIEW_PLAN_QUESTIONS_PER_TOPIC", "3"))
+    INTERVIEW_PLAN_FOLLOW_UP_TIMEOUT_SECONDS = float(os.getenv("INTERVIEW_PLAN_FOLLOW_UP_TIMEOUT_SECONDS", "8"))
+    INTERVIEW_PLAN_WEAK_ANSWER_WORDS = int(os.getenv("INTERVIEW_PLAN_WEAK_ANSWER_WORDS", "12"))
+
+    # Durable background jobs (local SQLite queue): worker threads and queues
+    # of this process (0 threads = enqueue only, run `python -m backend.worker`),
+    # lease per attempt, attempts before a job is dead-lettered, backoff
+    JOB_WORKER_THREADS = int(os.getenv("JOB_WORKER_THREADS", "4"))
+    JOB_WORKER_QUEUES = [q.strip() for q in os.getenv("JOB_WORKER_QUEUES", "").split(",") if q.strip()]
+    JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "120"))
+    JOB_POLL_SECONDS = float(os.getenv("JOB_POLL_SECONDS", "1"))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+    JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "5"))
+    JOB_RETRY_MAX_SECONDS = float(os.getenv("JOB_RETRY_MAX_SECONDS", "300"))
+    JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+
+    # Screenings of new candidates running at once per worker process
+    SCREENING_QUEUE_CONCURRENCY = int(os.getenv("SCREENING_QUEUE_CONCURRENCY", "2"))
+
+    FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:8501")
+    GOOGLE_FORM_URL = os.getenv("GOOGLE_FORM_URL")
+    CALENDLY_LINK = os.getenv("CALENDLY_LINK")
+    INTERVIEW_UI_URL = "https://ai-screening-six.vercel.app/index.html"
+
+
+config = Config()
+
+
@@ -0,0 +1,392 @@
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from postgrest.types import ReturnMethod
+
+from backend.database import supabase
+from backend.services.metrics import metrics
+
+
+# =====================================================
+# COLUMN SETS
+# =====================================================
+# Every query names its columns: a status check must not pull resume_text
+# (or an interview transcript) over the wire.
+
+VACANCY_COLUMNS = (
+    "id, job_role, required_skills, experience_level, culture_traits, description, "
+    "status, created_by, external_job_id, created_at, updated_at"
+)
+
+# What screening and interview prompts read from a vacancy
+VACANCY_PROMPT = "id, job_role, required_skills, experience_level, culture_traits, description"
+
+CANDIDATE_SUMMARY = (
+    "id, vacancy_id, name, email, phone, status, skills, experience_years, "
+    "screening_score, screening_notes, resume_url, created_at, updated_at"
+)
+CANDIDATE_DETAIL = CANDIDATE_SUMMARY + ", resume_text"
+
+# What screening and interview prompts read from a candidate
+CANDIDATE_PROFILE = "id, vacancy_id, name, email, status, resume_text"
+
+SESSION_COLUMNS = (
+    "id, candidate_id, interview_token, scheduled_at, expires_at, started_at, "
+    "is_active, question_count, transcript, updated_at"
+)
+
+INTERVIEW_SCORES = (
+    "id, candidate_id, vacancy_id, skill_score, communication_score, problem_solving_score, "
+    "culture_fit_score, overall_score, recommendation, evaluation_notes, started_at, completed_at"
+)
+INTERVIEW_DETAIL = INTERVIEW_SCORES + ", interview_transcript"
+
+FORM_COLUMNS = (
+    "id, candidate_id, first_name, last_name, gender, age, email, phone, address, city, state, "
+    "years_of_experience, current_ctc, expected_ctc, notice_period, portfolio_link, created_at"
+)
+
+FINAL_INTERVIEW_ROW = (
+    "id, candidate_id, vacancy_id, scheduled_date, location, interviewer_names, meeting_link, "
+    "notes, status, created_at"
+)
+FINAL_INTERVIEW_COLUMNS = (
+    FINAL_INTERVIEW_ROW + ", "
+    "candidates(id, name, email, phone, status), vacancies(id, job_role, external_job_id)"
+)
+
+# Ids per `in.(...)` filter, to keep request URLs well under proxy limits
+IN_CHUNK = 100
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _chunks(ids: Iterable[str]) -> Iterable[List[str]]:
+    ids = list(dict.fromkeys(ids))
+    for i in range(0, len(ids), IN_CHUNK):
+        yield ids[i:i + IN_CHUNK]
+
+
+def _returning(builder, columns: str):
+    # PostgREST returns the full row after a write unless told otherwise
+    builder.params = builder.params.add("select", columns)
+    return builder
+
+
+class Table:
+    """
+    Named queries on one Supabase table. Each query is recorded on
+    /metrics under its name: db.query_seconds, db.rows and db.bytes
+    (size of the returned JSON), plus db.errors.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def table(self):
+        return supabase.table(self.name)
+
+    def run(self, query: str, builder) -> Any:
+        name = f"{self.name}.{query}"
+        started = time.perf_counter()
+
+        try:
+            data = builder.execute().data
+        except Exception:
+            metrics.incr("db.errors", query=name)
+            raise
+        finally:
+            metrics.observe("db.query_seconds", time.perf_counter() - started, query=name)
+
+        rows = len(data) if isinstance(data, list) else int(bool(data))
+        metrics.incr("db.rows", rows, query=name)
+        metrics.incr("db.bytes", len(json.dumps(data, default=str)) if data else 0, query=name)
+
+        return data
+
+    def first(self, query: str, builder) -> Dict[str, Any] | None:
+        rows = self.run(query, builder.limit(1))
+        return rows[0] if rows else None
+
+    def insert(self, query: str, row: Dict[str, Any] | List[Dict[str, Any]], columns: str | None = None):
+        if columns:
+            return self.run(query, _returning(self.table().insert(row), columns))
+
+        self.run(query, self.table().insert(row, returning=ReturnMethod.minimal))
+
+
+# =====================================================
+# VACANCIES
+# =====================================================
+class VacancyRepository(Table):
+    def __init__(self):
+        super().__init__("vacancies")
+
+    def create(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        return self.insert("create", fields, VACANCY_COLUMNS)[0]
+
+    def list(self, status: str | None = None) -> List[Dict[str, Any]]:
+        query = self.table().select(VACANCY_COLUMNS).order("created_at", desc=True)
+
+        if status:
+            query = query.eq("status", status)
+
+        return self.run("list", query)
+
+    def get(self, vacancy_id: str, columns: str = VACANCY_COLUMNS) -> Dict[str, Any] | None:
+        return self.first("get", self.table().select(columns).eq("id", vacancy_id))
+
+    def id_for_external_job(self, external_job_id: str) -> str | None:
+        row = self.first(
+            "id_for_external_job",
+            self.table().select("id").eq("external_job_id", external_job_id)
+        )
+        return row["id"] if row else None
+
+
+# =====================================================
+# CANDIDATES
+# =====================================================
+class CandidateRepository(Table):
+    def __init__(self):
+        super().__init__("candidates")
+
+    def create(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        return self.insert("create", fields, CANDIDATE_DETAIL)[0]
+
+    def exists_for_vacancy(self, vacancy_id: str, email: str) -> bool:
+        return self.first(
+            "exists_for_vacancy",
+            self.table().select("id").eq("vacancy_id", vacancy_id).eq("email", email)
+        ) is not None
+
+    def list(self, vacancy_id: str | None = None, status: str | None = None) -> List[Dict[str, Any]]:
+        query = self.table().select(CANDIDATE_SUMMARY).order("created_at", desc=True)
+
+        if vacancy_id:
+            query = query.eq("vacancy_id", vacancy_id)
+        if status:
+            query = query.eq("status", status)
+
+        return self.run("list", query)
+
+    def get(self, candidate_id: str, columns: str = CANDIDATE_SUMMARY) -> Dict[str, Any] | None:
+        return self.first("get", self.table().select(columns).eq("id", candidate_id))
+
+    def get_with_vacancy(self, candidate_id: str) -> tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+        """
+        The candidate's profile and its vacancy's prompt fields in one
+        round-trip.
+        """
+
+        candidate = self.first(
+            "get_with_vacancy",
+            self.table()
+            .select(f"{CANDIDATE_PROFILE}, vacancies({VACANCY_PROMPT})")
+            .eq("id", candidate_id)
+        )
+
+        if not candidate:
+            return None, None
+
+        return candidate, candidate.pop("vacancies", None)
+
+    def get_many(self, candidate_ids: Iterable[str], columns: str = CANDIDATE_SUMMARY) -> List[Dict[str, Any]]:
+        rows = []
+        for chunk in _chunks(candidate_ids):
+            rows.extend(self.run("get_many", self.table().select(columns).in_("id", chunk)))
+        return rows
+
+    def find_by_email(self, email: str, columns: str = "id, status, name") -> Dict[str, Any] | None:
+        return self.first("find_by_email", self.table().select(columns).eq("email", email))
+
+    def ids_with_status(self, vacancy_id: str, status: str) -> List[str]:
+        rows = self.run(
+            "ids_with_status",
+            self.table().select("id").eq("vacancy_id", vacancy_id).eq("status", status)
+        )
+        return [row["id"] for row in rows]
+
+    def statuses_for_vacancy(self, vacancy_id: str) -> List[str]:
+        rows = self.run("statuses_for_vacancy", self.table().select("status").eq("vacancy_id", vacancy_id))
+        return [row["status"] for row in rows]
+
+    def update(
+        self,
+        candidate_id: str,
+        fields: Dict[str, Any],
+        returning: str | None = None
+    ) -> Dict[str, Any] | None:
+        fields = {**fields, "updated_at": _now()}
+
+        if returning:
+            rows = self.run(
+                "update",
+                _returning(self.table().update(fields).eq("id", candidate_id), returning)
+            )
+            return rows[0] if rows else None
+
+        self.run(
+            "update",
+            self.table().update(fields, returning=ReturnMethod.minimal).eq("id", candidate_id)
+        )
+        return None
+
+    def set_status(self, candidate_id: str, status: str, returning: str | None = None) -> Dict[str, Any] | None:
+        return self.update(candidate_id, {"status": status}, returning)
+
+    def update_many(self, candidate_ids: Iterable[str], fields: Dict[str, Any]):
+        fields = {**fields, "updated_at": _now()}
+
+        for chunk in _chunks(candidate_ids):
+            self.run(
+                "update_many",
+                self.table().update(fields, returning=ReturnMethod.minimal).in_("id", chunk)
+            )
+
+
+# =====================================================
+# AI INTERVIEW SESSIONS
+# =====================================================
+class InterviewSessionRepository(Table):
+    def __init__(self):
+        super().__init__("ai_interview_sessions")
+
+    def active_by_token(self, token: str) -> Dict[str, Any] | None:
+        return self.first(
+            "active_by_token",
+            self.table().select(SESSION_COLUMNS).eq("interview_token", token).eq("is_active", True)
+        )
+
+    def active_for_candidate(self, candidate_id: str) -> Dict[str, Any] | None:
+        return self.first(
+            "active_for_candidate",
+            self.table().select(SESSION_COLUMNS).eq("candidate_id", candidate_id).eq("is_active", True)
+        )
+
+    def for_candidate(self, candidate_id: str) -> Dict[str, Any] | None:
+        return self.first(
+            "for_candidate",
+            self.table().select(SESSION_COLUMNS).eq("candidate_id", candidate_id)
+        )
+
+    def update(self, session_id: str, fields: Dict[str, Any]):
+        self.run(
+            "update",
+            self.table().update(fields, returning=ReturnMethod.minimal).eq("id", session_id)
+        )
+
+    def update_for_candidate(self, candidate_id: str, fields: Dict[str, Any]):
+        self.run(
+            "update_for_candidate",
+            self.table().update(
+                {**fields, "updated_at": _now()},
+                returning=ReturnMethod.minimal
+            ).eq("candidate_id", candidate_id)
+        )
+
+    def schedule(self, row: Dict[str, Any]):
+        self.run(
+            "schedule",
+            self.table().upsert(
+                {**row, "updated_at": _now()},
+                on_conflict="candidate_id",
+                returning=ReturnMethod.minimal
+            )
+        )
+
+
+# =====================================================
+# AI INTERVIEWS (EVALUATIONS)
+# =====================================================
+class InterviewRepository(Table):
+    def __init__(self):
+        super().__init__("ai_interviews")
+
+    def create(self, row: Dict[str, Any]):
+        self.insert("create", row)
+
+    def for_candidate(self, candidate_id: str, columns: str = INTERVIEW_DETAIL) -> Dict[str, Any] | None:
+        return self.first("for_candidate", self.table().select(columns).eq("candidate_id", candidate_id))
+
+    def for_candidates(self, candidate_ids: Iterable[str], columns: str = INTERVIEW_SCORES) -> List[Dict[str, Any]]:
+        rows = []
+        for chunk in _chunks(candidate_ids):
+            rows.extend(self.run("for_candidates", self.table().select(columns).in_("candidate_id", chunk)))
+        return rows
+
+    def recommendations_for_vacancy(self, vacancy_id: str) -> List[str]:
+        rows = self.run(
+            "recommendations_for_vacancy",
+            self.table().select("recommendation").eq("vacancy_id", vacancy_id)
+        )
+        return [row["recommendation"] for row in rows]
+
+
+# =====================================================
+# CANDIDATE FORMS
+# =====================================================
+class CandidateFormRepository(Table):
+    def __init__(self):
+        super().__init__("candidate_forms")
+
+    def create(self, row: Dict[str, Any]):
+        self.insert("create", row)
+
+    def list(self) -> List[Dict[str, Any]]:
+        return self.run("list", self.table().select(FORM_COLUMNS).order("created_at", desc=True))
+
+    def for_candidate(self, candidate_id: str, columns: str = FORM_COLUMNS) -> Dict[str, Any] | None:
+        return self.first("for_candidate", self.table().select(columns).eq("candidate_id", candidate_id))
+
+    def save_for_candidate(self, candidate_id: str, row: Dict[str, Any]):
+        if self.for_candidate(candidate_id, columns="id"):
+            self.run(
+                "update_for_candidate",
+                self.table().update(row, returning=ReturnMethod.minimal).eq("candidate_id", candidate_id)
+            )
+        else:
+            self.create(row)
+
+
+# =====================================================
+# FINAL INTERVIEWS
+# =====================================================
+class FinalInterviewRepository(Table):
+    def __init__(self):
+        super().__init__("final_interviews")
+
+    def create(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return self.insert("create", row, FINAL_INTERVIEW_ROW)[0]
+
+    def list(self, vacancy_id: str | None = None) -> List[Dict[str, Any]]:
+        query = self.table().select(FINAL_INTERVIEW_COLUMNS).order("scheduled_date", desc=False)
+
+        if vacancy_id:
+            query = query.eq("vacancy_id", vacancy_id)
+
+        return self.run("list", query)
+
+
+# =====================================================
+# EMAIL LOGS
+# =====================================================
+class EmailLogRepository(Table):
+    def __init__(self):
+        super().__init__("email_logs")
+
+    def create(self, row: Dict[str, Any]):
+        self.insert("create", row)
+
+
+vacancy_repo = VacancyRepository()
+candidate_repo = CandidateRepository()
+session_repo = InterviewSessionRepository()
+interview_repo = InterviewRepository()
+form_repo = CandidateFormRepository()
+final_interview_repo = FinalInterviewRepository()
+email_log_repo = EmailLogRepository()
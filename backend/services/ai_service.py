@@ -1,588 +1,769 @@
-import json
-from typing import Dict, List, Any
-from datetime import datetime
-import re
-from backend.config import config
-from backend.database import supabase
-from backend.services.email_service import email_service
-
-
-from openai import OpenAI
-
-
-class AIService:
-    def __init__(self):
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
-        self.model = config.AI_MODEL  # gpt-5-mini
-
-    # ================================
-    # 🔥 SAFE COMPLETION (RENDER SAFE)
-    # ================================
-    def generate_completion(self, prompt: str, max_tokens: int = 1500) -> str:
-        if not self.client:
-            raise RuntimeError("AI client not configured")
-
-        try:
-        # GPT-5 / GPT-5-mini compatible
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-
-            text = response.choices[0].message.content
-
-            if not text or not text.strip():
-                raise RuntimeError("Empty response from AI")
-
-            return text.strip()
-
-        except Exception as e:
-            print("❌ OPENAI ERROR:", e)
-            raise
-
-
-
-    def extract_email_regex(self, text: str) -> str | None:
-        if not text:
-            return None
-
-        matches = re.findall(
-            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-            text
-        )
-
-        for email in matches:
-            local = email.split("@")[0]
-        
-            if any(c.isalpha() for c in local):
-                return email
-
-        return None
-
-
-
-
-
-    def extract_email_ai(self, resume_text: str) -> str | None:
-        """
-        Uses AI ONLY if regex-style email is missing.
-        Returns verified email or None.
-        """
-
-        if not resume_text or len(resume_text.strip()) < 30:
-             return None
-
-        
-
-        prompt = f"""
-You are an automated resume parsing system used by enterprise ATS platforms.
-
-Your task is to extract the candidate’s EMAIL ADDRESS from the resume text.
-
-━━━━━━━━━━━━━━━━━━━━━━
-STRICT EXTRACTION RULES
-━━━━━━━━━━━━━━━━━━━━━━
-
-1. Extract ONLY an email address that is explicitly present in the resume text.
-2. If the email is obfuscated, normalize it:
-   - Examples:
-     - "name at gmail dot com" → name@gmail.com
-     - "name [at] domain [dot] com" → name@domain.com
-3. Do NOT infer, guess, modify, shorten, or reconstruct an email.
-4. Do NOT generate an email from the candidate’s name.
-5. If multiple emails are present, return the most complete and professional-looking one.
-6. If no valid email is clearly found, return EXACTLY:
-   NONE
-
-━━━━━━━━━━━━━━━━━━━━━━
-OUTPUT RULES (CRITICAL)
-━━━━━━━━━━━━━━━━━━━━━━
-
-- Return ONLY the email address or the word NONE
-- No explanations
-- No extra text
-- No punctuation
-- No formatting
-
-━━━━━━━━━━━━━━━━━━━━━━
-RESUME TEXT
-━━━━━━━━━━━━━━━━━━━━━━
-
-{resume_text}
-
-        """
-
-        try:
-            response = self.generate_completion(prompt).strip()
-
-            if response.lower() == "none":
-                return None
-
-        # 🔐 Final regex validation (critical)
-            match = re.search(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", response)
-            return match.group(0) if match else None
-
-        except Exception as e:
-            print("❌ AI email extraction failed:", e)
-            return None
-
-
-
-    def repair_email_ai(self, resume_text: str, extracted_email: str | None) -> str | None:
-
-        prompt = f"""
-You are a production-grade ATS email correction engine.
-
-TASK:
-You are given resume text and a possibly incorrect email.
-Your job is to return the CORRECT candidate email IF AND ONLY IF it is
-explicitly present in the resume text but broken due to spacing or OCR.
-
-ALLOWED OPERATIONS:
-- Join split username parts (letters + digits)
-- Join numeric fragments with username
-- Remove spaces between username fragments
-- Fix line breaks inside an email
-
-FORBIDDEN:
-- Do NOT invent a new email
-- Do NOT change domain
-- Do NOT guess usernames
-- Do NOT modify letters order
-- Do NOT create email if not present
-
-RULE:
-If the correct email cannot be reconstructed with certainty,
-return EXACTLY:
-NONE
-
-OUTPUT:
-Return ONLY the email or NONE.
-
-RESUME TEXT:
-{resume_text}
-
-CURRENT EMAIL:
-{extracted_email or "NONE"}
-        """
-
-        try:
-            response = self.generate_completion(prompt).strip()
-
-            if response.lower() == "none":
-                return None
-
-        
-            if re.match(
-                r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-                response
-            ):
-                return response
-
-            return None
-
-        except Exception as e:
-            print("❌ AI email repair failed:", e)
-            return None
-
-    def extract_email(self, resume_text: str) -> str | None:
-        if not resume_text:
-            return None
-
-        regex_matches = re.findall(
-            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-            resume_text
-        )
-
-        regex_email = regex_matches[0] if regex_matches else None
-
-        repaired_email = self.repair_email_ai(resume_text, regex_email)
-
-        if repaired_email:
-            return repaired_email
-
-        if regex_email:
-            local = regex_email.split("@")[0]
-            if not local.isdigit():
-                return regex_email
-
-        return None
-
-
-
-
-
-
-    def extract_name_regex(self, text: str) -> str | None:
-        if not text:
-            return None
-
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-        top_lines = lines[:5]  # names almost always appear here
-
-        for line in top_lines:
-            if any(x in line.lower() for x in [
-                "resume", "curriculum", "cv", "email", "@", "phone",
-                "linkedin", "github", "profile"
-            ]):
-                continue
-
-            if re.match(r"^[A-Za-z]+(?:\s[A-Za-z]+){1,3}$", line):
-                return line
-
-        return None
-
-
-    def extract_name_ai(self, resume_text: str) -> str | None:
-
-        if not resume_text or len(resume_text.strip()) < 30:
-            return None
-
-        prompt = f"""
-You are an automated resume parsing system used by enterprise ATS platforms.
-
-Your task is to extract the candidate’s FULL NAME from the resume text.
-
-━━━━━━━━━━━━━━━━━━━━━━
-STRICT EXTRACTION RULES
-━━━━━━━━━━━━━━━━━━━━━━
-1. Extract ONLY the candidate's name explicitly written in the resume.
-2. The name is usually at the top of the resume.
-3. Do NOT infer or guess a name.
-4. Do NOT extract usernames, emails, or profile handles.
-5. Do NOT include titles (Mr, Ms, Dr, Eng, etc).
-6. Do NOT include extra words or formatting.
-7. If multiple names exist, return the most prominent candidate name.
-8. If no clear candidate name is found, return EXACTLY:
-NONE
-
-━━━━━━━━━━━━━━━━━━━━━━
-OUTPUT RULES (CRITICAL)
-━━━━━━━━━━━━━━━━━━━━━━
-- Return ONLY the full name or NONE
-- No explanations
-- No punctuation
-- No formatting
-
-━━━━━━━━━━━━━━━━━━━━━━
-RESUME TEXT
-━━━━━━━━━━━━━━━━━━━━━━
-{resume_text}
-    """
-
-        try:
-            response = self.generate_completion(prompt).strip()
-
-            if response.lower() == "none":
-                return None
-           
-            clean = response.strip()
-            if any(x in clean.lower() for x in [
-                "engineer", "developer", "resume", "cv",
-                "linkedin", "github", "@", "|"
-            ]):
-                return None
-
-            if re.match(r"^[A-Za-z]+(?:\s[A-Za-z]+){1,3}$", clean):
-                return clean.title()
-
-            return None
-
-
-        except Exception as e:
-            print("❌ AI name extraction failed:", e)
-            return None
-
-    
-    def extract_name(self, resume_text: str) -> str | None:
-        name = self.extract_name_regex(resume_text)
-        if name:
-            return name
-        return self.extract_name_ai(resume_text)
-
-
-
-
-    def is_valid_email_context(self, text: str, email: str) -> bool:
-
-        if not text or not email:
-            return False
-
-        for match in re.finditer(re.escape(email), text):
-            start, end = match.start(), match.end()
-
-            before = text[start - 1] if start > 0 else " "
-            after = text[end] if end < len(text) else " "
-
-            if before.isalnum() or after.isalnum():
-                return False
-
-            local = email.split("@")[0]
-            if local.isdigit():
-                return False
-
-            return True
-
-        return False
-
-
-    def is_corrupted_email(self, resume_text: str, email: str) -> bool:
-        return not self.is_valid_email_context(resume_text, email)
-
-    # ================================
-    # 🧠 RESUME SCREENING (FIXED)
-    # ================================
-    def screen_resume(self, candidate_id: str, vacancy_id: str) -> Dict[str, Any]:
-        print("🔥 SCREENING STARTED:", candidate_id)
-
-        candidate = (
-            supabase.table("candidates")
-            .select("*")
-            .eq("id", candidate_id)
-            .single()
-            .execute()
-        )
-        vacancy = (
-            supabase.table("vacancies")
-            .select("*")
-            .eq("id", vacancy_id)
-            .single()
-            .execute()
-        )
-
-        candidate_data = candidate.data
-        vacancy_data = vacancy.data
-        
-
-
-        resume_text = candidate_data.get("resume_text", "")
-        current_email = candidate_data.get("email", "")
-
-        extracted_email = self.extract_email(resume_text)
-
-
-        if extracted_email and (
-            not current_email
-            or self.is_corrupted_email(resume_text, current_email)
-        ):
-            print("✅ Correcting candidate email:", extracted_email)
-
-            supabase.table("candidates").update({
-                "email": extracted_email,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", candidate_id).execute()
-
-            candidate_data["email"] = extracted_email
-
-
-        
-
-        PLACEHOLDER_NAMES = {"candidate", "unknown", ""}
-
-        current_name_raw = candidate_data.get("name") or ""
-        current_name = current_name_raw.strip().lower()
-
-        extracted_name = self.extract_name(resume_text)
-
-        if extracted_name and current_name in PLACEHOLDER_NAMES:
-            print("✅ Updating candidate name:", extracted_name)
-
-            supabase.table("candidates").update({
-                "name": extracted_name,
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", candidate_id).execute()
-
-            candidate_data["name"] = extracted_name
-
-
-        prompt = f"""
-  
-You are a production-grade ATS scoring engine used by modern hiring platforms.
-Your task is to evaluate resume-to-job fit realistically and FAIRLY.
-
-━━━━━━━━━━━━━━━━━━━━━━
-JOB CONTEXT
-━━━━━━━━━━━━━━━━━━━━━━
-Job Role: {vacancy_data['job_role']}
-Experience Level Target: {vacancy_data['experience_level']}
-Required Skills (primary): {', '.join(vacancy_data['required_skills'])}
-Culture Traits (low weight): {', '.join(vacancy_data['culture_traits'])}
-Job Description:
-{vacancy_data.get('description', 'N/A')}
-
-━━━━━━━━━━━━━━━━━━━━━━
-RESUME TEXT
-━━━━━━━━━━━━━━━━━━━━━━
-{candidate_data.get('resume_text', '')}
-
-━━━━━━━━━━━━━━━━━━━━━━
-EXPERIENCE CALCULATION (STRICT BUT FAIR)
-━━━━━━━━━━━━━━━━━━━━━━
-- Count ONLY professional work experience:
-  jobs, internships, freelancing, contracts
-- DO NOT count:
-  education duration, academic projects, courses, certifications
-- Experience must be supported by role + company + dates
-- If dates overlap → count once
-- Round DOWN to nearest 0.5 year
-- If no valid experience → experience_years = 0
-
-━━━━━━━━━━━━━━━━━━━━━━
-SKILL EXTRACTION RULES
-━━━━━━━━━━━━━━━━━━━━━━
-- Extract ONLY skills explicitly written in the resume
-- Do NOT infer or hallucinate
-- Do NOT penalize missing secondary or optional skills
-- Required skill match is considered GOOD if ≥70%
-
-━━━━━━━━━━━━━━━━━━━━━━
-SCORING PHILOSOPHY (VERY IMPORTANT)
-━━━━━━━━━━━━━━━━━━━━━━
-This system is calibrated so that:
-
-▶ A DECENT, RELEVANT resume SHOULD score **90+**
-▶ 90 is NOT exceptional — it is the NORMAL shortlist score
-▶ Scores below 90 should be used ONLY when there are clear gaps
-
-
-
-DO NOT deduct for:
-- Minor keyword differences
-- Non-critical skill gaps
-- Imperfect job title wording
-- Resume formatting or writing style
-
-━━━━━━━━━━━━━━━━━━━━━━
-SCORE INTERPRETATION
-━━━━━━━━━━━━━━━━━━━━━━
-- 90–100 → Strong match, shortlist-ready
-- 80–89 → Good profile, minor gaps
-- 65–79 → Partial match
-- <65 → Weak or unrelated
-
-━━━━━━━━━━━━━━━━━━━━━━
-FINAL VERIFICATION (SILENT)
-━━━━━━━━━━━━━━━━━━━━━━
-Before responding:
-- Ensure experience_years excludes education
-- Ensure extracted_skills appear verbatim in resume
-- Ensure score reflects REAL hiring behavior
-
-━━━━━━━━━━━━━━━━━━━━━━
-OUTPUT FORMAT (STRICT JSON ONLY)
-━━━━━━━━━━━━━━━━━━━━━━
-{{
-  "screening_score": 0,
-  "extracted_skills": [],
-  "experience_years": 0,
-  "screening_notes": ""
-}}
-
-
-        """
-
-
-    # ✅ CORRECT generate_completion CALL
-        response_text = self.generate_completion(prompt)
-           
-
-    # =========================
-    # SAFE JSON PARSING
-    # =========================
-        try:
-            data = json.loads(response_text)
-        except Exception:
-            start = response_text.find("{")
-            end = response_text.rfind("}") + 1
-            data = json.loads(response_text[start:end])
-
-
-
-
-
-
-
-    # =========================
-    # SAFE TYPE CASTING (CRITICAL)
-    # =========================
-        screening_score = int(float(data.get("screening_score", 0)))
-        experience_years = int(float(data.get("experience_years", 0)))
-        extracted_skills = data.get("extracted_skills", [])
-        screening_notes = str(data.get("screening_notes", ""))
-    # =========================
-    # UPDATE CANDIDATE
-    # =========================
-        supabase.table("candidates").update({
-            "screening_score": screening_score,
-            "skills": extracted_skills,
-            "experience_years": experience_years,
-            "screening_notes": screening_notes,
-            "status": "screened",
-            "updated_at": datetime.utcnow().isoformat()
-        }).eq("id", candidate_id).execute()
-
-
-    # == =======================
-    # AUTO SEND GOOGLE FORM
-    # =========================
-        if screening_score >= 85:
-            email_service.send_form_invitation(
-                candidate_id,
-                candidate_data["email"],
-                candidate_data["name"]
-            )
-
-            supabase.table("candidates").update({
-                "status": "form_sent",
-                "updated_at": datetime.utcnow().isoformat()
-            }).eq("id", candidate_id).execute()
-
-        print("✅ SCREENING COMPLETED:", candidate_id)
-        return data
-
-ai_service = AIService()
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+import json
+from typing import AsyncIterator, Dict, List, Any
+import re
+from backend.config import config
+from backend.repository import candidate_repo, vacancy_repo, CANDIDATE_PROFILE, VACANCY_PROMPT
+from backend.services.circuit_breaker import CircuitOpenError
+from backend.services.email_service import email_service
+from backend.services.llm_client import llm_client
+from backend.services.metrics import metrics
+from backend.services.screening_cache import screening_cache, vacancy_fingerprint
+
+
+class AIService:
+    def __init__(self):
+        self.model = config.AI_MODEL  # gpt-5-mini
+
+    # ================================
+    # 🔥 SAFE COMPLETION (RENDER SAFE)
+    # ================================
+    def generate_completion(
+        self,
+        prompt: str,
+        max_tokens: int = 1500,
+        timeout: float | None = None,
+        priority: str = "batch",
+        fallback: str | None = None
+    ) -> str:
+        """
+        `fallback` is returned instead of raising while the provider's
+        circuit is open.
+        """
+
+        # Blocks the calling thread only; the request runs on the shared client
+        try:
+            return llm_client.complete(
+                prompt,
+                timeout=timeout,
+                priority=priority,
+                max_tokens=max_tokens
+            )
+
+        except CircuitOpenError as e:
+            if fallback is None:
+                raise
+            print("⚠️ AI unavailable, using fallback:", e)
+            metrics.incr("llm.fallbacks")
+            return fallback
+
+        except Exception as e:
+            print("❌ OPENAI ERROR:", e)
+            raise
+
+    async def agenerate_completion(
+        self,
+        prompt: str,
+        max_tokens: int = 1500,
+        timeout: float | None = None,
+        priority: str = "interactive",
+        fallback: str | None = None
+    ) -> str:
+        try:
+            return await llm_client.acomplete(
+                prompt,
+                timeout=timeout,
+                priority=priority,
+                max_tokens=max_tokens
+            )
+
+        except CircuitOpenError as e:
+            if fallback is None:
+                raise
+            print("⚠️ AI unavailable, using fallback:", e)
+            metrics.incr("llm.fallbacks")
+            return fallback
+
+        except Exception as e:
+            print("❌ OPENAI ERROR:", e)
+            raise
+
+    async def astream_completion(
+        self,
+        prompt: str,
+        max_tokens: int = 1500,
+        timeout: float | None = None,
+        priority: str = "interactive"
+    ) -> AsyncIterator[str]:
+        """
+        Text deltas of the completion as the model produces them.
+        """
+
+        try:
+            async for delta in llm_client.astream(
+                prompt,
+                timeout=timeout,
+                priority=priority,
+                max_tokens=max_tokens
+            ):
+                yield delta
+
+        except CircuitOpenError:
+            raise
+
+        except Exception as e:
+            print("❌ OPENAI ERROR:", e)
+            raise
+
+
+
+    def extract_email_regex(self, text: str) -> str | None:
+        if not text:
+            return None
+
+        matches = re.findall(
+            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+            text
+        )
+
+        for email in matches:
+            local = email.split("@")[0]
+        
+            if any(c.isalpha() for c in local):
+                return email
+
+        return None
+
+
+
+
+
+    def extract_email_ai(self, resume_text: str) -> str | None:
+        """
+        Uses AI ONLY if regex-style email is missing.
+        Returns verified email or None.
+        """
+
+        if not resume_text or len(resume_text.strip()) < 30:
+             return None
+
+        
+
+        prompt = f"""
+You are an automated resume parsing system used by enterprise ATS platforms.
+
+Your task is to extract the candidate’s EMAIL ADDRESS from the resume text.
+
+━━━━━━━━━━━━━━━━━━━━━━
+STRICT EXTRACTION RULES
+━━━━━━━━━━━━━━━━━━━━━━
+
+1. Extract ONLY an email address that is explicitly present in the resume text.
+2. If the email is obfuscated, normalize it:
+   - Examples:
+     - "name at gmail dot com" → name@gmail.com
+     - "name [at] domain [dot] com" → name@domain.com
+3. Do NOT infer, guess, modify, shorten, or reconstruct an email.
+4. Do NOT generate an email from the candidate’s name.
+5. If multiple emails are present, return the most complete and professional-looking one.
+6. If no valid email is clearly found, return EXACTLY:
+   NONE
+
+━━━━━━━━━━━━━━━━━━━━━━
+OUTPUT RULES (CRITICAL)
+━━━━━━━━━━━━━━━━━━━━━━
+
+- Return ONLY the email address or the word NONE
+- No explanations
+- No extra text
+- No punctuation
+- No formatting
+
+━━━━━━━━━━━━━━━━━━━━━━
+RESUME TEXT
+━━━━━━━━━━━━━━━━━━━━━━
+
+{resume_text}
+
+        """
+
+        try:
+            response = self.generate_completion(prompt).strip()
+
+            if response.lower() == "none":
+                return None
+
+        # 🔐 Final regex validation (critical)
+            match = re.search(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", response)
+            return match.group(0) if match else None
+
+        except Exception as e:
+            print("❌ AI email extraction failed:", e)
+            return None
+
+
+
+    def repair_email_ai(self, resume_text: str, extracted_email: str | None) -> str | None:
+
+        prompt = f"""
+You are a production-grade ATS email correction engine.
+
+TASK:
+You are given resume text and a possibly incorrect email.
+Your job is to return the CORRECT candidate email IF AND ONLY IF it is
+explicitly present in the resume text but broken due to spacing or OCR.
+
+ALLOWED OPERATIONS:
+- Join split username parts (letters + digits)
+- Join numeric fragments with username
+- Remove spaces between username fragments
+- Fix line breaks inside an email
+
+FORBIDDEN:
+- Do NOT invent a new email
+- Do NOT change domain
+- Do NOT guess usernames
+- Do NOT modify letters order
+- Do NOT create email if not present
+
+RULE:
+If the correct email cannot be reconstructed with certainty,
+return EXACTLY:
+NONE
+
+OUTPUT:
+Return ONLY the email or NONE.
+
+RESUME TEXT:
+{resume_text}
+
+CURRENT EMAIL:
+{extracted_email or "NONE"}
+        """
+
+        try:
+            response = self.generate_completion(prompt).strip()
+            return self._clean_email_response(response)
+
+        except Exception as e:
+            print("❌ AI email repair failed:", e)
+            return None
+
+
+    def _clean_email_response(self, response: str) -> str | None:
+        clean = (response or "").strip()
+
+        if not clean or clean.lower() == "none":
+            return None
+
+        if re.match(
+            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+            clean
+        ):
+            return clean
+
+        return None
+
+    def extract_email(self, resume_text: str) -> str | None:
+        if not resume_text:
+            return None
+
+        regex_matches = re.findall(
+            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+            resume_text
+        )
+
+        regex_email = regex_matches[0] if regex_matches else None
+
+        repaired_email = self.repair_email_ai(resume_text, regex_email)
+
+        if repaired_email:
+            return repaired_email
+
+        if regex_email:
+            local = regex_email.split("@")[0]
+            if not local.isdigit():
+                return regex_email
+
+        return None
+
+
+
+
+
+
+    def extract_name_regex(self, text: str) -> str | None:
+        if not text:
+            return None
+
+        lines = [l.strip() for l in text.splitlines() if l.strip()]
+        top_lines = lines[:5]  # names almost always appear here
+
+        for line in top_lines:
+            if any(x in line.lower() for x in [
+                "resume", "curriculum", "cv", "email", "@", "phone",
+                "linkedin", "github", "profile"
+            ]):
+                continue
+
+            if re.match(r"^[A-Za-z]+(?:\s[A-Za-z]+){1,3}$", line):
+                return line
+
+        return None
+
+
+    def extract_name_ai(self, resume_text: str) -> str | None:
+
+        if not resume_text or len(resume_text.strip()) < 30:
+            return None
+
+        prompt = f"""
+You are an automated resume parsing system used by enterprise ATS platforms.
+
+Your task is to extract the candidate’s FULL NAME from the resume text.
+
+━━━━━━━━━━━━━━━━━━━━━━
+STRICT EXTRACTION RULES
+━━━━━━━━━━━━━━━━━━━━━━
+1. Extract ONLY the candidate's name explicitly written in the resume.
+2. The name is usually at the top of the resume.
+3. Do NOT infer or guess a name.
+4. Do NOT extract usernames, emails, or profile handles.
+5. Do NOT include titles (Mr, Ms, Dr, Eng, etc).
+6. Do NOT include extra words or formatting.
+7. If multiple names exist, return the most prominent candidate name.
+8. If no clear candidate name is found, return EXACTLY:
+NONE
+
+━━━━━━━━━━━━━━━━━━━━━━
+OUTPUT RULES (CRITICAL)
+━━━━━━━━━━━━━━━━━━━━━━
+- Return ONLY the full name or NONE
+- No explanations
+- No punctuation
+- No formatting
+
+━━━━━━━━━━━━━━━━━━━━━━
+RESUME TEXT
+━━━━━━━━━━━━━━━━━━━━━━
+{resume_text}
+    """
+
+        try:
+            response = self.generate_completion(prompt).strip()
+            return self._clean_name_response(response)
+
+        except Exception as e:
+            print("❌ AI name extraction failed:", e)
+            return None
+
+
+    def _clean_name_response(self, response: str) -> str | None:
+        clean = (response or "").strip()
+
+        if not clean or clean.lower() == "none":
+            return None
+
+        if any(x in clean.lower() for x in [
+            "engineer", "developer", "resume", "cv",
+            "linkedin", "github", "@", "|"
+        ]):
+            return None
+
+        if re.match(r"^[A-Za-z]+(?:\s[A-Za-z]+){1,3}$", clean):
+            return clean.title()
+
+        return None
+
+    
+    def extract_name(self, resume_text: str) -> str | None:
+        name = self.extract_name_regex(resume_text)
+        if name:
+            return name
+        return self.extract_name_ai(resume_text)
+
+
+
+
+    def is_valid_email_context(self, text: str, email: str) -> bool:
+
+        if not text or not email:
+            return False
+
+        for match in re.finditer(re.escape(email), text):
+            start, end = match.start(), match.end()
+
+            before = text[start - 1] if start > 0 else " "
+            after = text[end] if end < len(text) else " "
+
+            if before.isalnum() or after.isalnum():
+                return False
+
+            local = email.split("@")[0]
+            if local.isdigit():
+                return False
+
+            return True
+
+        return False
+
+
+    def is_corrupted_email(self, resume_text: str, email: str) -> bool:
+        return not self.is_valid_email_context(resume_text, email)
+
+    # ================================
+    # 🧠 RESUME SCREENING (FIXED)
+    # ================================
+    PLACEHOLDER_NAMES = {"candidate", "unknown", ""}
+
+    # Bump whenever the screening prompt changes so cached results miss
+    SCREENING_PROMPT_VERSION = "2"
+
+    IDENTITY_RULES = {
+        "candidate_email": (
+            "- candidate_email: the candidate's email exactly as written in the resume.\n"
+            "  If it is split by spaces, line breaks or OCR noise, join the fragments.\n"
+            "  Never invent, guess or change the domain. Use \"NONE\" if not present."
+        ),
+        "candidate_name": (
+            "- candidate_name: the candidate's full name as written at the top of the resume.\n"
+            "  No titles, usernames or job titles. Use \"NONE\" if not clearly present."
+        ),
+    }
+
+    def build_screening_prompt(
+        self,
+        vacancy_data: Dict[str, Any],
+        resume_text: str,
+        identity_fields: List[str] | None = None
+    ) -> str:
+        identity_fields = identity_fields or []
+
+        identity_section = ""
+        identity_output = ""
+
+        if identity_fields:
+            identity_section = (
+                "\n━━━━━━━━━━━━━━━━━━━━━━\n"
+                "CANDIDATE IDENTITY EXTRACTION\n"
+                "━━━━━━━━━━━━━━━━━━━━━━\n"
+                + "\n".join(self.IDENTITY_RULES[f] for f in identity_fields)
+                + "\n"
+            )
+            identity_output = "".join(
+                f'  "{f}": "",\n' for f in identity_fields
+            )
+
+        prompt = f"""
+  
+You are a production-grade ATS scoring engine used by modern hiring platforms.
+Your task is to evaluate resume-to-job fit realistically and FAIRLY.
+
+━━━━━━━━━━━━━━━━━━━━━━
+JOB CONTEXT
+━━━━━━━━━━━━━━━━━━━━━━
+Job Role: {vacancy_data['job_role']}
+Experience Level Target: {vacancy_data['experience_level']}
+Required Skills (primary): {', '.join(vacancy_data['required_skills'])}
+Culture Traits (low weight): {', '.join(vacancy_data['culture_traits'])}
+Job Description:
+{vacancy_data.get('description', 'N/A')}
+
+━━━━━━━━━━━━━━━━━━━━━━
+RESUME TEXT
+━━━━━━━━━━━━━━━━━━━━━━
+{resume_text}
+{identity_section}
+━━━━━━━━━━━━━━━━━━━━━━
+EXPERIENCE CALCULATION (STRICT BUT FAIR)
+━━━━━━━━━━━━━━━━━━━━━━
+- Count ONLY professional work experience:
+  jobs, internships, freelancing, contracts
+- DO NOT count:
+  education duration, academic projects, courses, certifications
+- Experience must be supported by role + company + dates
+- If dates overlap → count once
+- Round DOWN to nearest 0.5 year
+- If no valid experience → experience_years = 0
+
+━━━━━━━━━━━━━━━━━━━━━━
+SKILL EXTRACTION RULES
+━━━━━━━━━━━━━━━━━━━━━━
+- Extract ONLY skills explicitly written in the resume
+- Do NOT infer or hallucinate
+- Do NOT penalize missing secondary or optional skills
+- Required skill match is considered GOOD if ≥70%
+
+━━━━━━━━━━━━━━━━━━━━━━
+SCORING PHILOSOPHY (VERY IMPORTANT)
+━━━━━━━━━━━━━━━━━━━━━━
+This system is calibrated so that:
+
+▶ A DECENT, RELEVANT resume SHOULD score **90+**
+▶ 90 is NOT exceptional — it is the NORMAL shortlist score
+▶ Scores below 90 should be used ONLY when there are clear gaps
+
+
+
+DO NOT deduct for:
+- Minor keyword differences
+- Non-critical skill gaps
+- Imperfect job title wording
+- Resume formatting or writing style
+
+━━━━━━━━━━━━━━━━━━━━━━
+SCORE INTERPRETATION
+━━━━━━━━━━━━━━━━━━━━━━
+- 90–100 → Strong match, shortlist-ready
+- 80–89 → Good profile, minor gaps
+- 65–79 → Partial match
+- <65 → Weak or unrelated
+
+━━━━━━━━━━━━━━━━━━━━━━
+FINAL VERIFICATION (SILENT)
+━━━━━━━━━━━━━━━━━━━━━━
+Before responding:
+- Ensure experience_years excludes education
+- Ensure extracted_skills appear verbatim in resume
+- Ensure score reflects REAL hiring behavior
+
+━━━━━━━━━━━━━━━━━━━━━━
+OUTPUT FORMAT (STRICT JSON ONLY)
+━━━━━━━━━━━━━━━━━━━━━━
+{{
+{identity_output}  "screening_score": 0,
+  "extracted_skills": [],
+  "experience_years": 0,
+  "screening_notes": ""
+}}
+
+
+        """
+
+        return prompt
+
+    def parse_screening_response(self, response_text: str) -> Dict[str, Any]:
+    # =========================
+    # SAFE JSON PARSING
+    # =========================
+        try:
+            return json.loads(response_text)
+        except Exception:
+            start = response_text.find("{")
+            end = response_text.rfind("}") + 1
+            return json.loads(response_text[start:end])
+
+    def run_screening_prompt(
+        self,
+        vacancy_data: Dict[str, Any],
+        resume_text: str,
+        identity_fields: List[str] | None = None
+    ) -> Dict[str, Any]:
+        if not config.SCREENING_CACHE_ENABLED:
+            prompt = self.build_screening_prompt(vacancy_data, resume_text, identity_fields)
+            return self.parse_screening_response(self.generate_completion(prompt))
+
+        vacancy_hash = vacancy_fingerprint(vacancy_data)
+        key = screening_cache.make_key(
+            resume_text,
+            vacancy_hash,
+            self.model,
+            self.SCREENING_PROMPT_VERSION,
+            identity_fields
+        )
+
+        cached = screening_cache.get(key)
+        if cached is not None:
+            print("⚡ SCREENING CACHE HIT")
+            return cached
+
+        prompt = self.build_screening_prompt(vacancy_data, resume_text, identity_fields)
+        data = self.parse_screening_response(self.generate_completion(prompt))
+
+        screening_cache.put(key, vacancy_data.get("id"), vacancy_hash, data)
+        return data
+
+    def analyze_resume(
+        self,
+        resume_text: str,
+        vacancy_data: Dict[str, Any],
+        current_email: str | None,
+        current_name: str | None
+    ) -> Dict[str, Any]:
+        """
+        Runs every LLM step of screening without touching the database.
+        Returns the corrected email / name (None when unchanged) and the
+        parsed screening JSON.
+        """
+
+        if not config.SCREENING_COMBINED_EXTRACTION:
+            return self._analyze_resume_separate(
+                resume_text, vacancy_data, current_email, current_name
+            )
+
+        needs_email = not current_email or self.is_corrupted_email(resume_text, current_email)
+        needs_name = (current_name or "").strip().lower() in self.PLACEHOLDER_NAMES
+
+        email = None
+        name = None
+
+        # Regex first — the LLM is only asked for what regex could not resolve
+        if needs_email:
+            regex_email = self.extract_email_regex(resume_text)
+            if regex_email and self.is_valid_email_context(resume_text, regex_email):
+                email = regex_email
+
+        if needs_name:
+            name = self.extract_name_regex(resume_text)
+
+        identity_fields = []
+        if needs_email and not email:
+            identity_fields.append("candidate_email")
+        if needs_name and not name:
+            identity_fields.append("candidate_name")
+
+        data = self.run_screening_prompt(vacancy_data, resume_text, identity_fields)
+
+        ai_email = str(data.pop("candidate_email", "") or "")
+        ai_name = str(data.pop("candidate_name", "") or "")
+
+        # Dedicated extraction calls only when the combined answer is unusable too
+        if "candidate_email" in identity_fields:
+            email = (
+                self._clean_email_response(ai_email)
+                or self.repair_email_ai(resume_text, None)
+            )
+
+        if "candidate_name" in identity_fields:
+            name = self._clean_name_response(ai_name) or self.extract_name_ai(resume_text)
+
+        return {"email": email, "name": name, "screening": data}
+
+    def _analyze_resume_separate(
+        self,
+        resume_text: str,
+        vacancy_data: Dict[str, Any],
+        current_email: str | None,
+        current_name: str | None
+    ) -> Dict[str, Any]:
+        email = None
+        name = None
+
+        extracted_email = self.extract_email(resume_text)
+
+        if extracted_email and (
+            not current_email
+            or self.is_corrupted_email(resume_text, current_email)
+        ):
+            email = extracted_email
+
+        extracted_name = self.extract_name(resume_text)
+
+        if extracted_name and (current_name or "").strip().lower() in self.PLACEHOLDER_NAMES:
+            name = extracted_name
+
+        data = self.run_screening_prompt(vacancy_data, resume_text)
+
+        return {"email": email, "name": name, "screening": data}
+
+    def screen_resume(self, candidate_id: str, vacancy_id: str) -> Dict[str, Any]:
+        print("🔥 SCREENING STARTED:", candidate_id)
+
+        candidate_data = candidate_repo.get(candidate_id, CANDIDATE_PROFILE)
+        vacancy_data = vacancy_repo.get(vacancy_id, VACANCY_PROMPT)
+
+        if not candidate_data or not vacancy_data:
+            raise ValueError(f"Candidate {candidate_id} or vacancy {vacancy_id} not found")
+
+        # Identity corrections go out with the screening result, in one write
+        corrections = {}
+
+        analysis = self.analyze_resume(
+            candidate_data.get("resume_text", ""),
+            vacancy_data,
+            candidate_data.get("email", ""),
+            candidate_data.get("name")
+        )
+
+        if analysis["email"]:
+            print("✅ Correcting candidate email:", analysis["email"])
+
+            corrections["email"] = analysis["email"]
+            candidate_data["email"] = analysis["email"]
+
+        if analysis["name"]:
+            print("✅ Updating candidate name:", analysis["name"])
+
+            corrections["name"] = analysis["name"]
+            candidate_data["name"] = analysis["name"]
+
+        data = analysis["screening"]
+
+    # =========================
+    # SAFE TYPE CASTING (CRITICAL)
+    # =========================
+        screening_score = int(float(data.get("screening_score", 0)))
+        experience_years = int(float(data.get("experience_years", 0)))
+        extracted_skills = data.get("extracted_skills", [])
+        screening_notes = str(data.get("screening_notes", ""))
+    # =========================
+    # UPDATE CANDIDATE
+    # =========================
+        candidate_repo.update(candidate_id, {
+            **corrections,
+            "screening_score": screening_score,
+            "skills": extracted_skills,
+            "experience_years": experience_years,
+            "screening_notes": screening_notes,
+            "status": "screened"
+        })
+
+
+    # == =======================
+    # AUTO SEND GOOGLE FORM
+    # =========================
+        if screening_score >= 85:
+            email_service.send_form_invitation(
+                candidate_id,
+                candidate_data["email"],
+                candidate_data["name"]
+            )
+
+            candidate_repo.set_status(candidate_id, "form_sent")
+
+        print("✅ SCREENING COMPLETED:", candidate_id)
+        return data
+
+ai_service = AIService()
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
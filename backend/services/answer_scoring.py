@@ -0,0 +1,282 @@
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List
+
+from backend.services.ai_service import ai_service
+from backend.services.interview_context import clip, interview_context
+from backend.services.metrics import metrics
+from backend.services.state_store import connect
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answer_scores (
+    candidate_id TEXT NOT NULL,
+    turn INTEGER NOT NULL,
+    answer_hash TEXT NOT NULL,
+    scores TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (candidate_id, turn)
+);
+"""
+
+CATEGORIES = {
+    "skill_score": "skill",
+    "communication_score": "communication",
+    "problem_solving_score": "problem solving",
+    "culture_fit_score": "culture fit"
+}
+
+
+def recommendation_for(overall: int) -> str:
+    if overall >= 80:
+        return "Strong Fit"
+    if overall >= 70:
+        return "Moderate Fit"
+    return "Not Recommended"
+
+
+def _answer_hash(question: str, answer: str) -> str:
+    return hashlib.sha256(f"{question}|{answer}".encode("utf-8")).hexdigest()
+
+
+def _parse_scores(raw: str) -> Dict[str, Any]:
+    raw = re.sub(r"^```(?:json)?|```$", "", raw.strip(), flags=re.MULTILINE).strip()
+    data = json.loads(raw[raw.index("{"):raw.rindex("}") + 1])
+
+    scores = {
+        field: max(0, min(25, int(round(float(data[field])))))
+        for field in CATEGORIES
+    }
+    scores["note"] = str(data.get("note") or "").strip()
+
+    return scores
+
+
+class AnswerScorer:
+    """
+    Scores every interview answer on its own, in the background, as soon
+    as it is submitted, and keeps the scores in the local state store.
+
+    The final evaluation is then a merge of stored scores: only answers
+    not scored yet (or edited since) are scored at that point, and no
+    prompt ever holds the whole transcript.
+    """
+
+    def __init__(self):
+        self.conn = connect("answer_scores")
+        self.lock = threading.Lock()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    def _stored(self, candidate_id: str) -> Dict[int, tuple[str, Dict[str, Any]]]:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT turn, answer_hash, scores FROM answer_scores WHERE candidate_id = ?",
+                (candidate_id,)
+            ).fetchall()
+
+        return {row["turn"]: (row["answer_hash"], json.loads(row["scores"])) for row in rows}
+
+    async def _score(
+        self,
+        candidate_id: str,
+        turn: int,
+        question: str,
+        answer: str,
+        vacancy: Dict[str, Any],
+        resume_text: str | None,
+        priority: str
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        profile = await interview_context.resume_profile(resume_text)
+
+        raw = await ai_service.agenerate_completion(
+            f"""
+You are a senior hiring panel scoring ONE answer from a job interview.
+
+━━━━━━━━━━━━━━━━━━━━━━
+JOB CONTEXT
+━━━━━━━━━━━━━━━━━━━━━━
+Role: {vacancy.get('job_role')}
+Experience Level Target: {vacancy.get('experience_level', 'Not specified')}
+Required Skills: {', '.join(vacancy.get('required_skills') or []) or 'Not specified'}
+Culture Traits: {', '.join(vacancy.get('culture_traits') or []) or 'Not specified'}
+
+Resume profile (BACKGROUND ONLY — NOT PROOF):
+{profile}
+
+━━━━━━━━━━━━━━━━━━━━━━
+ANSWER
+━━━━━━━━━━━━━━━━━━━━━━
+Q: {question}
+A: {clip(answer, 800)}
+
+━━━━━━━━━━━━━━━━━━━━━━
+RULES (STRICT)
+━━━━━━━━━━━━━━━━━━━━━━
+- Score what THIS answer demonstrates; the resume only checks consistency.
+- Penalize vague responses, buzzwords without explanation and theory
+  without practical examples.
+- Reward clear reasoning, concrete examples, trade-offs and ownership.
+- A category this question does not touch gets the score the answer
+  implies about it at most, never a reward for absence.
+- Be strict, realistic and conservative. Integers 0-25 only.
+
+Return STRICT JSON only:
+{{
+  "skill_score": <0-25>,
+  "communication_score": <0-25>,
+  "problem_solving_score": <0-25>,
+  "culture_fit_score": <0-25>,
+  "note": "<one sentence on this answer>"
+}}
+""",
+            priority=priority,
+            max_tokens=300
+        )
+
+        scores = _parse_scores(raw)
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO answer_scores "
+                "(candidate_id, turn, answer_hash, scores, created_at) VALUES (?, ?, ?, ?, ?)",
+                (candidate_id, turn, _answer_hash(question, answer), json.dumps(scores), time.time())
+            )
+
+        metrics.incr("answer_scoring.scored", priority=priority)
+        metrics.observe("answer_scoring.seconds", time.perf_counter() - started, priority=priority)
+        return scores
+
+    def schedule(
+        self,
+        candidate_id: str,
+        turn: int,
+        question: str,
+        answer: str,
+        vacancy: Dict[str, Any],
+        resume_text: str | None
+    ):
+        """
+        Scores the answer to transcript[turn] in the background.
+        """
+
+        if not answer or not vacancy:
+            return
+
+        key = f"{candidate_id}:{turn}:{_answer_hash(question, answer)}"
+        if key in self._tasks:
+            return
+
+        async def run():
+            try:
+                await self._score(candidate_id, turn, question, answer, vacancy, resume_text, "batch")
+            except Exception as e:
+                metrics.incr("answer_scoring.errors")
+                print(f"⚠️ Answer scoring failed ({candidate_id} Q{turn + 1}):", e)
+            finally:
+                self._tasks.pop(key, None)
+
+        self._tasks[key] = asyncio.ensure_future(run())
+
+    async def _ensure(
+        self,
+        candidate_id: str,
+        turn: int,
+        question: str,
+        answer: str,
+        vacancy: Dict[str, Any],
+        resume_text: str | None
+    ) -> Dict[str, Any] | None:
+        answer_hash = _answer_hash(question, answer)
+
+        # Scored in the background while the candidate kept going
+        task = self._tasks.get(f"{candidate_id}:{turn}:{answer_hash}")
+        if task:
+            await asyncio.shield(task)
+
+        stored = self._stored(candidate_id).get(turn)
+        if stored and stored[0] == answer_hash:
+            return stored[1]
+
+        metrics.incr("answer_scoring.late")
+
+        try:
+            return await self._score(candidate_id, turn, question, answer, vacancy, resume_text, "interactive")
+        except Exception as e:
+            metrics.incr("answer_scoring.errors")
+            print(f"⚠️ Answer scoring failed ({candidate_id} Q{turn + 1}):", e)
+            return None
+
+    async def evaluate(
+        self,
+        candidate_id: str,
+        transcript: List[Dict[str, Any]],
+        vacancy: Dict[str, Any],
+        resume_text: str | None
+    ) -> Dict[str, Any] | None:
+        """
+        The final evaluation merged from per-answer scores: mean per
+        category over every question asked, where an unanswered question
+        (or one whose answer could not be scored) counts as 0. None if
+        answers were given but none of them could be scored.
+        """
+
+        answered = [(i, t) for i, t in enumerate(transcript) if t.get("answer")]
+
+        results = await asyncio.gather(*(
+            self._ensure(candidate_id, i, t.get("question") or "", t["answer"], vacancy, resume_text)
+            for i, t in answered
+        ))
+
+        scored = [(i + 1, s) for (i, _), s in zip(answered, results) if s]
+        if answered and not scored:
+            return None
+
+        asked = max(1, len(transcript))
+
+        evaluation = {
+            field: round(sum(s[field] for _, s in scored) / asked)
+            for field in CATEGORIES
+        }
+        evaluation["overall_score"] = sum(evaluation[field] for field in CATEGORIES)
+        evaluation["recommendation"] = recommendation_for(evaluation["overall_score"])
+
+        strongest = max(CATEGORIES, key=evaluation.get)
+        weakest = min(CATEGORIES, key=evaluation.get)
+
+        missing = len(transcript) - len(scored)
+        notes = [
+            f"Scored answer by answer over {len(scored)} of {len(transcript)} questions"
+            + (f"; {missing} unanswered or unscored counted as 0." if missing else "."),
+            f"Strongest area: {CATEGORIES[strongest]} ({evaluation[strongest]}/25); "
+            f"weakest: {CATEGORIES[weakest]} ({evaluation[weakest]}/25)."
+        ]
+
+        if scored:
+            best = max(scored, key=lambda item: sum(item[1][f] for f in CATEGORIES))
+            worst = min(scored, key=lambda item: sum(item[1][f] for f in CATEGORIES))
+
+            if best[1].get("note"):
+                notes.append(f"Best answer (Q{best[0]}): {best[1]['note']}")
+            if worst[0] != best[0] and worst[1].get("note"):
+                notes.append(f"Weakest answer (Q{worst[0]}): {worst[1]['note']}")
+
+        evaluation["evaluation_notes"] = " ".join(notes)
+        return evaluation
+
+    def forget(self, candidate_id: str):
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM answer_scores WHERE candidate_id = ?",
+                (candidate_id,)
+            )
+
+
+answer_scorer = AnswerScorer()
@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from backend.config import config
+
+
+class BatchScreeningEngine:
+    """
+    Fans candidate screenings out across a bounded worker pool.
+
+    Every screening holds a slot for its LLM provider while it runs, so
+    the worker count can be raised without exceeding the provider's
+    concurrency cap (slots are shared by all batches in the process).
+    """
+
+    def __init__(self, max_workers: int, provider_limit: int):
+        self.max_workers = max(1, max_workers)
+        self.provider_limit = max(1, provider_limit)
+        self._provider_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, provider: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if provider not in self._provider_slots:
+                self._provider_slots[provider] = threading.BoundedSemaphore(
+                    self.provider_limit
+                )
+            return self._provider_slots[provider]
+
+    def _screen_one(
+        self,
+        candidate_id: str,
+        screen_fn: Callable[[str], Any],
+        provider: str,
+        on_result: Callable[[Dict[str, Any]], None] | None
+    ) -> Dict[str, Any]:
+        print("🔥 BATCH SCREENING STARTED:", candidate_id)
+
+        try:
+            with self._slot(provider):
+                result = screen_fn(candidate_id)
+
+            outcome = {
+                "candidate_id": candidate_id,
+                "success": True,
+                "data": result
+            }
+
+        except Exception as e:
+            print("❌ SCREENING FAILED:", candidate_id, str(e))
+
+            outcome = {
+                "candidate_id": candidate_id,
+                "success": False,
+                "error": str(e)
+            }
+
+        if on_result:
+            on_result(outcome)
+
+        return outcome
+
+    def run(
+        self,
+        candidate_ids: List[str],
+        screen_fn: Callable[[str], Any],
+        provider: str | None = None,
+        on_result: Callable[[Dict[str, Any]], None] | None = None
+    ) -> Dict[str, Any]:
+        provider = provider or config.AI_PROVIDER
+        started = time.perf_counter()
+
+        workers = min(self.max_workers, len(candidate_ids)) or 1
+
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="screening"
+        ) as pool:
+            results = list(pool.map(
+                lambda cid: self._screen_one(cid, screen_fn, provider, on_result),
+                candidate_ids
+            ))
+
+        elapsed = time.perf_counter() - started
+        failed = sum(1 for r in results if not r["success"])
+
+        return {
+            "count": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "workers": workers,
+            "provider": provider,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_per_minute": (
+                round(len(results) / elapsed * 60, 2) if elapsed > 0 else None
+            ),
+            "results": results
+        }
+
+
+batch_screening_engine = BatchScreeningEngine(
+    max_workers=config.SCREENING_BATCH_WORKERS,
+    provider_limit=config.AI_PROVIDER_MAX_CONCURRENCY
+)
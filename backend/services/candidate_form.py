@@ -3,7 +3,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, EmailStr, Field, validator
 
-from backend.database import supabase
+from backend.repository import candidate_repo, form_repo
 from backend.services.email_service import email_service
 
 router = APIRouter()
@@ -59,15 +59,7 @@ def submit_candidate_form(payload: CandidateFormPayload):
     # --------------------------------
     # 1️⃣ Check candidate exists
     # --------------------------------
-    candidate = (
-        supabase
-        .table("candidates")
-        .select("id, email, name")
-        .eq("id", payload.candidate_id)
-        .single()
-        .execute()
-        .data
-    )
+    candidate = candidate_repo.get(payload.candidate_id, "id, email, name")
 
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
@@ -76,7 +68,7 @@ def submit_candidate_form(payload: CandidateFormPayload):
     # 2️⃣ Insert form (ONE per candidate)
     # --------------------------------
     try:
-        supabase.table("candidate_forms").insert({
+        form_repo.create({
             "candidate_id": payload.candidate_id,
 
             "first_name": payload.first_name.strip(),
@@ -99,7 +91,7 @@ def submit_candidate_form(payload: CandidateFormPayload):
 
             "portfolio_link": payload.portfolio_link,
             "created_at": datetime.utcnow().isoformat(),
-        }).execute()
+        })
 
     except Exception as e:
         # Most likely UNIQUE constraint violation
@@ -118,10 +110,7 @@ def submit_candidate_form(payload: CandidateFormPayload):
 
 
 
-    supabase.table("candidates").update({
-        "status": "form_completed",
-        "updated_at": datetime.utcnow().isoformat()
-    }).eq("id", payload.candidate_id).execute()
+    candidate_repo.set_status(payload.candidate_id, "form_completed")
 
 
     # --------------------------------
@@ -136,15 +125,7 @@ def submit_candidate_form(payload: CandidateFormPayload):
 
 @router.get("/candidate-form/status")
 def candidate_form_status(candidate_id: str):
-    candidate = (
-        supabase
-        .table("candidates")
-        .select("status")
-        .eq("id", candidate_id)
-        .single()
-        .execute()
-        .data
-    )
+    candidate = candidate_repo.get(candidate_id, "status")
 
     if not candidate:
         return {"form_completed": False}
@@ -165,12 +146,4 @@ def candidate_form_status(candidate_id: str):
 
 @router.get("/candidate-form/all")
 def list_all_candidate_forms():
-    result = (
-        supabase
-        .table("candidate_forms")
-        .select("*")
-        .order("created_at", desc=True)
-        .execute()
-    )
-
-    return {"success": True, "data": result.data}
+    return {"success": True, "data": form_repo.list()}
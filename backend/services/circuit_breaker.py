@@ -0,0 +1,146 @@
+import threading
+import time
+from typing import Any, Dict
+
+from backend.config import config
+from backend.services.metrics import metrics
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"LLM provider '{name}' is unavailable, retry in {retry_after:.0f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    closed: calls pass; `failure_threshold` consecutive provider failures
+    (timeouts, connection errors, 429 / 5xx) open the circuit.
+    open: calls fail immediately with CircuitOpenError for `reset_seconds`.
+    half_open: up to `half_open_calls` trial calls pass; a success closes
+    the circuit, a failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float, half_open_calls: int):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.half_open_calls = max(1, half_open_calls)
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trials = 0
+
+    def _set_state(self, state: str):
+        if state == self.state:
+            return
+
+        print(f"⚡ LLM circuit '{self.name}': {self.state} → {state}")
+        self.state = state
+        metrics.gauge("llm.breaker_state", STATE_GAUGE[state], provider=self.name)
+
+        if state == OPEN:
+            self.opened_at = time.monotonic()
+            metrics.incr("llm.breaker_opened", provider=self.name)
+
+    def available(self) -> bool:
+        with self.lock:
+            return self.state != OPEN or (
+                time.monotonic() - self.opened_at >= self.reset_seconds
+            )
+
+    def acquire(self) -> bool:
+        """
+        Raises CircuitOpenError unless a call may go out now. Returns
+        whether the call is a half-open trial; every successful acquire
+        must be followed by exactly one record(..., trial).
+        """
+
+        with self.lock:
+            if self.state == OPEN:
+                remaining = self.reset_seconds - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    metrics.incr("llm.breaker_rejected", provider=self.name)
+                    raise CircuitOpenError(self.name, remaining)
+
+                self._set_state(HALF_OPEN)
+                self.trials = 0
+
+            if self.state == HALF_OPEN:
+                if self.trials >= self.half_open_calls:
+                    metrics.incr("llm.breaker_rejected", provider=self.name)
+                    raise CircuitOpenError(self.name, self.reset_seconds)
+
+                self.trials += 1
+                return True
+
+            return False
+
+    def record(self, healthy: bool | None, trial: bool = False):
+        """
+        healthy=None is for outcomes that say nothing about the provider
+        (bad request, cancelled call).
+        """
+
+        with self.lock:
+            if trial:
+                self.trials -= 1
+
+            if healthy is None:
+                return
+
+            if healthy:
+                self.failures = 0
+                self._set_state(CLOSED)
+                return
+
+            self.failures += 1
+
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._set_state(OPEN)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            snapshot = {
+                "state": self.state,
+                "consecutive_failures": self.failures
+            }
+
+            if self.state == OPEN:
+                snapshot["retry_in_seconds"] = round(
+                    max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at)), 1
+                )
+
+            return snapshot
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=config.LLM_BREAKER_FAILURE_THRESHOLD,
+                reset_seconds=config.LLM_BREAKER_RESET_SECONDS,
+                half_open_calls=config.LLM_BREAKER_HALF_OPEN_CALLS
+            )
+        return _breakers[name]
+
+
+def breaker_states() -> Dict[str, Dict[str, Any]]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+
+    return {b.name: b.snapshot() for b in breakers}
@@ -0,0 +1,278 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from typing import Any, Dict, List
+
+from backend.config import config
+from backend.services.ai_service import ai_service
+from backend.services.metrics import metrics
+from backend.services.rate_limiter import estimate_tokens
+from backend.services.state_store import connect
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resume_profiles (
+    key TEXT PRIMARY KEY,
+    profile TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS interview_summaries (
+    candidate_id TEXT PRIMARY KEY,
+    turns INTEGER NOT NULL,
+    summary TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Bump when the profile / summary prompts change
+CONTEXT_PROMPT_VERSION = "1"
+
+
+def count_tokens(text: str) -> int:
+    return estimate_tokens(text, 0)
+
+
+def clip(text: str, max_tokens: int) -> str:
+    text = re.sub(r"\s+", " ", text or "").strip()
+    limit = max_tokens * 4
+
+    if len(text) <= limit:
+        return text
+
+    return text[:limit].rsplit(" ", 1)[0] + " …"
+
+
+class InterviewContext:
+    """
+    Keeps interview prompts a fixed size however long the interview runs.
+
+    The resume is replaced by a compact profile (generated once per resume
+    text and cached), and the transcript by a rolling summary of earlier
+    turns plus the most recent questions verbatim. Profiles and summaries
+    are produced in the background at batch priority; until one is ready
+    the prompt uses the clipped resume / question list instead, so a turn
+    never waits on them.
+    """
+
+    def __init__(self, profile_tokens: int, history_tokens: int, recent_turns: int):
+        self.profile_tokens = profile_tokens
+        self.history_tokens = history_tokens
+        self.recent_turns = max(1, recent_turns)
+        self.conn = connect("interview_context")
+        self.lock = threading.Lock()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    def _background(self, key: str, factory):
+        task = self._tasks.get(key)
+        if task and not task.done():
+            return
+
+        async def run():
+            try:
+                await factory()
+            except Exception as e:
+                metrics.incr("interview_context.errors")
+                print(f"⚠️ Interview context update failed ({key}):", e)
+            finally:
+                self._tasks.pop(key, None)
+
+        self._tasks[key] = asyncio.ensure_future(run())
+
+    # =========================
+    # RESUME PROFILE
+    # =========================
+    def _profile_key(self, resume_text: str) -> str:
+        normalized = re.sub(r"\s+", " ", resume_text or "").strip()
+        return hashlib.sha256(
+            f"{CONTEXT_PROMPT_VERSION}|{self.profile_tokens}|{normalized}".encode("utf-8")
+        ).hexdigest()
+
+    def _cached_profile(self, key: str) -> str | None:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT profile FROM resume_profiles WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+        return row["profile"] if row else None
+
+    async def _build_profile(self, key: str, resume_text: str):
+        words = int(self.profile_tokens * 0.7)
+
+        profile = await ai_service.agenerate_completion(
+            f"""
+Condense this resume into a factual candidate profile for an interviewer.
+Keep: current role and seniority, years of experience, core skills,
+each notable project (one line: what, stack, the candidate's part),
+education and certifications. Drop contact details and filler.
+Plain text, at most {words} words.
+
+Resume:
+{resume_text}
+""",
+            priority="batch",
+            max_tokens=self.profile_tokens * 2
+        )
+
+        await asyncio.to_thread(self._save_profile, key, clip(profile, self.profile_tokens))
+        metrics.incr("interview_context.profiles_built")
+
+    def _save_profile(self, key: str, profile: str):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO resume_profiles (key, profile, created_at) VALUES (?, ?, ?)",
+                (key, profile, time.time())
+            )
+
+    async def resume_profile(self, resume_text: str | None) -> str:
+        if not resume_text or count_tokens(resume_text) <= self.profile_tokens:
+            return resume_text or "Resume not available"
+
+        key = self._profile_key(resume_text)
+        profile = await asyncio.to_thread(self._cached_profile, key)
+
+        if profile:
+            metrics.incr("interview_context.profile_hits")
+            return profile
+
+        metrics.incr("interview_context.profile_misses")
+        self._background(f"profile:{key}", lambda: self._build_profile(key, resume_text))
+        return clip(resume_text, self.profile_tokens)
+
+    # =========================
+    # ROLLING SUMMARY
+    # =========================
+    def _summary(self, candidate_id: str) -> tuple[int, str]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT turns, summary FROM interview_summaries WHERE candidate_id = ?",
+                (candidate_id,)
+            ).fetchone()
+
+        return (row["turns"], row["summary"]) if row else (0, "")
+
+    async def _extend_summary(self, candidate_id: str, turns: List[Dict[str, Any]]):
+        covered, summary = await asyncio.to_thread(self._summary, candidate_id)
+        if covered >= len(turns):
+            return
+
+        new_turns = "\n\n".join(
+            f"Q{covered + i + 1}: {t.get('question')}\nA: {clip(t.get('answer') or 'No answer', 300)}"
+            for i, t in enumerate(turns[covered:])
+        )
+        words = int(self.history_tokens * 0.5)
+
+        updated = await ai_service.agenerate_completion(
+            f"""
+You keep running notes for an interviewer. Update the notes with the new
+interview turns. For every question asked, keep one line: its topic,
+the project or scenario it was about, and how well it was answered
+(strong / adequate / weak, with a few words why). Merge, do not repeat.
+Plain text, at most {words} words.
+
+Current notes:
+{summary or "None yet."}
+
+New turns:
+{new_turns}
+""",
+            priority="batch",
+            max_tokens=self.history_tokens * 2
+        )
+
+        await asyncio.to_thread(
+            self._save_summary, candidate_id, len(turns), clip(updated, self.history_tokens // 2)
+        )
+        metrics.incr("interview_context.summaries_built")
+
+    def _save_summary(self, candidate_id: str, turns: int, summary: str):
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO interview_summaries (candidate_id, turns, summary, updated_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(candidate_id) DO UPDATE SET "
+                "turns = excluded.turns, summary = excluded.summary, updated_at = excluded.updated_at "
+                "WHERE excluded.turns > interview_summaries.turns",
+                (candidate_id, turns, summary, time.time())
+            )
+
+    async def history(self, candidate_id: str, transcript: List[Dict[str, Any]]) -> str:
+        """
+        Earlier turns as notes plus the most recent questions verbatim,
+        within history_tokens.
+        """
+
+        older = transcript[:-self.recent_turns] if len(transcript) > self.recent_turns else []
+        recent = transcript[len(older):]
+
+        covered, summary = await asyncio.to_thread(self._summary, candidate_id)
+        covered = min(covered, len(older))
+
+        if covered < len(older):
+            self._background(
+                f"summary:{candidate_id}",
+                lambda: self._extend_summary(candidate_id, [dict(t) for t in older])
+            )
+
+        lines = []
+        if summary and covered:
+            lines.append(f"Notes on questions 1-{covered}:\n{summary}")
+
+        # Turns the notes do not cover yet: the questions only, shortened
+        for i, turn in enumerate(older[covered:], start=covered + 1):
+            lines.append(f"Q{i}: {clip(turn.get('question'), 40)}")
+
+        for i, turn in enumerate(recent, start=len(older) + 1):
+            lines.append(f"Q{i}: {turn.get('question')}")
+
+        if not lines:
+            return "None yet."
+
+        text = "\n".join(lines)
+        if count_tokens(text) <= self.history_tokens:
+            return text
+
+        # Keep the newest lines, they matter most for the next question
+        kept = []
+        budget = self.history_tokens
+        for line in reversed(lines):
+            budget -= count_tokens(line) + 1
+            if budget < 0:
+                break
+            kept.append(line)
+
+        return "\n".join(reversed(kept)) or clip(lines[-1], self.history_tokens)
+
+    def forget(self, candidate_id: str):
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM interview_summaries WHERE candidate_id = ?",
+                (candidate_id,)
+            )
+
+
+def record_prompt_tokens(kind: str, prompt: str, unbounded_tokens: int, turn: int | None = None):
+    """
+    Prompt size per turn, and the tokens saved against the old prompt that
+    embedded the full resume and every earlier question.
+    """
+
+    tokens = count_tokens(prompt)
+    labels = {"kind": kind} if turn is None else {"kind": kind, "turn": turn}
+
+    metrics.observe("interview.prompt_tokens", tokens, **labels)
+    metrics.incr("interview.prompt_tokens_total", tokens, kind=kind)
+    metrics.incr("interview.prompt_tokens_saved", max(0, unbounded_tokens - tokens), kind=kind)
+
+
+interview_context = InterviewContext(
+    profile_tokens=config.INTERVIEW_PROFILE_TOKENS,
+    history_tokens=config.INTERVIEW_HISTORY_TOKENS,
+    recent_turns=config.INTERVIEW_RECENT_TURNS
+)
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List
+
+from backend.config import config
+from backend.services.ai_service import ai_service
+from backend.services.interview_context import clip, interview_context
+from backend.services.metrics import metrics
+from backend.services.state_store import connect, transaction
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS interview_plans (
+    candidate_id TEXT PRIMARY KEY,
+    plan TEXT NOT NULL,
+    used TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# Topic per turn, in interview-flow order: resume claims and fundamentals
+# first, then real work and decisions, then ownership and judgment
+TOPICS = [
+    "Resume project deep-dive",
+    "Core skill verification",
+    "Real-world problem solving",
+    "Decision making & trade-offs",
+    "Debugging / failure handling",
+    "System or design thinking",
+    "Ownership & responsibility",
+    "Communication & clarity",
+    "Culture & teamwork"
+]
+
+# Answers that call for a follow-up instead of the planned question as is
+EVASIVE_ANSWER = re.compile(
+    r"\b(i don'?t know|not sure|no idea|never (used|worked)|can'?t remember|skip)\b",
+    re.IGNORECASE
+)
+
+
+def needs_follow_up(answer: str | None, weak_answer_words: int) -> bool:
+    if not answer or not answer.strip():
+        return False
+
+    return len(answer.split()) < weak_answer_words or bool(EVASIVE_ANSWER.search(answer))
+
+
+def _parse_plan(raw: str) -> Dict[str, List[str]]:
+    raw = re.sub(r"^```(?:json)?|```$", "", raw.strip(), flags=re.MULTILINE).strip()
+    data = json.loads(raw[raw.index("{"):raw.rindex("}") + 1])
+
+    plan = {}
+    for topic in TOPICS:
+        questions = [q.strip() for q in data.get(topic) or [] if isinstance(q, str) and q.strip()]
+        if questions:
+            plan[topic] = questions
+
+    if not plan:
+        raise ValueError("Plan has no questions")
+
+    return plan
+
+
+class InterviewPlanner:
+    """
+    Ranked questions per topic, generated once per interview ahead of
+    time, so a turn is a local lookup instead of a full completion.
+
+    A turn takes the best unused question of that turn's topic. Only when
+    the last answer was weak or evasive is the question adapted to it with
+    a short follow-up call (which falls back to the planned question).
+    Without a plan, callers generate the question as before.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        questions_per_topic: int,
+        follow_up_timeout: float,
+        weak_answer_words: int
+    ):
+        self.enabled = enabled
+        self.questions_per_topic = questions_per_topic
+        self.follow_up_timeout = follow_up_timeout
+        self.weak_answer_words = weak_answer_words
+        self.conn = connect("interview_plans")
+        self.lock = threading.Lock()
+        self._pending: Dict[str, asyncio.Task] = {}
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    def has_plan(self, candidate_id: str) -> bool:
+        with self.lock:
+            return self.conn.execute(
+                "SELECT 1 FROM interview_plans WHERE candidate_id = ?",
+                (candidate_id,)
+            ).fetchone() is not None
+
+    async def generate(self, candidate_id: str, candidate: Dict[str, Any], vacancy: Dict[str, Any]):
+        started = time.perf_counter()
+        profile = await interview_context.resume_profile(candidate.get('resume_text'))
+
+        raw = await ai_service.agenerate_completion(
+            f"""
+You are preparing a REAL hiring interview for the role below.
+
+Job Role: {vacancy.get('job_role')}
+Experience Level Target: {vacancy.get('experience_level', 'Not specified')}
+Required Skills: {', '.join(vacancy.get('required_skills') or []) or 'Not specified'}
+Job Description:
+{vacancy.get('description', 'N/A')}
+Culture Traits: {', '.join(vacancy.get('culture_traits') or []) or 'Not specified'}
+
+Candidate Resume (profile):
+{profile}
+
+For EACH topic below write {self.questions_per_topic} interview questions,
+best first. Each question is ONE question, scenario- or experience-based,
+specific to this candidate and role, never theory-only or generic HR.
+Do not reuse the same project or scenario across topics.
+
+Topics:
+{json.dumps(TOPICS)}
+
+Return STRICT JSON only, mapping each topic to its list of questions:
+{{"<topic>": ["<question>", ...], ...}}
+""",
+            priority="interactive",
+            max_tokens=3000
+        )
+
+        plan = _parse_plan(raw)
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO interview_plans (candidate_id, plan, used, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (candidate_id, json.dumps(plan), "[]", time.time())
+            )
+
+        metrics.observe("interview_plan.generate_seconds", time.perf_counter() - started)
+        print(f"🗺️ Interview plan ready for {candidate_id}: {sum(map(len, plan.values()))} questions")
+
+    async def prepare(self, candidate_id: str, load):
+        """
+        Generates the plan in the background unless there is one already.
+        `load` is an async callable returning (candidate, vacancy).
+        """
+
+        if not self.enabled or candidate_id in self._pending:
+            return
+
+        if await asyncio.to_thread(self.has_plan, candidate_id) or candidate_id in self._pending:
+            return
+
+        async def run():
+            try:
+                candidate, vacancy = await load()
+                if vacancy:
+                    await self.generate(candidate_id, candidate, vacancy)
+            except Exception as e:
+                metrics.incr("interview_plan.errors")
+                print(f"⚠️ Interview plan failed for {candidate_id}:", e)
+            finally:
+                self._pending.pop(candidate_id, None)
+
+        self._pending[candidate_id] = asyncio.ensure_future(run())
+
+    def _take(self, candidate_id: str, question_count: int) -> str | None:
+        with self.lock, transaction(self.conn):
+            row = self.conn.execute(
+                "SELECT plan, used FROM interview_plans WHERE candidate_id = ?",
+                (candidate_id,)
+            ).fetchone()
+
+            if not row:
+                return None
+
+            plan = json.loads(row["plan"])
+            used = set(json.loads(row["used"]))
+
+            # This turn's topic first, then the rest in flow order
+            start = question_count % len(TOPICS)
+            question = next(
+                (
+                    q
+                    for topic in TOPICS[start:] + TOPICS[:start]
+                    for q in plan.get(topic, [])
+                    if q not in used
+                ),
+                None
+            )
+
+            if question:
+                used.add(question)
+                self.conn.execute(
+                    "UPDATE interview_plans SET used = ? WHERE candidate_id = ?",
+                    (json.dumps(sorted(used)), candidate_id)
+                )
+
+        return question
+
+    async def _follow_up(self, planned: str, last_turn: Dict[str, Any]) -> str:
+        prompt = f"""
+You are a senior interviewer. The candidate's last answer was weak or evasive.
+Lightly adapt the planned next question so it follows up on that answer:
+narrow the scope or make it more concrete. Keep its topic. ONE question only.
+
+Last question: {clip(last_turn.get('question'), 120)}
+Candidate's answer: {clip(last_turn.get('answer'), 200)}
+Planned next question: {planned}
+
+Return ONLY the question text.
+"""
+
+        try:
+            adapted = await asyncio.wait_for(
+                ai_service.agenerate_completion(prompt, priority="interactive", max_tokens=200, fallback=planned),
+                timeout=self.follow_up_timeout
+            )
+        except Exception as e:
+            metrics.incr("interview_plan.follow_up_errors")
+            print("⚠️ Follow-up adaptation failed, asking planned question:", e)
+            return planned
+
+        adapted = re.sub(r"^\s*question\s*\d*\s*:\s*", "", adapted.strip(), flags=re.IGNORECASE)
+        return adapted or planned
+
+    async def next_question(
+        self,
+        candidate_id: str,
+        transcript: List[Dict[str, Any]],
+        question_count: int
+    ) -> str | None:
+        """
+        The next question from the plan as "Question N: ...", or None
+        when there is no plan (or it ran out).
+        """
+
+        if not self.enabled:
+            return None
+
+        question = await asyncio.to_thread(self._take, candidate_id, question_count)
+
+        if question is None:
+            metrics.incr("interview_plan.misses")
+            return None
+
+        last = transcript[-1] if transcript else None
+
+        if last and needs_follow_up(last.get("answer"), self.weak_answer_words):
+            metrics.incr("interview_plan.follow_ups")
+            question = await self._follow_up(question, last)
+        else:
+            metrics.incr("interview_plan.hits")
+
+        return f"Question {question_count + 1}: {question}"
+
+    def forget(self, candidate_id: str):
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM interview_plans WHERE candidate_id = ?",
+                (candidate_id,)
+            )
+
+
+interview_planner = InterviewPlanner(
+    enabled=config.INTERVIEW_PLAN_ENABLED,
+    questions_per_topic=config.INTERVIEW_PLAN_QUESTIONS_PER_TOPIC,
+    follow_up_timeout=config.INTERVIEW_PLAN_FOLLOW_UP_TIMEOUT_SECONDS,
+    weak_answer_words=config.INTERVIEW_PLAN_WEAK_ANSWER_WORDS
+)
@@ -4,8 +4,11 @@ from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 import uuid
 
-from backend.database import supabase
+from backend.repository import candidate_repo, session_repo
+from backend.services.answer_scoring import answer_scorer
 from backend.services.email_service import email_service
+from backend.services.interview_context import interview_context
+from backend.services.interview_planner import interview_planner
 from backend.config import config
 
 router = APIRouter()
@@ -35,31 +38,25 @@ def schedule_interview(payload: InterviewSchedulePayload):
     token = str(uuid.uuid4())
 
     # 2️⃣ FETCH CANDIDATE (🔥 THIS WAS MISSING)
-    candidate = (
-        supabase
-        .table("candidates")
-        .select("email, name")
-        .eq("id", payload.candidate_id)
-        .single()
-        .execute()
-        .data
-    )
+    candidate = candidate_repo.get(payload.candidate_id, "email, name")
 
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
     # 3️⃣ UPSERT INTERVIEW SESSION
-    supabase.table("ai_interview_sessions").upsert(
-        {
-            "candidate_id": payload.candidate_id,
-            "interview_token": token,
-            "scheduled_at": scheduled_utc.isoformat(),  # UTC stored
-            "expires_at": expires_at.isoformat(),       # UTC stored
-            "is_active": True,
-            "updated_at": datetime.utcnow().isoformat()
-        },
-        on_conflict="candidate_id"
-    ).execute()
+    session_repo.schedule({
+        "candidate_id": payload.candidate_id,
+        "interview_token": token,
+        "scheduled_at": scheduled_utc.isoformat(),  # UTC stored
+        "expires_at": expires_at.isoformat(),       # UTC stored
+        "is_active": True
+    })
+
+    # A new session starts clean: drop the plan, notes and answer scores
+    # an abandoned earlier interview may have left behind
+    interview_planner.forget(payload.candidate_id)
+    interview_context.forget(payload.candidate_id)
+    answer_scorer.forget(payload.candidate_id)
 
     # 4️⃣ SEND EMAIL
     interview_link = f"{config.INTERVIEW_UI_URL}?token={token}"
@@ -71,9 +68,6 @@ def schedule_interview(payload: InterviewSchedulePayload):
     )
 
     # 5️⃣ UPDATE CANDIDATE STATUS
-    supabase.table("candidates").update({
-        "status": "interview_sent",
-        "updated_at": datetime.utcnow().isoformat()
-    }).eq("id", payload.candidate_id).execute()
+    candidate_repo.set_status(payload.candidate_id, "interview_sent")
 
     return {"success": True}
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from typing import Dict
+
+from backend.repository import session_repo
+from backend.services.metrics import metrics
+
+
+# Consecutive failed transcript writes before a session stops retrying
+MAX_WRITE_FAILURES = 3
+
+
+class LiveInterview:
+    """
+    One interview held in memory for the lifetime of its WebSocket: the
+    session row, candidate, vacancy and transcript are loaded once.
+
+    Transcript changes are written back by a background task instead of
+    on the turn's critical path. At most one write is in flight; changes
+    made meanwhile collapse into the next write of the latest state.
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, session: dict, candidate: dict, vacancy: dict | None):
+        self.candidate_id = session["candidate_id"]
+        self.session = session
+        self.candidate = candidate
+        self.vacancy = vacancy
+        self.question_count = session.get("question_count") or 0
+        self.transcript = session.get("transcript") or []
+        self._version = 0
+        self._written = 0
+        self._writer: asyncio.Task | None = None
+
+    def record_answer(self, answer: str):
+        if not answer or not self.transcript:
+            return
+
+        self.transcript[-1]["answer"] = answer
+        self._changed()
+
+    def add_question(self, question: str):
+        self.transcript.append({
+            "question": question,
+            "answer": None
+        })
+        self.question_count += 1
+        self._changed()
+
+    def _changed(self):
+        self._version += 1
+
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.ensure_future(self._write())
+
+    async def _write(self):
+        failures = 0
+
+        while self._written < self._version:
+            version = self._version
+            row = {
+                "question_count": self.question_count,
+                "transcript": [dict(turn) for turn in self.transcript]
+            }
+
+            started = time.perf_counter()
+
+            try:
+                await asyncio.to_thread(session_repo.update_for_candidate, self.candidate_id, row)
+
+            except Exception as e:
+                failures += 1
+                metrics.incr("interview.persist_errors")
+                print(f"⚠️ Transcript write failed ({failures}/{MAX_WRITE_FAILURES}):", e)
+
+                if failures >= MAX_WRITE_FAILURES:
+                    return
+                await asyncio.sleep(failures)
+                continue
+
+            failures = 0
+            self._written = version
+            metrics.observe("interview.persist_seconds", time.perf_counter() - started)
+
+    @property
+    def persisted(self) -> bool:
+        return self._written >= self._version
+
+    async def flush(self) -> bool:
+        """
+        Waits for pending transcript writes; False if they gave up.
+        """
+
+        if not self.persisted and (self._writer is None or self._writer.done()):
+            self._writer = asyncio.ensure_future(self._write())
+
+        if self._writer is not None:
+            await asyncio.shield(self._writer)
+
+        return self.persisted
+
+
+# Open interview sockets, by candidate_id
+live_interviews: Dict[str, LiveInterview] = {}
@@ -0,0 +1,476 @@
+import json
+import os
+import random
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+from backend.config import config
+from backend.services.metrics import metrics
+from backend.services.state_store import connect, transaction
+
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    queue TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    run_at REAL NOT NULL,
+    locked_until REAL,
+    owner TEXT,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_jobs_ready
+    ON jobs (queue, status, run_at);
+"""
+
+QUEUE_STATUSES = ("queued", "running", "succeeded", "dead")
+
+
+# =====================================================
+# PERSISTENCE
+# =====================================================
+class JobQueue:
+    """
+    Durable job queue in the local state store, shared by every process
+    on the host.
+
+    A claimed job is invisible to other workers until `locked_until` (its
+    visibility timeout); the worker extends that lease while the handler
+    runs, and if the worker dies the job becomes claimable again once the
+    lease runs out. Failed attempts are retried with exponential backoff
+    until max_attempts, then the job is dead-lettered (`dead`, with its
+    last error) until requeued by hand.
+    """
+
+    def __init__(self):
+        self.conn = connect("jobs")
+        self.lock = threading.Lock()
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    def enqueue(
+        self,
+        queue: str,
+        payload: Dict[str, Any],
+        max_attempts: int | None = None,
+        delay: float = 0
+    ) -> str:
+        job_id = str(uuid4())
+        now = time.time()
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO jobs "
+                "(id, queue, payload, status, max_attempts, run_at, created_at) "
+                "VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (
+                    job_id,
+                    queue,
+                    json.dumps(payload),
+                    max_attempts or config.JOB_MAX_ATTEMPTS,
+                    now + delay,
+                    now
+                )
+            )
+
+        metrics.incr("jobs.enqueued", queue=queue)
+        return job_id
+
+    def claim(self, queues: List[str], owner: str, lease_seconds: float) -> Dict[str, Any] | None:
+        if not queues:
+            return None
+
+        now = time.time()
+        marks = ",".join("?" * len(queues))
+
+        with self.lock, transaction(self.conn):
+            # Out of attempts and its worker died mid-run again: a job that
+            # keeps killing its worker must not be handed out forever
+            dead = self.conn.execute(
+                f"UPDATE jobs SET status = 'dead', finished_at = ?, locked_until = NULL, "
+                f"last_error = 'Lease expired on the last attempt' "
+                f"WHERE queue IN ({marks}) AND status = 'running' AND locked_until < ? "
+                f"AND attempts >= max_attempts RETURNING queue",
+                (now, *queues, now)
+            ).fetchall()
+
+            row = self.conn.execute(
+                f"SELECT * FROM jobs WHERE queue IN ({marks}) AND ("
+                "(status = 'queued' AND run_at <= ?) OR "
+                "(status = 'running' AND locked_until < ?)"
+                ") ORDER BY run_at LIMIT 1",
+                (*queues, now, now)
+            ).fetchone()
+
+            if row:
+                self.conn.execute(
+                    "UPDATE jobs SET status = 'running', owner = ?, locked_until = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (owner, now + lease_seconds, row["id"])
+                )
+
+        for dead_row in dead:
+            metrics.incr("jobs.dead_lettered", queue=dead_row["queue"])
+
+        if not row:
+            return None
+
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] += 1
+
+        if row["status"] == "running":
+            metrics.incr("jobs.lease_expired", queue=job["queue"])
+            print(f"♻️ Job {job['id']} lease expired, retrying (attempt {job['attempts']})")
+
+        return job
+
+    def extend(self, job_ids: List[str], owner: str, lease_seconds: float):
+        if not job_ids:
+            return
+
+        marks = ",".join("?" * len(job_ids))
+
+        with self.lock:
+            self.conn.execute(
+                f"UPDATE jobs SET locked_until = ? "
+                f"WHERE id IN ({marks}) AND owner = ? AND status = 'running'",
+                (time.time() + lease_seconds, *job_ids, owner)
+            )
+
+    def complete(self, job_id: str, owner: str) -> bool:
+        with self.lock:
+            return self.conn.execute(
+                "UPDATE jobs SET status = 'succeeded', finished_at = ?, locked_until = NULL "
+                "WHERE id = ? AND owner = ? AND status = 'running'",
+                (time.time(), job_id, owner)
+            ).rowcount == 1
+
+    def fail(self, job: Dict[str, Any], owner: str, error: str, retry_delay: float | None) -> str:
+        now = time.time()
+
+        if retry_delay is None or job["attempts"] >= job["max_attempts"]:
+            status, run_at, finished_at = "dead", job["run_at"], now
+        else:
+            status, run_at, finished_at = "queued", now + retry_delay, None
+
+        with self.lock:
+            self.conn.execute(
+                "UPDATE jobs SET status = ?, run_at = ?, finished_at = ?, locked_until = NULL, "
+                "last_error = ? WHERE id = ? AND owner = ? AND status = 'running'",
+                (status, run_at, finished_at, error[:2000], job["id"], owner)
+            )
+
+        return status
+
+    def get(self, job_id: str) -> Dict[str, Any] | None:
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+        if not row:
+            return None
+
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        return job
+
+    def dead_letters(self, queue: str | None = None, limit: int = 50) -> List[Dict[str, Any]]:
+        query = "SELECT * FROM jobs WHERE status = 'dead'"
+        params: list = []
+
+        if queue:
+            query += " AND queue = ?"
+            params.append(queue)
+
+        with self.lock:
+            rows = self.conn.execute(
+                query + " ORDER BY finished_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+
+        jobs = [dict(row) for row in rows]
+        for job in jobs:
+            job["payload"] = json.loads(job["payload"])
+        return jobs
+
+    def requeue(self, job_id: str) -> bool:
+        """
+        Puts a dead-lettered job back on its queue with fresh attempts.
+        """
+
+        with self.lock:
+            return self.conn.execute(
+                "UPDATE jobs SET status = 'queued', attempts = 0, run_at = ?, owner = NULL, "
+                "finished_at = NULL WHERE id = ? AND status = 'dead'",
+                (time.time(), job_id)
+            ).rowcount == 1
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per queue: jobs ready to run, waiting on a retry delay, running and
+        dead-lettered, and the age of the oldest job ready to run.
+        """
+
+        now = time.time()
+
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT queue, "
+                "SUM(status = 'queued' AND run_at <= ?) AS ready, "
+                "SUM(status = 'queued' AND run_at > ?) AS delayed, "
+                "SUM(status = 'running') AS running, "
+                "SUM(status = 'dead') AS dead, "
+                "MIN(CASE WHEN status = 'queued' AND run_at <= ? THEN run_at END) AS oldest_run_at "
+                "FROM jobs WHERE status != 'succeeded' GROUP BY queue",
+                (now, now, now)
+            ).fetchall()
+
+        return {
+            row["queue"]: {
+                "depth": row["ready"] or 0,
+                "delayed": row["delayed"] or 0,
+                "running": row["running"] or 0,
+                "dead": row["dead"] or 0,
+                "oldest_age_seconds": round(now - row["oldest_run_at"], 1) if row["oldest_run_at"] else 0
+            }
+            for row in rows
+        }
+
+    def purge(self, older_than_seconds: float) -> int:
+        with self.lock:
+            return self.conn.execute(
+                "DELETE FROM jobs WHERE status = 'succeeded' AND finished_at < ?",
+                (time.time() - older_than_seconds,)
+            ).rowcount
+
+
+# =====================================================
+# EXECUTION
+# =====================================================
+class JobWorker:
+    """
+    Runs queued jobs in background threads of this process. Handlers are
+    plain functions of the job payload, registered per queue; raising
+    fails the attempt. A handler may run more than once for the same job
+    (retries, or a worker that died mid-job), so it must be idempotent.
+
+    A queue registered with a concurrency limit never has more than that
+    many jobs running in this process, whatever the backlog. With zero
+    threads the process only enqueues, and a separate worker process
+    (`python -m backend.worker`) runs the jobs.
+    """
+
+    def __init__(self, queue: JobQueue, threads: int, lease_seconds: float, poll_seconds: float):
+        self.queue = queue
+        self.threads = max(0, threads)
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self.limits: Dict[str, int] = {}
+        self.queues: List[str] | None = None
+        self._active: Dict[str, int] = {}
+        self._running: Dict[str, str] = {}
+        self._wake = threading.Event()
+        self._started = False
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        queue: str,
+        handler: Callable[[Dict[str, Any]], None],
+        concurrency: int | None = None
+    ):
+        self.handlers[queue] = handler
+        self._active.setdefault(queue, 0)
+
+        if concurrency:
+            self.limits[queue] = concurrency
+
+    def enqueue(self, queue: str, payload: Dict[str, Any], **kwargs) -> str:
+        job_id = self.queue.enqueue(queue, payload, **kwargs)
+        self._wake.set()
+        return job_id
+
+    def requeue(self, job_id: str) -> bool:
+        requeued = self.queue.requeue(job_id)
+        if requeued:
+            self._wake.set()
+        return requeued
+
+    def start(self, queues: List[str] | None = None):
+        """
+        Starts the worker threads, for the given queues only if any
+        (all registered queues otherwise).
+        """
+
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        unknown = set(queues or []) - set(self.handlers)
+        if unknown:
+            raise ValueError(f"No handler registered for queues: {', '.join(sorted(unknown))}")
+
+        self.queues = queues or None
+
+        purged = self.queue.purge(config.JOB_RETENTION_SECONDS)
+        if purged:
+            print(f"🧹 Purged {purged} finished jobs")
+
+        for i in range(self.threads):
+            threading.Thread(
+                target=self._loop,
+                name=f"job-worker-{i}",
+                daemon=True
+            ).start()
+
+        threading.Thread(
+            target=self._heartbeat,
+            name="job-worker-heartbeat",
+            daemon=True
+        ).start()
+
+        if self.threads:
+            print(f"👷 Job worker {WORKER_ID}: {self.threads} threads on {', '.join(self._served())}")
+
+    @staticmethod
+    def backoff(attempt: int) -> float:
+        delay = min(config.JOB_RETRY_MAX_SECONDS, config.JOB_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay)
+
+    def _served(self) -> List[str]:
+        return [q for q in self.handlers if self.queues is None or q in self.queues]
+
+    def refresh_gauges(self) -> Dict[str, Dict[str, Any]]:
+        stats = self.queue.stats()
+
+        for queue in set(stats) | set(self.handlers):
+            entry = stats.setdefault(queue, {
+                "depth": 0, "delayed": 0, "running": 0, "dead": 0, "oldest_age_seconds": 0
+            })
+            metrics.gauge("jobs.depth", entry["depth"], queue=queue)
+            metrics.gauge("jobs.delayed", entry["delayed"], queue=queue)
+            metrics.gauge("jobs.running", entry["running"], queue=queue)
+            metrics.gauge("jobs.dead", entry["dead"], queue=queue)
+            metrics.gauge("jobs.oldest_age_seconds", entry["oldest_age_seconds"], queue=queue)
+
+        return stats
+
+    def _heartbeat(self):
+        """
+        Keeps the leases of running jobs from expiring however long their
+        handler takes, and refreshes the queue gauges.
+        """
+
+        interval = max(1.0, self.lease_seconds / 3)
+
+        while True:
+            try:
+                with self._lock:
+                    running = list(self._running)
+
+                self.queue.extend(running, WORKER_ID, self.lease_seconds)
+                self.refresh_gauges()
+
+            except Exception as e:
+                print("⚠️ Job heartbeat failed:", e)
+
+            time.sleep(interval)
+
+    def _claim(self) -> Dict[str, Any] | None:
+        # Claim and take the concurrency slot in one step, so two threads
+        # never both take the last free slot of a queue
+        with self._lock:
+            open_queues = [
+                q for q in self._served()
+                if self._active[q] < self.limits.get(q, self.threads)
+            ]
+
+            job = self.queue.claim(open_queues, WORKER_ID, self.lease_seconds)
+
+            if job:
+                self._active[job["queue"]] += 1
+                self._running[job["id"]] = job["queue"]
+
+        return job
+
+    def _loop(self):
+        while True:
+            try:
+                job = self._claim()
+            except Exception as e:
+                print("⚠️ Job claim failed:", e)
+                job = None
+
+            if job is None:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+                continue
+
+            try:
+                self._run(job)
+            finally:
+                with self._lock:
+                    self._active[job["queue"]] -= 1
+                    self._running.pop(job["id"], None)
+
+                # A slot opened up, another thread may be waiting on it
+                self._wake.set()
+
+    def _run(self, job: Dict[str, Any]):
+        queue = job["queue"]
+        started = time.perf_counter()
+
+        # Enqueue (or retry delay) to first pickup
+        metrics.observe("jobs.wait_seconds", max(0.0, time.time() - job["run_at"]), queue=queue)
+
+        try:
+            self.handlers[queue](job["payload"])
+
+        except Exception as e:
+            status = self.queue.fail(job, WORKER_ID, f"{type(e).__name__}: {e}", self.backoff(job["attempts"]))
+            metrics.incr("jobs.failed_attempts", queue=queue)
+
+            if status == "dead":
+                metrics.incr("jobs.dead_lettered", queue=queue)
+                print(f"🪦 Job {job['id']} ({queue}) dead-lettered after {job['attempts']} attempts:", e)
+            else:
+                print(f"🔁 Job {job['id']} ({queue}) attempt {job['attempts']} failed, will retry:", e)
+            return
+
+        finally:
+            metrics.observe("jobs.run_seconds", time.perf_counter() - started, queue=queue)
+
+        if not self.queue.complete(job["id"], WORKER_ID):
+            # Lease ran out and another worker took the job over
+            metrics.incr("jobs.lease_lost", queue=queue)
+            print(f"⚠️ Job {job['id']} ({queue}) finished after losing its lease")
+            return
+
+        metrics.incr("jobs.succeeded", queue=queue)
+
+        # Enqueue to done, including retries and time spent queued
+        metrics.observe("jobs.latency_seconds", time.time() - job["created_at"], queue=queue)
+
+
+job_queue = JobQueue()
+job_worker = JobWorker(
+    job_queue,
+    threads=config.JOB_WORKER_THREADS,
+    lease_seconds=config.JOB_LEASE_SECONDS,
+    poll_seconds=config.JOB_POLL_SECONDS
+)
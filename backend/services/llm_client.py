@@ -0,0 +1,458 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import AsyncIterator, Awaitable, Callable, Dict, List
+
+from backend.config import config
+from backend.services.circuit_breaker import get_breaker
+from backend.services.llm_dispatch import PriorityDispatcher
+from backend.services.llm_providers import Completion, LLMProvider, build_providers
+from backend.services.metrics import metrics
+from backend.services.rate_limiter import estimate_tokens, rate_limiter
+from backend.services.retry_policy import retry_policy
+from backend.services.single_flight import SingleFlight, prompt_key
+
+
+# Latency samples older than this no longer influence routing, so a
+# provider that was slow gets traffic (and fresh samples) again
+ROUTING_WINDOW_SECONDS = 300
+
+
+class LLMClient:
+    """
+    One set of pooled provider clients shared by the whole process.
+
+    The clients live on a dedicated event-loop thread, so async endpoints
+    (acomplete) and the sync screening threads (complete) share the same
+    keep-alive connection pools, and a pending completion holds no worker
+    thread for async callers. Every call has a timeout; cancelling the
+    awaiting task cancels the HTTP request. Calls are admitted by priority
+    (interactive before batch) and then paced by the shared RPM/TPM rate
+    limiter before they are sent. Transient failures are retried per
+    retry_policy; the queue slot is given up while backing off. While a
+    provider's circuit breaker is open, calls fail fast with
+    CircuitOpenError instead of waiting out the timeout.
+
+    With several providers, each call goes to the one with the lowest
+    recent p50 latency (AI_PROVIDER until there are enough samples), and
+    providers with an open circuit are skipped. For hedged priorities, a
+    second provider is fired once the first has been running for its p95
+    latency, and the first good answer wins.
+
+    Concurrent calls with the same (whitespace-normalized) prompt are
+    coalesced into one upstream call whose answer they all receive.
+
+    astream yields text deltas as they arrive. Streams go to the top-ranked
+    provider and are neither hedged nor coalesced; they are only retried
+    until the first delta has been handed to the caller.
+    """
+
+    def __init__(
+        self,
+        providers: List[LLMProvider],
+        timeout: float,
+        max_in_flight: int,
+        aging_seconds: float,
+        preferred: str | None = None,
+        hedge_priorities: List[str] | None = None,
+        hedge_min_delay: float = 1.0,
+        routing_min_samples: int = 20,
+        coalesce: bool = True
+    ):
+        self.providers: Dict[str, LLMProvider] = {p.name: p for p in providers}
+        self.breakers = {p.name: get_breaker(p.name) for p in providers}
+        self.timeout = timeout
+        self.dispatcher = PriorityDispatcher(max_in_flight, aging_seconds)
+        self.preferred = preferred
+        self.hedge_priorities = set(hedge_priorities or [])
+        self.hedge_min_delay = hedge_min_delay
+        self.routing_min_samples = routing_min_samples
+        self.coalesce = coalesce
+        self.flights = SingleFlight("llm")
+        self._latencies = {p.name: deque(maxlen=200) for p in providers}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="llm-client",
+                    daemon=True
+                ).start()
+            return self._loop
+
+    # =========================
+    # ROUTING
+    # =========================
+    def latency(self, provider: str, quantile: float) -> float | None:
+        cutoff = time.monotonic() - ROUTING_WINDOW_SECONDS
+        samples = sorted(s for at, s in self._latencies[provider] if at >= cutoff)
+
+        if len(samples) < self.routing_min_samples:
+            return None
+
+        return samples[min(len(samples) - 1, int(len(samples) * quantile))]
+
+    def ranked_providers(self) -> List[LLMProvider]:
+        available = [
+            p for p in self.providers.values()
+            if self.breakers[p.name].available()
+        ]
+
+        # All circuits open: keep the order so the breaker reports the error
+        if not available:
+            return list(self.providers.values())
+
+        def score(provider: LLMProvider):
+            p50 = self.latency(provider.name, 0.5)
+            if p50 is not None:
+                return p50
+            return 0.0 if provider.name == self.preferred else float("inf")
+
+        return sorted(available, key=score)
+
+    async def _route(self, prompt: str, timeout: float, priority: str, max_tokens: int) -> str:
+        ranked = self.ranked_providers()
+        primary = ranked[0]
+
+        if priority not in self.hedge_priorities or len(ranked) < 2:
+            return await self._attempt(primary, prompt, timeout, max_tokens)
+
+        hedge_delay = max(self.hedge_min_delay, self.latency(primary.name, 0.95) or 0.0)
+        tasks = {asyncio.ensure_future(self._attempt(primary, prompt, timeout, max_tokens)): primary}
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done:
+                return done.pop().result()
+
+            backup = ranked[1]
+            metrics.incr("llm.hedges", provider=backup.name)
+            tasks[asyncio.ensure_future(self._attempt(backup, prompt, timeout, max_tokens))] = backup
+
+            pending = set(tasks)
+            error = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        metrics.incr("llm.hedge_wins", provider=tasks[task].name)
+                        return task.result()
+                    error = task.exception()
+
+            raise error
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    # =========================
+    # SENDING
+    # =========================
+    async def _throttle(self, key: str, tokens: int):
+        wait = await asyncio.to_thread(rate_limiter.reserve, key, tokens)
+
+        if wait > 0:
+            metrics.incr("llm.throttled", model=key)
+            await asyncio.sleep(wait)
+
+        metrics.observe("llm.throttle_wait_seconds", wait, model=key)
+
+    async def _retrying(
+        self,
+        priority: str,
+        timeout: float,
+        call: Callable[[float], Awaitable],
+        retryable: Callable[[], bool] = lambda: True
+    ):
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt_started = time.monotonic()
+
+            try:
+                async with self.dispatcher.slot(priority):
+                    remaining = retry_policy.deadline - (attempt_started - started)
+                    result = await call(
+                        timeout if attempt == 0 else min(timeout, max(1.0, remaining))
+                    )
+
+            except Exception as e:
+                delay = None
+                if retryable():
+                    delay = retry_policy.next_delay(e, attempt, time.monotonic() - started)
+
+                if delay is None:
+                    if attempt:
+                        metrics.incr("llm.retries_exhausted", priority=priority)
+                    raise
+
+                print(f"🔁 LLM retry {attempt + 1} in {delay:.1f}s: {retry_policy.reason(e)}")
+                metrics.incr("llm.retries", reason=retry_policy.reason(e))
+                metrics.observe("llm.retry_delay_seconds", delay, priority=priority)
+
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            if attempt:
+                # Latency the failed attempts and backoff added to this call
+                metrics.observe(
+                    "llm.retry_added_seconds",
+                    attempt_started - started,
+                    priority=priority
+                )
+
+            return result
+
+    async def _complete(self, prompt: str, timeout: float, priority: str, max_tokens: int) -> str:
+        return await self._retrying(
+            priority,
+            timeout,
+            lambda attempt_timeout: self._route(prompt, attempt_timeout, priority, max_tokens)
+        )
+
+    async def _stream(
+        self,
+        prompt: str,
+        timeout: float,
+        priority: str,
+        max_tokens: int,
+        emit: Callable[[str], None]
+    ) -> str:
+        emitted = False
+
+        def forward(delta: str):
+            nonlocal emitted
+            emitted = True
+            emit(delta)
+
+        # Text the caller has already seen cannot be taken back
+        return await self._retrying(
+            priority,
+            timeout,
+            lambda attempt_timeout: self._attempt(
+                self.ranked_providers()[0], prompt, attempt_timeout, max_tokens, forward
+            ),
+            retryable=lambda: not emitted
+        )
+
+    async def _attempt(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        timeout: float,
+        max_tokens: int,
+        emit: Callable[[str], None] | None = None
+    ) -> str:
+        breaker = self.breakers[provider.name]
+        trial = breaker.acquire()
+
+        try:
+            result = await self._send(provider, prompt, timeout, max_tokens, emit)
+
+        except asyncio.CancelledError:
+            breaker.record(None, trial)
+            raise
+
+        except Exception as e:
+            # Only provider-side failures count against the circuit
+            breaker.record(False if retry_policy.is_retryable(e) else None, trial)
+            raise
+
+        breaker.record(True, trial)
+        return result
+
+    async def _send(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        timeout: float,
+        max_tokens: int,
+        emit: Callable[[str], None] | None = None
+    ) -> str:
+        key = f"{provider.name}:{provider.model}"
+        estimated = estimate_tokens(prompt)
+        await self._throttle(key, estimated)
+
+        started = time.perf_counter()
+        self._in_flight += 1
+        metrics.gauge("llm.in_flight", self._in_flight)
+
+        try:
+            completion = await asyncio.wait_for(
+                provider.complete(prompt, max_tokens) if emit is None
+                else self._consume(provider, prompt, max_tokens, emit, started),
+                timeout=timeout
+            )
+
+        except asyncio.TimeoutError:
+            metrics.incr("llm.timeouts", provider=provider.name)
+            raise TimeoutError(f"LLM completion timed out after {timeout}s")
+
+        except asyncio.CancelledError:
+            metrics.incr("llm.cancelled", provider=provider.name)
+            raise
+
+        except Exception:
+            metrics.incr("llm.errors", provider=provider.name)
+            raise
+
+        finally:
+            self._in_flight -= 1
+            metrics.gauge("llm.in_flight", self._in_flight)
+
+        elapsed = time.perf_counter() - started
+        self._latencies[provider.name].append((time.monotonic(), elapsed))
+        metrics.observe("llm.completion_seconds", elapsed, provider=provider.name)
+
+        if completion.total_tokens is not None:
+            await asyncio.to_thread(
+                rate_limiter.settle, key, estimated, completion.total_tokens
+            )
+
+        if not completion.text or not completion.text.strip():
+            raise RuntimeError("Empty response from AI")
+
+        return completion.text.strip()
+
+    async def _consume(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        max_tokens: int,
+        emit: Callable[[str], None],
+        started: float
+    ) -> Completion:
+        parts = []
+
+        async for delta in provider.stream(prompt, max_tokens):
+            if not parts:
+                metrics.observe(
+                    "llm.ttft_seconds",
+                    time.perf_counter() - started,
+                    provider=provider.name
+                )
+            parts.append(delta)
+            emit(delta)
+
+        # Streams report no usage; the reserved estimate stands
+        return Completion("".join(parts), None)
+
+    async def _shared(self, prompt: str, timeout: float, priority: str, max_tokens: int) -> str:
+        if not self.coalesce:
+            return await self._complete(prompt, timeout, priority, max_tokens)
+
+        # The first caller's timeout and priority apply to the shared call
+        return await self.flights.do(
+            prompt_key(prompt, max_tokens),
+            lambda: self._complete(prompt, timeout, priority, max_tokens)
+        )
+
+    # =========================
+    # PUBLIC API
+    # =========================
+    def submit(
+        self,
+        prompt: str,
+        timeout: float | None = None,
+        priority: str = "batch",
+        max_tokens: int = 1500
+    ) -> Future:
+        return asyncio.run_coroutine_threadsafe(
+            self._shared(prompt, timeout or self.timeout, priority, max_tokens),
+            self._get_loop()
+        )
+
+    async def acomplete(
+        self,
+        prompt: str,
+        timeout: float | None = None,
+        priority: str = "interactive",
+        max_tokens: int = 1500
+    ) -> str:
+        # wrap_future propagates cancellation of this task to the request
+        return await asyncio.wrap_future(self.submit(prompt, timeout, priority, max_tokens))
+
+    def complete(
+        self,
+        prompt: str,
+        timeout: float | None = None,
+        priority: str = "batch",
+        max_tokens: int = 1500
+    ) -> str:
+        return self.submit(prompt, timeout, priority, max_tokens).result()
+
+    async def astream(
+        self,
+        prompt: str,
+        timeout: float | None = None,
+        priority: str = "interactive",
+        max_tokens: int = 1500
+    ) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue = asyncio.Queue()
+
+        def emit(delta: str):
+            loop.call_soon_threadsafe(deltas.put_nowait, delta)
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._stream(prompt, timeout or self.timeout, priority, max_tokens, emit),
+            self._get_loop()
+        )
+        # Queued after every delta, since both come from the client loop
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(deltas.put_nowait, None))
+
+        try:
+            while True:
+                delta = await deltas.get()
+                if delta is None:
+                    break
+                yield delta
+
+            future.result()
+
+        finally:
+            # Closing the generator early cancels the upstream request
+            future.cancel()
+
+    def shutdown(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+
+        if loop is None:
+            return
+
+        async def close():
+            for provider in self.providers.values():
+                await provider.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close(), loop).result(timeout=5)
+        except Exception as e:
+            print(f"⚠️ LLM client close failed: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+
+
+llm_client = LLMClient(
+    providers=build_providers(),
+    timeout=config.LLM_TIMEOUT_SECONDS,
+    max_in_flight=config.LLM_MAX_IN_FLIGHT,
+    aging_seconds=config.LLM_PRIORITY_AGING_SECONDS,
+    preferred=config.AI_PROVIDER,
+    hedge_priorities=[p.strip() for p in config.LLM_HEDGE_PRIORITIES.split(",") if p.strip()],
+    hedge_min_delay=config.LLM_HEDGE_MIN_DELAY_SECONDS,
+    routing_min_samples=config.LLM_ROUTING_MIN_SAMPLES,
+    coalesce=config.LLM_COALESCE_ENABLED
+)
@@ -0,0 +1,94 @@
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from typing import Dict
+
+from backend.services.metrics import metrics
+
+
+# Lower rank is served first
+PRIORITIES = {
+    "interactive": 0,   # live interview questions, evaluations
+    "batch": 1          # screening, email / name extraction
+}
+
+
+class PriorityDispatcher:
+    """
+    Admits at most max_in_flight LLM calls at a time (throttle wait plus
+    request); the rest queue by priority.
+
+    Each waiter is ordered by enqueue time + rank * aging_seconds, so an
+    interview call jumps every batch call that arrived less than
+    aging_seconds before it, while batch work that has waited longer than
+    that goes first. Batch work therefore always keeps moving.
+
+    Not thread-safe: only used from the LLM client's event loop.
+    """
+
+    def __init__(self, max_in_flight: int, aging_seconds: float):
+        self.max_in_flight = max(1, max_in_flight)
+        self.aging_seconds = aging_seconds
+        self._active = 0
+        self._heap = []
+        self._seq = itertools.count()
+        self._queued: Dict[str, int] = {p: 0 for p in PRIORITIES}
+
+    def _release(self):
+        while self._heap:
+            _, _, priority, waiter = heapq.heappop(self._heap)
+
+            if not waiter.done():
+                # Hand the slot straight to the next waiter
+                self._queued[priority] -= 1
+                metrics.gauge("llm.dispatch_queued", self._queued[priority], priority=priority)
+                waiter.set_result(None)
+                return
+
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: str):
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown LLM priority: {priority}")
+
+        enqueued_at = time.monotonic()
+
+        if self._active < self.max_in_flight and not self._heap:
+            self._active += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._heap, (
+                enqueued_at + PRIORITIES[priority] * self.aging_seconds,
+                next(self._seq),
+                priority,
+                waiter
+            ))
+            self._queued[priority] += 1
+            metrics.gauge("llm.dispatch_queued", self._queued[priority], priority=priority)
+
+            try:
+                await waiter
+
+            except asyncio.CancelledError:
+                if waiter.cancelled():
+                    # Still queued; _release skips it when popped
+                    self._queued[priority] -= 1
+                    metrics.gauge("llm.dispatch_queued", self._queued[priority], priority=priority)
+                else:
+                    # Slot was handed over just as we were cancelled
+                    self._release()
+                raise
+
+        metrics.observe(
+            "llm.dispatch_wait_seconds",
+            time.monotonic() - enqueued_at,
+            priority=priority
+        )
+
+        try:
+            yield
+        finally:
+            self._release()
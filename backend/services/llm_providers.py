@@ -0,0 +1,256 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Callable, List, NamedTuple
+
+import httpx
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from backend.config import config
+
+
+class Completion(NamedTuple):
+    text: str
+    total_tokens: int | None
+
+
+def _http_client(max_connections: int, timeout: float) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections
+        ),
+        timeout=httpx.Timeout(timeout, connect=10.0)
+    )
+
+
+class LLMProvider(ABC):
+    """
+    One chat-completion backend. SDK clients are created lazily, on the
+    LLM client's event loop, and keep a pooled HTTP client for reuse.
+    """
+
+    name = "base"
+
+    def __init__(self, model: str):
+        self.model = model
+
+    @abstractmethod
+    async def complete(self, prompt: str, max_tokens: int) -> Completion:
+        ...
+
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """
+        Text deltas as the model produces them. Providers without streaming
+        yield the whole completion once.
+        """
+
+        completion = await self.complete(prompt, max_tokens)
+        yield completion.text
+
+    async def close(self):
+        pass
+
+
+class OpenAIProvider(LLMProvider):
+    name = "openai"
+
+    def __init__(self, api_key: str, model: str, max_connections: int, timeout: float):
+        super().__init__(model)
+        self.api_key = api_key
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+        self._client: AsyncOpenAI | None = None
+
+    def _get_client(self) -> AsyncOpenAI:
+        if self._client is None:
+            self._client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=0,  # retry_policy decides
+                http_client=_http_client(self.max_connections, self.timeout)
+            )
+        return self._client
+
+    async def complete(self, prompt: str, max_tokens: int) -> Completion:
+        # GPT-5 / GPT-5-mini compatible: no max_tokens / temperature
+        response = await self._get_client().chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        return Completion(
+            response.choices[0].message.content,
+            response.usage.total_tokens if response.usage else None
+        )
+
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        response = await self._get_client().chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+
+        try:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await response.close()
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class AnthropicProvider(LLMProvider):
+    name = "anthropic"
+
+    def __init__(self, api_key: str, model: str, max_connections: int, timeout: float):
+        super().__init__(model)
+        self.api_key = api_key
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+        self._client: AsyncAnthropic | None = None
+
+    def _get_client(self) -> AsyncAnthropic:
+        if self._client is None:
+            self._client = AsyncAnthropic(
+                api_key=self.api_key,
+                max_retries=0,
+                http_client=_http_client(self.max_connections, self.timeout)
+            )
+        return self._client
+
+    async def complete(self, prompt: str, max_tokens: int) -> Completion:
+        response = await self._get_client().messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        return Completion(
+            "".join(block.text for block in response.content if block.type == "text"),
+            response.usage.input_tokens + response.usage.output_tokens
+        )
+
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        async with self._get_client().messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        ) as response:
+            async for text in response.text_stream:
+                yield text
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class StubProvider(LLMProvider):
+    """
+    Local provider for tests and benchmarks. Sleeps `latency` seconds
+    (`tail_latency` for a `tail_ratio` share of calls), fails a
+    `failure_rate` share with TimeoutError, and answers with `respond`.
+    Streams deliver the first word after `first_token_latency` and the
+    rest spread over the remaining latency.
+    """
+
+    def __init__(
+        self,
+        name: str = "stub",
+        latency: float = 0.5,
+        tail_latency: float = 0.0,
+        tail_ratio: float = 0.0,
+        failure_rate: float = 0.0,
+        respond: Callable[[str], str] | None = None,
+        first_token_latency: float | None = None,
+        seed: int | None = None
+    ):
+        super().__init__(model=f"{name}-model")
+        self.name = name
+        self.latency = latency
+        self.tail_latency = tail_latency
+        self.tail_ratio = tail_ratio
+        self.failure_rate = failure_rate
+        self.respond = respond
+        self.first_token_latency = first_token_latency
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    async def complete(self, prompt: str, max_tokens: int) -> Completion:
+        self.calls += 1
+
+        slow = self._random.random() < self.tail_ratio
+        await asyncio.sleep(self.tail_latency if slow else self.latency)
+
+        if self._random.random() < self.failure_rate:
+            raise TimeoutError(f"{self.name} stub failure")
+
+        text = self.respond(prompt) if self.respond else f"{self.name} answer"
+        return Completion(text, len(prompt) // 4 + len(text) // 4)
+
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        self.calls += 1
+
+        slow = self._random.random() < self.tail_ratio
+        latency = self.tail_latency if slow else self.latency
+        text = self.respond(prompt) if self.respond else f"{self.name} answer"
+        words = text.split(" ")
+
+        first = self.first_token_latency
+        if first is None:
+            first = latency / len(words)
+        first = min(first, latency)
+
+        await asyncio.sleep(first)
+
+        if self._random.random() < self.failure_rate:
+            raise TimeoutError(f"{self.name} stub failure")
+
+        for i, word in enumerate(words):
+            if i:
+                await asyncio.sleep((latency - first) / (len(words) - 1))
+            yield word if i == 0 else " " + word
+
+
+def build_providers() -> List[LLMProvider]:
+    """
+    Providers named in LLM_PROVIDERS, skipping those without an API key.
+    """
+
+    providers = []
+
+    for name in [n.strip() for n in config.LLM_PROVIDERS.split(",") if n.strip()]:
+        if name == "openai" and config.OPENAI_API_KEY:
+            providers.append(OpenAIProvider(
+                config.OPENAI_API_KEY,
+                config.AI_MODEL,
+                config.LLM_MAX_CONNECTIONS,
+                config.LLM_TIMEOUT_SECONDS
+            ))
+        elif name == "anthropic" and config.ANTHROPIC_API_KEY:
+            providers.append(AnthropicProvider(
+                config.ANTHROPIC_API_KEY,
+                config.ANTHROPIC_MODEL,
+                config.LLM_MAX_CONNECTIONS,
+                config.LLM_TIMEOUT_SECONDS
+            ))
+        elif name == "stub":
+            providers.append(StubProvider())
+        else:
+            print(f"⚠️ LLM provider '{name}' skipped (unknown or no API key)")
+
+    if not providers:
+        # Keep the old behaviour: fail on first use, not at import
+        providers.append(OpenAIProvider(
+            config.OPENAI_API_KEY,
+            config.AI_MODEL,
+            config.LLM_MAX_CONNECTIONS,
+            config.LLM_TIMEOUT_SECONDS
+        ))
+
+    return providers
@@ -0,0 +1,77 @@
+import threading
+from collections import defaultdict, deque
+from typing import Any, Dict
+
+
+def _key(name: str, labels: Dict[str, Any]) -> str:
+    if not labels:
+        return name
+    inner = ",".join(f"{k}={labels[k]}" for k in sorted(labels))
+    return f"{name}{{{inner}}}"
+
+
+class Metrics:
+    """
+    In-process counters, gauges and latency summaries exposed on /metrics.
+    Timings keep the last 1000 samples per series for percentiles.
+    """
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._window = window
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, Dict[str, Any]] = {}
+
+    def incr(self, name: str, value: float = 1, **labels):
+        with self._lock:
+            self._counters[_key(name, labels)] += value
+
+    def gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges[_key(name, labels)] = value
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = _key(name, labels)
+
+        with self._lock:
+            series = self._timings.get(key)
+            if series is None:
+                series = self._timings[key] = {
+                    "count": 0,
+                    "sum": 0.0,
+                    "max": 0.0,
+                    "samples": deque(maxlen=self._window)
+                }
+
+            series["count"] += 1
+            series["sum"] += seconds
+            series["max"] = max(series["max"], seconds)
+            series["samples"].append(seconds)
+
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(_key(name, labels), 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            timings = {}
+
+            for key, series in self._timings.items():
+                samples = sorted(series["samples"])
+                timings[key] = {
+                    "count": series["count"],
+                    "avg": round(series["sum"] / series["count"], 4),
+                    "p50": round(samples[len(samples) // 2], 4),
+                    "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+                    "max": round(series["max"], 4)
+                }
+
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": timings
+            }
+
+
+metrics = Metrics()
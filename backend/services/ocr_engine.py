@@ -0,0 +1,143 @@
+import queue
+import threading
+from abc import ABC, abstractmethod
+
+import pytesseract
+
+from backend.config import config
+
+try:
+    # Optional: in-process libtesseract bindings (pip install tesserocr)
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+
+class OCREngine(ABC):
+    name = "base"
+
+    @abstractmethod
+    def recognize(self, image) -> str:
+        ...
+
+
+class PytesseractEngine(OCREngine):
+    """
+    Spawns a `tesseract` process (and reloads language data) per call.
+    """
+
+    name = "pytesseract"
+
+    def __init__(self, lang: str):
+        self.lang = lang
+
+    def recognize(self, image) -> str:
+        return pytesseract.image_to_string(image, lang=self.lang, config="--psm 6")
+
+
+class TesserocrPoolEngine(OCREngine):
+    """
+    Pool of long-lived PyTessBaseAPI recognizers. Language data is loaded
+    once per recognizer, and tesserocr releases the GIL while recognizing,
+    so `size` pages can be OCRed in parallel threads.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, size: int, lang: str, acquire_timeout: float = 60):
+        self.size = max(1, size)
+        self.lang = lang
+        self.acquire_timeout = acquire_timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            grow = self._created < self.size
+            if grow:
+                self._created += 1
+
+        if grow:
+            try:
+                return tesserocr.PyTessBaseAPI(lang=self.lang, psm=tesserocr.PSM.SINGLE_BLOCK)
+            except Exception:
+                # Give the slot back, or a pool that never built anything
+                # would leave every later caller waiting on an empty queue
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise RuntimeError(
+                f"No tesserocr recognizer free after {self.acquire_timeout}s"
+            ) from None
+
+    def recognize(self, image) -> str:
+        api = self._acquire()
+
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+        finally:
+            api.Clear()
+            self._idle.put(api)
+
+
+_engine: OCREngine | None = None
+_fallback: OCREngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OCREngine:
+    """
+    Engine selected by OCR_ENGINE (auto | tesserocr | pytesseract), created
+    once per process. "auto" uses the tesserocr pool when it is installed.
+    """
+
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            choice = config.OCR_ENGINE
+
+            if choice in ("auto", "tesserocr") and tesserocr is not None:
+                _engine = TesserocrPoolEngine(
+                    config.OCR_ENGINE_POOL_SIZE,
+                    config.OCR_LANG,
+                    acquire_timeout=config.OCR_ENGINE_ACQUIRE_TIMEOUT
+                )
+            else:
+                if choice == "tesserocr":
+                    print("⚠️ tesserocr not installed, falling back to pytesseract")
+                _engine = PytesseractEngine(config.OCR_LANG)
+
+        return _engine
+
+
+def recognize(image) -> str:
+    global _fallback
+
+    engine = get_ocr_engine()
+
+    try:
+        return engine.recognize(image)
+
+    except Exception as e:
+        if isinstance(engine, PytesseractEngine):
+            raise
+
+        print(f"⚠️ {engine.name} OCR failed, retrying with pytesseract: {e}")
+
+        with _engine_lock:
+            if _fallback is None:
+                _fallback = PytesseractEngine(config.OCR_LANG)
+
+        return _fallback.recognize(image)
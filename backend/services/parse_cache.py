@@ -0,0 +1,234 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, List
+
+from backend.config import config
+from backend.services.state_store import connect
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parsed_documents (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ocr_pages (
+    doc_hash TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    dpi INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (doc_hash, page, dpi)
+);
+
+CREATE TABLE IF NOT EXISTS parse_cache_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_parsed_documents_access ON parsed_documents (last_access);
+CREATE INDEX IF NOT EXISTS idx_ocr_pages_access ON ocr_pages (last_access);
+"""
+
+
+def content_hash(file_content: bytes) -> str:
+    return hashlib.sha256(file_content).hexdigest()
+
+
+class ParseCache:
+    """
+    Persistent cache of resume parsing, keyed on the SHA-256 of the upload.
+
+    Whole parse results are cached per document (and per parser settings),
+    OCR output per page, so a re-applying candidate's PDF is never OCRed
+    twice. Both tables share one byte budget with LRU eviction. Counters
+    live in the database because parsing runs in worker processes.
+    """
+
+    # Bump when parse_pdf_detailed output changes for the same input
+    PARSER_VERSION = "1"
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.conn = connect("parse_cache")
+        self.lock = threading.Lock()
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def document_key(cls, doc_hash: str) -> str:
+        settings = (
+            cls.PARSER_VERSION,
+            config.OCR_DPI,
+            config.OCR_EARLY_STOP_CHARS,
+            config.OCR_PARSE_MODE,
+            config.OCR_TEXT_PAGE_MIN_CHARS,
+            config.OCR_IMAGE_PAGE_MIN_CHARS
+        )
+        return f"{doc_hash}:{':'.join(str(s) for s in settings)}"
+
+    def _incr(self, name: str, value: int = 1):
+        self.conn.execute(
+            "INSERT INTO parse_cache_counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, value)
+        )
+
+    # =========================
+    # DOCUMENTS
+    # =========================
+    def get_document(self, doc_hash: str) -> Dict[str, Any] | None:
+        key = self.document_key(doc_hash)
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT result FROM parsed_documents WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row:
+                self.conn.execute(
+                    "UPDATE parsed_documents SET last_access = ? WHERE key = ?",
+                    (time.time(), key)
+                )
+
+            self._incr("document_hits" if row else "document_misses")
+
+        return json.loads(row["result"]) if row else None
+
+    def put_document(self, doc_hash: str, result: Dict[str, Any]):
+        payload = json.dumps(result)
+        now = time.time()
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO parsed_documents "
+                "(key, result, bytes, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (self.document_key(doc_hash), payload, len(payload), now, now)
+            )
+            self._evict()
+
+    # =========================
+    # OCR PAGES
+    # =========================
+    def get_pages(self, doc_hash: str, pages: List[int], dpi: int) -> Dict[int, str]:
+        if not pages:
+            return {}
+
+        placeholders = ",".join("?" for _ in pages)
+
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT page, text FROM ocr_pages "
+                f"WHERE doc_hash = ? AND dpi = ? AND page IN ({placeholders})",
+                (doc_hash, dpi, *pages)
+            ).fetchall()
+
+            if rows:
+                self.conn.execute(
+                    f"UPDATE ocr_pages SET last_access = ? "
+                    f"WHERE doc_hash = ? AND dpi = ? AND page IN ({placeholders})",
+                    (time.time(), doc_hash, dpi, *pages)
+                )
+
+            self._incr("page_hits", len(rows))
+            self._incr("page_misses", len(pages) - len(rows))
+
+        return {r["page"]: r["text"] for r in rows}
+
+    def put_pages(self, doc_hash: str, dpi: int, texts: Dict[int, str]):
+        if not texts:
+            return
+
+        now = time.time()
+
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ocr_pages "
+                "(doc_hash, page, dpi, text, bytes, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (doc_hash, page, dpi, text, len(text.encode("utf-8")), now, now)
+                    for page, text in texts.items()
+                ]
+            )
+            self._evict()
+
+    # =========================
+    # EVICTION / STATS
+    # =========================
+    def _size(self) -> int:
+        return self.conn.execute(
+            "SELECT (SELECT COALESCE(SUM(bytes), 0) FROM parsed_documents) + "
+            "(SELECT COALESCE(SUM(bytes), 0) FROM ocr_pages)"
+        ).fetchone()[0]
+
+    def _evict(self):
+        size = self._size()
+        if size <= self.max_bytes:
+            return
+
+        # Oldest entries across both tables until back under budget
+        rows = self.conn.execute(
+            "SELECT 'doc' AS kind, key AS k1, NULL AS k2, NULL AS k3, bytes, last_access "
+            "FROM parsed_documents "
+            "UNION ALL "
+            "SELECT 'page', doc_hash, page, dpi, bytes, last_access FROM ocr_pages "
+            "ORDER BY last_access ASC"
+        ).fetchall()
+
+        evicted = 0
+        for row in rows:
+            if size <= self.max_bytes:
+                break
+
+            if row["kind"] == "doc":
+                self.conn.execute("DELETE FROM parsed_documents WHERE key = ?", (row["k1"],))
+            else:
+                self.conn.execute(
+                    "DELETE FROM ocr_pages WHERE doc_hash = ? AND page = ? AND dpi = ?",
+                    (row["k1"], row["k2"], row["k3"])
+                )
+
+            size -= row["bytes"]
+            evicted += 1
+
+        self._incr("evictions", evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            counters = {
+                r["name"]: r["value"]
+                for r in self.conn.execute("SELECT name, value FROM parse_cache_counters")
+            }
+            documents = self.conn.execute("SELECT COUNT(*) FROM parsed_documents").fetchone()[0]
+            pages = self.conn.execute("SELECT COUNT(*) FROM ocr_pages").fetchone()[0]
+            size = self._size()
+
+        def rate(hits: str, misses: str):
+            total = counters.get(hits, 0) + counters.get(misses, 0)
+            return round(counters.get(hits, 0) / total, 3) if total else None
+
+        return {
+            "documents": documents,
+            "ocr_pages": pages,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "document_hits": counters.get("document_hits", 0),
+            "document_misses": counters.get("document_misses", 0),
+            "document_hit_rate": rate("document_hits", "document_misses"),
+            "page_hits": counters.get("page_hits", 0),
+            "page_misses": counters.get("page_misses", 0),
+            "page_hit_rate": rate("page_hits", "page_misses"),
+            "evictions": counters.get("evictions", 0)
+        }
+
+
+parse_cache = ParseCache(max_bytes=config.PARSE_CACHE_MAX_BYTES)
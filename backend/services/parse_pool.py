@@ -0,0 +1,142 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Tuple
+
+from backend.config import config
+from backend.services.metrics import metrics
+from backend.services.parse_cache import content_hash, parse_cache
+from backend.services.resume_parser import ResumeParser
+
+
+class ParseQueueFullError(RuntimeError):
+    pass
+
+
+def _parse_in_worker(
+    file_content: bytes,
+    filename: str,
+    submitted_at: float
+) -> Tuple[Dict[str, Any], float, float]:
+    started_at = time.time()
+
+    if filename.lower().endswith(".pdf"):
+        parsed = ResumeParser.parse_pdf_detailed(file_content)
+    else:
+        parsed = {"text": ResumeParser.parse_text(file_content), "pages": []}
+
+    return parsed, started_at - submitted_at, time.time() - started_at
+
+
+class ResumeParsePool:
+    """
+    Runs PyPDF2 / OCR in worker processes so a scanned resume never
+    blocks the event loop. At most max_workers parses run at once and
+    max_queue more may wait; anything beyond that is rejected.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, timeout: float):
+        self.max_workers = max(1, max_workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: workers must not inherit the server's threads/sockets
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _reserve(self):
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                metrics.incr("resume_parse.rejected")
+                raise ParseQueueFullError("Resume parser is busy, please retry shortly")
+
+            self._in_flight += 1
+            metrics.gauge("resume_parse.in_flight", self._in_flight)
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+            metrics.gauge("resume_parse.in_flight", self._in_flight)
+
+    async def parse(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+        """
+        Returns {"text": ..., "pages": [{page, source, chars}, ...]}.
+        """
+
+        is_pdf = (filename or "").lower().endswith(".pdf")
+        doc_hash = None
+
+        # Repeat uploads of the same PDF skip the pool entirely
+        if is_pdf and config.PARSE_CACHE_ENABLED:
+            doc_hash = content_hash(file_content)
+            started = time.perf_counter()
+            cached = await asyncio.to_thread(parse_cache.get_document, doc_hash)
+
+            if cached is not None:
+                metrics.observe("resume_parse.cache_hit_seconds", time.perf_counter() - started)
+                return cached
+
+        self._reserve()
+
+        try:
+            future = self._get_executor().submit(
+                _parse_in_worker,
+                file_content,
+                filename or "",
+                time.time()
+            )
+        except Exception:
+            self._release()
+            raise
+
+        # The slot is held until the worker is really done, even on timeout
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            parsed, queue_wait, parse_seconds = await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            metrics.incr("resume_parse.timeouts")
+            raise
+
+        metrics.observe("resume_parse.queue_wait_seconds", queue_wait)
+        metrics.observe("resume_parse.seconds", parse_seconds)
+
+        for page in parsed["pages"]:
+            metrics.incr("resume_parse.pages", source=page["source"])
+
+        # Never pin a transient OCR failure in the cache
+        cacheable = parsed["text"] and not any(
+            p["source"] == "ocr_failed" for p in parsed["pages"]
+        )
+
+        if doc_hash and cacheable:
+            await asyncio.to_thread(parse_cache.put_document, doc_hash, parsed)
+
+        return parsed
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+resume_parse_pool = ResumeParsePool(
+    max_workers=config.RESUME_PARSE_WORKERS,
+    max_queue=config.RESUME_PARSE_MAX_QUEUE,
+    timeout=config.RESUME_PARSE_TIMEOUT_SECONDS
+)
@@ -0,0 +1,98 @@
+import threading
+import time
+
+from backend.config import config
+from backend.services.state_store import connect, transaction
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_buckets (
+    name TEXT PRIMARY KEY,
+    level REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def estimate_tokens(prompt: str, completion_tokens: int | None = None) -> int:
+    # ~4 characters per token for English text, plus the expected completion
+    if completion_tokens is None:
+        completion_tokens = config.LLM_RATE_LIMIT_COMPLETION_TOKENS
+    return len(prompt or "") // 4 + completion_tokens
+
+
+class TokenBucketRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budgets per model, kept in
+    SQLite so every uvicorn worker on the host draws from the same buckets.
+
+    reserve() never fails: it debits the call (a bucket may go negative)
+    and returns how long the caller must sleep before sending, so bursts
+    are paced in arrival order instead of being answered with 429s.
+    A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.conn = connect("rate_limits")
+        self.lock = threading.Lock()
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    def reserve(self, key: str, tokens: int) -> float:
+        now = time.time()
+        wait = 0.0
+
+        buckets = (
+            (f"{key}:requests", self.rpm, 1),
+            (f"{key}:tokens", self.tpm, min(tokens, self.tpm))
+        )
+
+        with self.lock, transaction(self.conn):
+            for name, per_minute, cost in buckets:
+                if per_minute <= 0:
+                    continue
+
+                row = self.conn.execute(
+                    "SELECT level, updated_at FROM rate_buckets WHERE name = ?",
+                    (name,)
+                ).fetchone()
+
+                level = per_minute
+                if row:
+                    refill = (now - row["updated_at"]) * per_minute / 60
+                    level = min(per_minute, row["level"] + refill)
+
+                level -= cost
+                if level < 0:
+                    wait = max(wait, -level * 60 / per_minute)
+
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO rate_buckets (name, level, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    (name, level, now)
+                )
+
+        return wait
+
+    def settle(self, key: str, estimated: int, actual: int):
+        """
+        Corrects the token bucket once the real usage is known.
+        """
+
+        if self.tpm <= 0 or estimated == actual:
+            return
+
+        with self.lock:
+            self.conn.execute(
+                "UPDATE rate_buckets SET level = MIN(?, level + ?) WHERE name = ?",
+                (self.tpm, min(estimated, self.tpm) - actual, f"{key}:tokens")
+            )
+
+
+rate_limiter = TokenBucketRateLimiter(
+    rpm=config.LLM_RATE_LIMIT_RPM,
+    tpm=config.LLM_RATE_LIMIT_TPM
+)
@@ -1,197 +1,383 @@
-import io
-import re
-import uuid
-from typing import Dict
-
-import PyPDF2
-from pdf2image import convert_from_bytes
-import pytesseract
-
-
-class ResumeParser:
-    @staticmethod
-    def parse_pdf(file_content: bytes) -> str:
-        """
-        Hybrid PDF parser:
-        1) Try PyPDF2 (text-based PDFs)
-        2) Fallback to OCR (Canva / scanned PDFs)
-        """
-
-        text = ""
-
-        # =========================
-        # 1️⃣ PyPDF2 (FAST PATH)
-        # =========================
-        try:
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-
-            for page in pdf_reader.pages:
-                extracted = page.extract_text() or ""
-                text += extracted + "\n"
-
-        except Exception as e:
-            print(f"⚠️ PyPDF2 parsing failed: {e}")
-
-        # =========================
-        # 2️⃣ OCR FALLBACK
-        # =========================
-        if not text or len(text.strip()) < 50:
-            print("⚠️ OCR fallback triggered (image-based PDF detected)")
-
-            try:
-                images = convert_from_bytes(file_content, dpi=300)
-                ocr_text = []
-
-                for img in images:
-                    ocr_text.append(
-                        pytesseract.image_to_string(
-                            img,
-                            config="--psm 6"
-                        )
-                    )
-
-                text = "\n".join(ocr_text)
-
-            except Exception as e:
-                print(f"❌ OCR failed: {e}")
-
-        return text.strip()
-
-    @staticmethod
-    def parse_text(file_content: bytes) -> str:
-        try:
-            return file_content.decode("utf-8", errors="ignore")
-        except Exception as e:
-            print(f"❌ Error parsing text file: {e}")
-            return ""
-
-
-
-    @staticmethod
-    def _normalize_email_context(text: str) -> str:
-        if not text:
-            return ""
-
-   
-        text = re.sub(r"\s+@", "@", text)
-        text = re.sub(r"@\s+", "@", text)
-        text = re.sub(r"\s+\.", ".", text)
-        text = re.sub(r"\.\s+", ".", text)
-
-    
-        text = re.sub(
-            r'([a-zA-Z])\s+([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
-            r'\1\2',
-            text
-        )
-
-        return text
-
-
-
-    @staticmethod
-    def extract_basic_info(resume_text: str) -> Dict[str, str]:
-        """
-        VERY conservative extraction.
-        Name extraction is intentionally strict.
-        AI will refine later in screening stage.
-        """
-
-        info = {
-            "name": "",
-            "email": "",
-            "phone": ""
-        }
-
-
-        
-        if not resume_text or len(resume_text.strip()) < 30:
-            # 🔥 Absolute fallback
-            info["email"] = ResumeParser._generate_fallback_email()
-            info["name"] = ""
-            return info
-            
-        normalized_text = ResumeParser._normalize_email_context(resume_text)
-
-        emails = re.findall(
-            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-            normalized_text
-        )
-
-        def _is_sane_email(email: str) -> bool:
-            local = email.split("@")[0]
-            return any(c.isalpha() for c in local)
-
-
-        if emails:
-            sane_emails = [e for e in emails if _is_sane_email(e)]
-            info["email"] = sane_emails[0] if sane_emails else emails[0]
-
-
-            
-        lines = resume_text.split("\n")
-
-
-        # =========================
-        # 📞 PHONE
-        # =========================
-        phone_match = re.search(
-            r'(\+?\d{1,3}[\s\-]?)?\(?\d{3,4}\)?[\s\-]?\d{3}[\s\-]?\d{3,4}',
-            resume_text
-        )
-        if phone_match:
-            info["phone"] = phone_match.group(0)
-
-        # =========================
-        # 👤 NAME (STRICT TOP LINES)
-        # =========================
-        for line in lines[:5]:
-            clean = line.strip()
-
-            if not clean:
-                continue
-
-            if any(x in clean.lower() for x in [
-                "resume", "curriculum", "vitae", "profile",
-                "summary", "engineer", "developer", "intern",
-                "student", "b.tech", "m.tech", "linkedin", "github"
-            ]):
-                continue
-
-            if "@" in clean or any(char.isdigit() for char in clean):
-                continue
-
-            if re.match(r"^[A-Z][a-z]+(?:\s[A-Z][a-z]+){1,2}$", clean):
-                info["name"] = clean
-                break
-
-        # =========================
-        # 🚨 GUARANTEES
-        # =========================
-       
-
-        if not info["name"]:
-            info["name"] = ""
-
-        return info
-
-    @staticmethod
-    def _generate_fallback_email() -> str:
-        return f"auto_{uuid.uuid4().hex[:10]}@resume.local"
-
-
-resume_parser = ResumeParser()
-
-
-
-
-
-
-
-
-
-
-
-
-
+import io
+import re
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import PyPDF2
+from pdf2image import convert_from_path, pdfinfo_from_path
+
+from backend.config import config
+from backend.services import ocr_engine
+from backend.services.ocr_preprocess import preprocess
+from backend.services.parse_cache import content_hash, parse_cache
+
+
+class ResumeParser:
+    @staticmethod
+    def parse_pdf(file_content: bytes) -> str:
+        return ResumeParser.parse_pdf_detailed(file_content)["text"]
+
+    @staticmethod
+    def parse_pdf_detailed(file_content: bytes, mode: str | None = None) -> Dict[str, Any]:
+        """
+        Hybrid PDF parser, decided per page:
+        1) PyPDF2 text layer for every page
+        2) OCR only for pages without a usable text layer
+           (Canva / scanned pages, image pages with just a footer)
+
+        Returns the text plus per-page {page, source, chars} metadata,
+        where source is "text", "ocr", "empty", "skipped" (early stop)
+        or "ocr_failed". `mode` is the OCR preprocessing preset
+        (fast | accurate | off, default OCR_PARSE_MODE).
+        """
+
+        layer = []
+
+        # =========================
+        # 1️⃣ PyPDF2 (FAST PATH)
+        # =========================
+        try:
+            pdf_file = io.BytesIO(file_content)
+            pdf_reader = PyPDF2.PdfReader(pdf_file)
+
+            for page in pdf_reader.pages:
+                layer.append((
+                    page.extract_text() or "",
+                    ResumeParser._page_has_images(page)
+                ))
+
+        except Exception as e:
+            print(f"⚠️ PyPDF2 parsing failed: {e}")
+            layer = []
+
+        # =========================
+        # 2️⃣ PER-PAGE OCR
+        # =========================
+        if layer:
+            ocr_targets = [
+                n for n, (text, has_images) in enumerate(layer, start=1)
+                if ResumeParser._needs_ocr(text, has_images)
+            ]
+        else:
+            ocr_targets = None  # unreadable by PyPDF2 → OCR everything
+
+        ocr_text: Dict[int, str] = {}
+        ocr_failed = False
+
+        if ocr_targets is None or ocr_targets:
+            print(f"⚠️ OCR triggered for pages: {ocr_targets or 'all'}")
+
+            recovered = sum(
+                len(text.strip())
+                for n, (text, _) in enumerate(layer, start=1)
+                if n not in (ocr_targets or [])
+            )
+
+            try:
+                ocr_text = ResumeParser.ocr_pages(
+                    file_content,
+                    page_numbers=ocr_targets,
+                    already_recovered=recovered,
+                    mode=mode
+                )
+
+            except Exception as e:
+                print(f"❌ OCR failed: {e}")
+                ocr_failed = True
+
+        # =========================
+        # 3️⃣ MERGE
+        # =========================
+        pages = []
+        page_count = len(layer) or (max(ocr_text) if ocr_text else 0)
+
+        for n in range(1, page_count + 1):
+            text = layer[n - 1][0] if layer else ""
+            source = "text"
+
+            if n in ocr_text and len(ocr_text[n].strip()) > len(text.strip()):
+                text = ocr_text[n]
+                source = "ocr"
+            elif ocr_targets is not None and n in ocr_targets and n not in ocr_text:
+                source = "ocr_failed" if ocr_failed else "skipped"
+
+            if not text.strip() and source == "text":
+                source = "empty"
+
+            pages.append({"page": n, "source": source, "text": text})
+
+        return {
+            "text": "\n".join(p["text"] for p in pages).strip(),
+            "pages": [
+                {"page": p["page"], "source": p["source"], "chars": len(p["text"].strip())}
+                for p in pages
+            ]
+        }
+
+    @staticmethod
+    def _needs_ocr(text: str, has_images: bool) -> bool:
+        chars = len(text.strip())
+
+        if chars < config.OCR_TEXT_PAGE_MIN_CHARS:
+            return True
+
+        # An image page whose only text is a header/footer
+        return has_images and chars < config.OCR_IMAGE_PAGE_MIN_CHARS
+
+    @staticmethod
+    def _page_has_images(page) -> bool:
+        try:
+            resources = page.get("/Resources")
+            resources = resources.get_object() if resources is not None else None
+            xobjects = resources.get("/XObject") if resources else None
+
+            if xobjects is None:
+                return False
+
+            xobjects = xobjects.get_object()
+
+            return any(
+                xobjects[name].get_object().get("/Subtype") == "/Image"
+                for name in xobjects
+            )
+
+        except Exception:
+            return False
+
+    @staticmethod
+    def _ocr_page(pdf_path: str, page_number: int, dpi: int, mode: str) -> str:
+        # Render exactly one page so only `workers` page images are ever in memory
+        images = convert_from_path(
+            pdf_path,
+            dpi=dpi,
+            first_page=page_number,
+            last_page=page_number
+        )
+
+        try:
+            return "\n".join(ocr_engine.recognize(preprocess(img, mode)) for img in images)
+        finally:
+            for img in images:
+                img.close()
+
+    @staticmethod
+    def ocr_pages(
+        file_content: bytes,
+        page_numbers: List[int] | None = None,
+        workers: int | None = None,
+        early_stop_chars: int | None = None,
+        dpi: int | None = None,
+        already_recovered: int = 0,
+        mode: str | None = None
+    ) -> Dict[int, str]:
+        """
+        Page-streaming OCR: pages are rendered and recognized in small
+        parallel batches (one page per worker), and recognition stops early
+        once `early_stop_chars` of text have been recovered (0 = never),
+        counting `already_recovered` characters from text-layer pages.
+        `mode` picks the image preprocessing preset (see ocr_preprocess).
+        """
+
+        workers = max(1, workers or config.OCR_PAGE_WORKERS)
+        early_stop_chars = (
+            config.OCR_EARLY_STOP_CHARS if early_stop_chars is None else early_stop_chars
+        )
+        dpi = dpi or config.OCR_DPI
+        mode = mode or config.OCR_PARSE_MODE
+
+        results: Dict[int, str] = {}
+        doc_hash = None
+        if config.PARSE_CACHE_ENABLED:
+            # Text differs per preprocessing mode, so pages are cached per mode
+            doc_hash = f"{content_hash(file_content)}:{mode}"
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as pdf_file:
+            pdf_file.write(file_content)
+            pdf_file.flush()
+
+            if page_numbers is None:
+                page_count = pdfinfo_from_path(pdf_file.name)["Pages"]
+                page_numbers = list(range(1, page_count + 1))
+
+            if doc_hash:
+                results.update(parse_cache.get_pages(doc_hash, page_numbers, dpi))
+
+            pending = [n for n in page_numbers if n not in results]
+            recovered = already_recovered + sum(len(t.strip()) for t in results.values())
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for i in range(0, len(pending), workers):
+                    if early_stop_chars and recovered >= early_stop_chars:
+                        print(f"⚡ OCR early stop after {len(results)}/{len(page_numbers)} pages")
+                        break
+
+                    batch = pending[i:i + workers]
+                    texts = dict(zip(batch, pool.map(
+                        lambda n: ResumeParser._ocr_page(pdf_file.name, n, dpi, mode),
+                        batch
+                    )))
+
+                    if doc_hash:
+                        parse_cache.put_pages(doc_hash, dpi, texts)
+
+                    results.update(texts)
+                    recovered += sum(len(t.strip()) for t in texts.values())
+
+        return results
+
+    @staticmethod
+    def ocr_pdf(
+        file_content: bytes,
+        workers: int | None = None,
+        early_stop_chars: int | None = None,
+        dpi: int | None = None,
+        mode: str | None = None
+    ) -> str:
+        pages = ResumeParser.ocr_pages(
+            file_content,
+            workers=workers,
+            early_stop_chars=early_stop_chars,
+            dpi=dpi,
+            mode=mode
+        )
+        return "\n".join(pages[n] for n in sorted(pages))
+
+    @staticmethod
+    def parse_text(file_content: bytes) -> str:
+        try:
+            return file_content.decode("utf-8", errors="ignore")
+        except Exception as e:
+            print(f"❌ Error parsing text file: {e}")
+            return ""
+
+
+
+    @staticmethod
+    def _normalize_email_context(text: str) -> str:
+        if not text:
+            return ""
+
+   
+        text = re.sub(r"\s+@", "@", text)
+        text = re.sub(r"@\s+", "@", text)
+        text = re.sub(r"\s+\.", ".", text)
+        text = re.sub(r"\.\s+", ".", text)
+
+    
+        text = re.sub(
+            r'([a-zA-Z])\s+([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+            r'\1\2',
+            text
+        )
+
+        return text
+
+
+
+    @staticmethod
+    def extract_basic_info(resume_text: str) -> Dict[str, str]:
+        """
+        VERY conservative extraction.
+        Name extraction is intentionally strict.
+        AI will refine later in screening stage.
+        """
+
+        info = {
+            "name": "",
+            "email": "",
+            "phone": ""
+        }
+
+
+        
+        if not resume_text or len(resume_text.strip()) < 30:
+            # 🔥 Absolute fallback
+            info["email"] = ResumeParser._generate_fallback_email()
+            info["name"] = ""
+            return info
+            
+        normalized_text = ResumeParser._normalize_email_context(resume_text)
+
+        emails = re.findall(
+            r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+            normalized_text
+        )
+
+        def _is_sane_email(email: str) -> bool:
+            local = email.split("@")[0]
+            return any(c.isalpha() for c in local)
+
+
+        if emails:
+            sane_emails = [e for e in emails if _is_sane_email(e)]
+            info["email"] = sane_emails[0] if sane_emails else emails[0]
+
+
+            
+        lines = resume_text.split("\n")
+
+
+        # =========================
+        # 📞 PHONE
+        # =========================
+        phone_match = re.search(
+            r'(\+?\d{1,3}[\s\-]?)?\(?\d{3,4}\)?[\s\-]?\d{3}[\s\-]?\d{3,4}',
+            resume_text
+        )
+        if phone_match:
+            info["phone"] = phone_match.group(0)
+
+        # =========================
+        # 👤 NAME (STRICT TOP LINES)
+        # =========================
+        for line in lines[:5]:
+            clean = line.strip()
+
+            if not clean:
+                continue
+
+            if any(x in clean.lower() for x in [
+                "resume", "curriculum", "vitae", "profile",
+                "summary", "engineer", "developer", "intern",
+                "student", "b.tech", "m.tech", "linkedin", "github"
+            ]):
+                continue
+
+            if "@" in clean or any(char.isdigit() for char in clean):
+                continue
+
+            if re.match(r"^[A-Z][a-z]+(?:\s[A-Z][a-z]+){1,2}$", clean):
+                info["name"] = clean
+                break
+
+        # =========================
+        # 🚨 GUARANTEES
+        # =========================
+       
+
+        if not info["name"]:
+            info["name"] = ""
+
+        return info
+
+    @staticmethod
+    def _generate_fallback_email() -> str:
+        return f"auto_{uuid.uuid4().hex[:10]}@resume.local"
+
+
+resume_parser = ResumeParser()
+
+
+
+
+
+
+
+
+
+
+
+
+
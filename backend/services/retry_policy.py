@@ -0,0 +1,97 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import anthropic
+import openai
+
+from backend.config import config
+
+
+# Statuses worth another attempt; everything else (400, 401, 403, 404, 422) is fatal
+RETRYABLE_STATUSES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for LLM completions.
+
+    Only transient failures (timeouts, connection errors, 429 / 5xx) are
+    retried. A Retry-After header from the provider wins over the computed
+    backoff. No retry is attempted once it could not finish within
+    `deadline` seconds of the first attempt.
+    """
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float, deadline: float):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    @staticmethod
+    def reason(exc: Exception) -> str:
+        status = getattr(exc, "status_code", None)
+        return str(status) if status else type(exc).__name__
+
+    @staticmethod
+    def is_retryable(exc: Exception) -> bool:
+        if isinstance(exc, (TimeoutError, openai.APIConnectionError, anthropic.APIConnectionError)):
+            return True
+
+        if isinstance(exc, (openai.APIStatusError, anthropic.APIStatusError)):
+            return exc.status_code in RETRYABLE_STATUSES
+
+        return False
+
+    @staticmethod
+    def retry_after(exc: Exception) -> float | None:
+        response = getattr(exc, "response", None)
+        if response is None:
+            return None
+
+        headers = response.headers
+
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+
+            value = headers.get("retry-after")
+            if not value:
+                return None
+
+            if value.isdigit():
+                return float(value)
+
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def next_delay(self, exc: Exception, attempt: int, elapsed: float) -> float | None:
+        """
+        Seconds to sleep before attempt `attempt + 1`, or None to give up.
+        `attempt` counts from 0 for the first call.
+        """
+
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(exc):
+            return None
+
+        delay = self.retry_after(exc)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if elapsed + delay >= self.deadline:
+            return None
+
+        return delay
+
+
+retry_policy = RetryPolicy(
+    max_attempts=config.LLM_RETRY_MAX_ATTEMPTS,
+    base_delay=config.LLM_RETRY_BASE_DELAY_SECONDS,
+    max_delay=config.LLM_RETRY_MAX_DELAY_SECONDS,
+    deadline=config.LLM_RETRY_DEADLINE_SECONDS
+)
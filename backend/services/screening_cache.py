@@ -0,0 +1,183 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List
+
+from backend.config import config
+from backend.services.metrics import metrics
+from backend.services.state_store import connect, transaction
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS screening_cache (
+    key TEXT PRIMARY KEY,
+    vacancy_id TEXT,
+    vacancy_hash TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_screening_cache_vacancy
+    ON screening_cache (vacancy_id, vacancy_hash);
+
+CREATE INDEX IF NOT EXISTS idx_screening_cache_access
+    ON screening_cache (last_access);
+"""
+
+# Only these vacancy fields reach the screening prompt
+VACANCY_PROMPT_FIELDS = (
+    "job_role",
+    "experience_level",
+    "required_skills",
+    "culture_traits",
+    "description"
+)
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def vacancy_fingerprint(vacancy_data: Dict[str, Any]) -> str:
+    return _sha256(json.dumps(
+        {f: vacancy_data.get(f) for f in VACANCY_PROMPT_FIELDS},
+        sort_keys=True,
+        default=str
+    ))
+
+
+class ScreeningCache:
+    """
+    Content-addressed cache of parsed screening completions.
+
+    The key covers the normalized resume text, the vacancy prompt fields,
+    the model and the prompt version, so an edited vacancy or a new prompt
+    simply misses. Entries expire after a TTL and the least recently used
+    ones are evicted past SCREENING_CACHE_MAX_ENTRIES.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.conn = connect("screening_cache")
+        self.lock = threading.Lock()
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    @staticmethod
+    def make_key(
+        resume_text: str,
+        vacancy_hash: str,
+        model: str,
+        prompt_version: str,
+        variant: List[str] | None = None
+    ) -> str:
+        normalized = re.sub(r"\s+", " ", resume_text or "").strip()
+
+        return _sha256("|".join([
+            _sha256(normalized),
+            vacancy_hash,
+            model or "",
+            prompt_version,
+            ",".join(variant or [])
+        ]))
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT result, created_at FROM screening_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row and now - row["created_at"] > self.ttl_seconds:
+                self.conn.execute("DELETE FROM screening_cache WHERE key = ?", (key,))
+                row = None
+
+            if row:
+                self.conn.execute(
+                    "UPDATE screening_cache SET last_access = ? WHERE key = ?",
+                    (now, key)
+                )
+
+        if not row:
+            metrics.incr("screening_cache.misses")
+            return None
+
+        metrics.incr("screening_cache.hits")
+        return json.loads(row["result"])
+
+    def put(
+        self,
+        key: str,
+        vacancy_id: str | None,
+        vacancy_hash: str,
+        result: Dict[str, Any]
+    ):
+        now = time.time()
+
+        with self.lock, transaction(self.conn):
+            # Entries scored against an older version of this vacancy are dead
+            if vacancy_id:
+                stale = self.conn.execute(
+                    "DELETE FROM screening_cache WHERE vacancy_id = ? AND vacancy_hash != ?",
+                    (vacancy_id, vacancy_hash)
+                ).rowcount
+                if stale:
+                    metrics.incr("screening_cache.invalidations", stale)
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO screening_cache "
+                "(key, vacancy_id, vacancy_hash, result, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, vacancy_id, vacancy_hash, json.dumps(result), now, now)
+            )
+
+            self.conn.execute(
+                "DELETE FROM screening_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,)
+            )
+
+            overflow = self.conn.execute(
+                "SELECT COUNT(*) FROM screening_cache"
+            ).fetchone()[0] - self.max_entries
+
+            if overflow > 0:
+                self.conn.execute(
+                    "DELETE FROM screening_cache WHERE key IN ("
+                    "SELECT key FROM screening_cache ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+                metrics.incr("screening_cache.evictions", overflow)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            entries = self.conn.execute(
+                "SELECT COUNT(*) FROM screening_cache"
+            ).fetchone()[0]
+
+        hits = metrics.counter("screening_cache.hits")
+        misses = metrics.counter("screening_cache.misses")
+
+        return {
+            "enabled": config.SCREENING_CACHE_ENABLED,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": int(hits),
+            "misses": int(misses),
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            "evictions": int(metrics.counter("screening_cache.evictions")),
+            "invalidations": int(metrics.counter("screening_cache.invalidations"))
+        }
+
+
+screening_cache = ScreeningCache(
+    ttl_seconds=config.SCREENING_CACHE_TTL_SECONDS,
+    max_entries=config.SCREENING_CACHE_MAX_ENTRIES
+)
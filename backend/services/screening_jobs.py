@@ -0,0 +1,516 @@
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from uuid import uuid4
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.config import config
+from backend.repository import candidate_repo
+from backend.services.ai_service import ai_service
+from backend.services.batch_screening import batch_screening_engine
+from backend.services.job_queue import job_worker
+from backend.services.state_store import connect, transaction
+
+router = APIRouter()
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS screening_jobs (
+    id TEXT PRIMARY KEY,
+    vacancy_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    owner TEXT,
+    heartbeat_at REAL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+
+CREATE TABLE IF NOT EXISTS screening_job_items (
+    job_id TEXT NOT NULL,
+    candidate_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    result TEXT,
+    error TEXT,
+    finished_at REAL,
+    PRIMARY KEY (job_id, candidate_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_screening_jobs_status
+    ON screening_jobs (status, heartbeat_at);
+
+CREATE INDEX IF NOT EXISTS idx_screening_job_items_finished
+    ON screening_job_items (job_id, finished_at);
+"""
+
+
+def _iso(ts: float | None) -> str | None:
+    return datetime.utcfromtimestamp(ts).isoformat() if ts else None
+
+
+# =====================================================
+# PERSISTENCE
+# =====================================================
+class ScreeningJobStore:
+    def __init__(self):
+        self.conn = connect("screening_jobs")
+        self.lock = threading.Lock()
+
+        with self.lock:
+            self.conn.executescript(SCHEMA)
+
+    def create(self, vacancy_id: str, candidate_ids: List[str], owner: str) -> Tuple[str, bool]:
+        """
+        Returns (job_id, created). The active-job check and the insert share
+        one write transaction, so two concurrent submits for the same vacancy
+        (from any worker process) end up with a single job.
+        """
+
+        job_id = str(uuid4())
+        now = time.time()
+
+        with self.lock, transaction(self.conn):
+            existing = self._active_for_vacancy(vacancy_id)
+            if existing:
+                return existing, False
+
+            self.conn.execute(
+                "INSERT INTO screening_jobs "
+                "(id, vacancy_id, status, total, owner, heartbeat_at, created_at) "
+                "VALUES (?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, vacancy_id, len(candidate_ids), owner, now, now)
+            )
+            self.conn.executemany(
+                "INSERT INTO screening_job_items (job_id, candidate_id) VALUES (?, ?)",
+                [(job_id, cid) for cid in candidate_ids]
+            )
+
+        return job_id, True
+
+    def active_for_vacancy(self, vacancy_id: str) -> str | None:
+        with self.lock:
+            return self._active_for_vacancy(vacancy_id)
+
+    def _active_for_vacancy(self, vacancy_id: str) -> str | None:
+        row = self.conn.execute(
+            "SELECT id FROM screening_jobs "
+            "WHERE vacancy_id = ? AND status IN (?, ?) "
+            "ORDER BY created_at DESC LIMIT 1",
+            (vacancy_id, *ACTIVE_STATUSES)
+        ).fetchone()
+
+        return row["id"] if row else None
+
+    def claim_stale(self, owner: str, stale_before: float) -> List[str]:
+        """
+        Takes over jobs whose owner stopped heartbeating (crash / redeploy).
+        The conditional UPDATE makes the claim atomic across workers.
+        """
+
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT id FROM screening_jobs "
+                "WHERE status IN (?, ?) AND heartbeat_at < ?",
+                (*ACTIVE_STATUSES, stale_before)
+            ).fetchall()
+
+            claimed = []
+            for row in rows:
+                cur = self.conn.execute(
+                    "UPDATE screening_jobs SET owner = ?, heartbeat_at = ? "
+                    "WHERE id = ? AND status IN (?, ?) AND heartbeat_at < ?",
+                    (owner, time.time(), row["id"], *ACTIVE_STATUSES, stale_before)
+                )
+                if cur.rowcount == 1:
+                    claimed.append(row["id"])
+
+        return claimed
+
+    def heartbeat(self, job_ids: List[str], owner: str):
+        if not job_ids:
+            return
+
+        with self.lock:
+            self.conn.executemany(
+                "UPDATE screening_jobs SET heartbeat_at = ? WHERE id = ? AND owner = ?",
+                [(time.time(), job_id, owner) for job_id in job_ids]
+            )
+
+    def mark_running(self, job_id: str):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE screening_jobs SET status = 'running', "
+                "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (time.time(), job_id)
+            )
+
+    def finish(self, job_id: str, status: str):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE screening_jobs SET status = ?, finished_at = ? WHERE id = ?",
+                (status, time.time(), job_id)
+            )
+
+    def pending_candidates(self, job_id: str) -> List[str]:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT candidate_id FROM screening_job_items "
+                "WHERE job_id = ? AND status = 'pending'",
+                (job_id,)
+            ).fetchall()
+
+        return [r["candidate_id"] for r in rows]
+
+    def record(self, job_id: str, outcome: Dict[str, Any], status: str | None = None):
+        status = status or ("succeeded" if outcome["success"] else "failed")
+
+        with self.lock:
+            self.conn.execute(
+                "UPDATE screening_job_items "
+                "SET status = ?, result = ?, error = ?, finished_at = ? "
+                "WHERE job_id = ? AND candidate_id = ?",
+                (
+                    status,
+                    json.dumps(outcome.get("data")) if outcome.get("data") is not None else None,
+                    outcome.get("error"),
+                    time.time(),
+                    job_id,
+                    outcome["candidate_id"]
+                )
+            )
+
+    def get(self, job_id: str) -> Dict[str, Any] | None:
+        with self.lock:
+            job = self.conn.execute(
+                "SELECT * FROM screening_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+
+            if not job:
+                return None
+
+            counts = {
+                r["status"]: r["n"]
+                for r in self.conn.execute(
+                    "SELECT status, COUNT(*) AS n FROM screening_job_items "
+                    "WHERE job_id = ? GROUP BY status",
+                    (job_id,)
+                )
+            }
+
+        return self._progress(dict(job), counts)
+
+    def finished_items(self, job_id: str, since: float = 0) -> List[Dict[str, Any]]:
+        """
+        Items finished at or after `since` (a finished_at timestamp), so a
+        poller only reads what changed since its last pass.
+        """
+
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT candidate_id, status, result, error, finished_at "
+                "FROM screening_job_items "
+                "WHERE job_id = ? AND status != 'pending' AND finished_at >= ? "
+                "ORDER BY finished_at",
+                (job_id, since)
+            ).fetchall()
+
+        return [
+            {
+                "candidate_id": r["candidate_id"],
+                "status": r["status"],
+                "data": json.loads(r["result"]) if r["result"] else None,
+                "error": r["error"],
+                "finished_at": _iso(r["finished_at"]),
+                "finished_ts": r["finished_at"]
+            }
+            for r in rows
+        ]
+
+    @staticmethod
+    def _progress(job: Dict[str, Any], counts: Dict[str, int]) -> Dict[str, Any]:
+        succeeded = counts.get("succeeded", 0)
+        failed = counts.get("failed", 0)
+        skipped = counts.get("skipped", 0)
+        done = succeeded + failed + skipped
+        remaining = job["total"] - done
+
+        elapsed = None
+        throughput = None
+        eta = None
+
+        if job["started_at"]:
+            elapsed = (job["finished_at"] or time.time()) - job["started_at"]
+
+            if elapsed > 0 and done:
+                rate = done / elapsed
+                throughput = round(rate * 60, 2)
+                eta = round(remaining / rate, 1)
+
+        return {
+            "job_id": job["id"],
+            "vacancy_id": job["vacancy_id"],
+            "status": job["status"],
+            "total": job["total"],
+            "completed": done,
+            "succeeded": succeeded,
+            "failed": failed,
+            "skipped": skipped,
+            "remaining": remaining,
+            "elapsed_seconds": round(elapsed, 3) if elapsed is not None else None,
+            "throughput_per_minute": throughput,
+            "eta_seconds": eta if job["status"] in ACTIVE_STATUSES else 0,
+            "created_at": _iso(job["created_at"]),
+            "started_at": _iso(job["started_at"]),
+            "finished_at": _iso(job["finished_at"])
+        }
+
+
+# =====================================================
+# EXECUTION
+# =====================================================
+class ScreeningJobManager:
+    """
+    Runs persisted batch screening jobs in background threads.
+
+    A supervisor thread heartbeats the jobs this worker owns and adopts
+    jobs whose owner went silent, so a crashed or redeployed worker's run
+    resumes from its last unscreened candidate.
+    """
+
+    def __init__(self, store: ScreeningJobStore):
+        self.store = store
+        self._running: Dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+        self._supervisor: threading.Thread | None = None
+
+    def start(self):
+        if self._supervisor:
+            return
+
+        self._supervisor = threading.Thread(
+            target=self._supervise,
+            name="screening-jobs-supervisor",
+            daemon=True
+        )
+        self._supervisor.start()
+
+    def submit(self, vacancy_id: str, candidate_ids: List[str]) -> str:
+        job_id, created = self.store.create(vacancy_id, candidate_ids, WORKER_ID)
+        if created:
+            self._launch(job_id, resumed=False)
+
+        return job_id
+
+    def _launch(self, job_id: str, resumed: bool):
+        with self._lock:
+            if job_id in self._running:
+                return
+
+            thread = threading.Thread(
+                target=self._run,
+                args=(job_id, resumed),
+                name=f"screening-job-{job_id[:8]}",
+                daemon=True
+            )
+            self._running[job_id] = thread
+
+        thread.start()
+
+    def _supervise(self):
+        interval = max(1, config.SCREENING_JOB_STALE_SECONDS // 3)
+
+        while True:
+            try:
+                with self._lock:
+                    owned = list(self._running)
+
+                self.store.heartbeat(owned, WORKER_ID)
+
+                stale_before = time.time() - config.SCREENING_JOB_STALE_SECONDS
+                for job_id in self.store.claim_stale(WORKER_ID, stale_before):
+                    print("♻️ RESUMING SCREENING JOB:", job_id)
+                    self._launch(job_id, resumed=True)
+
+            except Exception as e:
+                print("⚠️ Screening job supervisor error:", e)
+
+            time.sleep(interval)
+
+    def _skip_already_screened(self, job_id: str, candidate_ids: List[str]) -> List[str]:
+        """
+        A worker can die after screen_resume committed but before the item
+        was recorded; those candidates are no longer "new" and must not be
+        screened (and emailed) twice.
+        """
+
+        statuses = {
+            r["id"]: r["status"]
+            for r in candidate_repo.get_many(candidate_ids, "id, status")
+        }
+        pending = []
+
+        for cid in candidate_ids:
+            if statuses.get(cid) == "new":
+                pending.append(cid)
+            else:
+                self.store.record(
+                    job_id,
+                    {"candidate_id": cid, "success": True, "data": None},
+                    status="skipped"
+                )
+
+        return pending
+
+    def _run(self, job_id: str, resumed: bool):
+        try:
+            job = self.store.get(job_id)
+            vacancy_id = job["vacancy_id"]
+
+            self.store.mark_running(job_id)
+
+            pending = self.store.pending_candidates(job_id)
+            if resumed and pending:
+                pending = self._skip_already_screened(job_id, pending)
+
+            batch_screening_engine.run(
+                pending,
+                lambda candidate_id: ai_service.screen_resume(candidate_id, vacancy_id),
+                on_result=lambda outcome: self.store.record(job_id, outcome)
+            )
+
+            self.store.finish(job_id, "completed")
+            print("✅ SCREENING JOB COMPLETED:", job_id)
+
+        except Exception as e:
+            print("❌ SCREENING JOB FAILED:", job_id, str(e))
+            self.store.finish(job_id, "failed")
+
+        finally:
+            with self._lock:
+                self._running.pop(job_id, None)
+
+
+screening_job_store = ScreeningJobStore()
+screening_job_manager = ScreeningJobManager(screening_job_store)
+
+
+# =====================================================
+# SINGLE CANDIDATE (JOB QUEUE)
+# =====================================================
+SCREENING_QUEUE = "screening.candidate"
+
+
+def _screen_candidate(job: dict):
+    """
+    Screens one newly added candidate. Runs on the job queue, so it may
+    run again after a crash: a candidate that is no longer "new" was
+    already screened (and possibly emailed) and is skipped.
+    """
+
+    candidate = candidate_repo.get(job["candidate_id"], "status")
+
+    if not candidate or candidate["status"] != "new":
+        print("⏭️ Screening skipped, candidate not new:", job["candidate_id"])
+        return
+
+    ai_service.screen_resume(job["candidate_id"], job["vacancy_id"])
+
+
+job_worker.register(
+    SCREENING_QUEUE,
+    _screen_candidate,
+    concurrency=config.SCREENING_QUEUE_CONCURRENCY
+)
+
+
+# =====================================================
+# ENDPOINTS
+# =====================================================
+@router.post("/screening/batch", status_code=202)
+def batch_screen_resumes(vacancy_id: str):
+
+    candidate_ids = candidate_repo.ids_with_status(vacancy_id, "new")
+
+    if not candidate_ids:
+        return {
+            "success": True,
+            "job_id": None,
+            "message": "No new candidates to screen"
+        }
+
+    job_id = screening_job_manager.submit(vacancy_id, candidate_ids)
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "data": screening_job_store.get(job_id)
+    }
+
+
+@router.get("/screening/jobs/{job_id}")
+def get_screening_job(job_id: str, include_results: bool = False):
+    job = screening_job_store.get(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Screening job not found")
+
+    if include_results:
+        job["results"] = [
+            {k: v for k, v in item.items() if k != "finished_ts"}
+            for item in screening_job_store.finished_items(job_id)
+        ]
+
+    return {"success": True, "data": job}
+
+
+@router.get("/screening/jobs/{job_id}/events")
+async def stream_screening_job(job_id: str):
+    if not await asyncio.to_thread(screening_job_store.get, job_id):
+        raise HTTPException(status_code=404, detail="Screening job not found")
+
+    async def events():
+        since = 0
+        sent = set()
+
+        while True:
+            items = await asyncio.to_thread(screening_job_store.finished_items, job_id, since)
+
+            for item in items:
+                finished_ts = item.pop("finished_ts")
+                if finished_ts > since:
+                    since = finished_ts
+                    sent.clear()
+
+                # Items sharing the cursor timestamp are read again next pass
+                if item["candidate_id"] in sent:
+                    continue
+
+                sent.add(item["candidate_id"])
+                yield f"event: candidate\ndata: {json.dumps(item)}\n\n"
+
+            job = await asyncio.to_thread(screening_job_store.get, job_id)
+            yield f"event: progress\ndata: {json.dumps(job)}\n\n"
+
+            if job["status"] not in ACTIVE_STATUSES:
+                yield f"event: done\ndata: {json.dumps(job)}\n\n"
+                break
+
+            await asyncio.sleep(1)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,61 @@
+import asyncio
+import hashlib
+import re
+from typing import Any, Awaitable, Callable, Dict
+
+from backend.services.metrics import metrics
+
+
+def prompt_key(prompt: str, *extra: Any) -> str:
+    # Whitespace-only differences (re-rendered templates) still coalesce
+    normalized = re.sub(r"\s+", " ", prompt or "").strip()
+    return hashlib.sha256("|".join([normalized, *map(str, extra)]).encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Concurrent calls with the same key share one execution and its result
+    (or exception). The shared task is only cancelled once every caller
+    waiting on it has been cancelled.
+
+    Not thread-safe: only used from one event loop.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[str, _Flight] = {}
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(factory()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            metrics.incr(f"{self.name}.coalesced")
+
+        flight.waiters += 1
+
+        try:
+            return await asyncio.shield(flight.task)
+
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
@@ -0,0 +1,44 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from backend.config import config
+
+
+def connect(name: str) -> sqlite3.Connection:
+    """
+    Opens (or creates) a local SQLite database under STATE_DIR.
+    WAL mode lets every uvicorn worker on the host share the same file.
+    """
+
+    os.makedirs(config.STATE_DIR, exist_ok=True)
+
+    conn = sqlite3.connect(
+        os.path.join(config.STATE_DIR, f"{name}.db"),
+        timeout=30,
+        isolation_level=None,
+        check_same_thread=False
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    return conn
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """
+    BEGIN IMMEDIATE ... COMMIT, rolled back if the block raises so the
+    shared autocommit connection is never left inside a transaction.
+    """
+
+    conn.execute("BEGIN IMMEDIATE")
+
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+    conn.execute("COMMIT")
@@ -0,0 +1,10 @@
+import os
+import tempfile
+
+# Importing the services builds their clients and local state stores
+os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
+os.environ.setdefault("SUPABASE_SERVICE_KEY", "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoic2VydmljZSJ9.test")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("SENDGRID_API_KEY", "test-key")
+os.environ.setdefault("LLM_PROVIDERS", "stub")
+os.environ["STATE_DIR"] = tempfile.mkdtemp(prefix="ai_screening_tests_")
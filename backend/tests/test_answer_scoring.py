@@ -0,0 +1,58 @@
+import asyncio
+
+from backend.services.answer_scoring import answer_scorer
+
+STRONG = {
+    "skill_score": 24,
+    "communication_score": 23,
+    "problem_solving_score": 24,
+    "culture_fit_score": 22,
+    "note": "Clear, concrete answer."
+}
+
+
+def _evaluate(monkeypatch, transcript, scores):
+    async def ensure(candidate_id, turn, question, answer, vacancy, resume_text):
+        return scores.get(turn)
+
+    monkeypatch.setattr(answer_scorer, "_ensure", ensure)
+    return asyncio.run(answer_scorer.evaluate("c1", transcript, {"job_role": "Dev"}, None))
+
+
+def _transcript(answered):
+    return [
+        {"question": f"Question {i + 1}", "answer": "An answer." if i in answered else None}
+        for i in range(10)
+    ]
+
+
+def test_full_interview_of_strong_answers_is_strong_fit(monkeypatch):
+    evaluation = _evaluate(monkeypatch, _transcript(range(10)), {i: STRONG for i in range(10)})
+
+    assert evaluation["overall_score"] == 93
+    assert evaluation["recommendation"] == "Strong Fit"
+
+
+def test_unanswered_questions_count_against_the_candidate(monkeypatch):
+    evaluation = _evaluate(monkeypatch, _transcript({0}), {0: STRONG})
+
+    assert evaluation["overall_score"] < 20
+    assert evaluation["recommendation"] == "Not Recommended"
+    assert "1 of 10 questions" in evaluation["evaluation_notes"]
+
+
+def test_unscorable_answers_count_as_zero(monkeypatch):
+    evaluation = _evaluate(monkeypatch, _transcript(range(10)), {i: STRONG for i in range(5)})
+
+    assert evaluation["recommendation"] == "Not Recommended"
+
+
+def test_no_answers_is_not_recommended(monkeypatch):
+    evaluation = _evaluate(monkeypatch, _transcript(set()), {})
+
+    assert evaluation["overall_score"] == 0
+    assert evaluation["recommendation"] == "Not Recommended"
+
+
+def test_no_answer_could_be_scored(monkeypatch):
+    assert _evaluate(monkeypatch, _transcript(range(10)), {}) is None
@@ -0,0 +1,36 @@
+import numpy as np
+from PIL import Image
+
+from backend.services.ocr_preprocess import PRESETS, estimate_line_height, preprocess
+
+
+def _scanned_page(line_height=39, descender=6, gap=2, leading=30) -> np.ndarray:
+    """
+    A4 page at 300 DPI: dense text-line bands, each followed by a short,
+    sparse descender band.
+    """
+
+    rng = np.random.default_rng(0)
+    page = np.full((3508, 2480), 255, dtype=np.uint8)
+
+    y = 200
+    while y < 3300:
+        body = rng.random((line_height, 2080)) < 0.25
+        tail = rng.random((descender, 2080)) < 0.03
+        page[y:y + line_height, 200:2280][body] = 0
+        page[y + line_height + gap:y + line_height + gap + descender, 200:2280][tail] = 0
+        y += line_height + gap + descender + leading
+
+    return page
+
+
+def test_descender_bands_are_part_of_their_line():
+    assert estimate_line_height(_scanned_page() < 128) == 47
+
+
+def test_300_dpi_page_is_downscaled():
+    page = _scanned_page()
+    out = preprocess(Image.fromarray(page), "accurate")
+
+    assert out.height < page.shape[0] * 0.8
+    assert out.height >= page.shape[0] * PRESETS["accurate"]["min_scale"]
@@ -0,0 +1,46 @@
+"""
+Standalone job worker: runs queued background jobs (screening of new
+candidates, interview follow-ups) outside the API process, so screening
+throughput scales separately from ingestion.
+
+    python -m backend.worker --queues screening.candidate --threads 4
+
+Set JOB_WORKER_THREADS=0 on the API to leave all jobs to worker processes.
+Workers share the queue through STATE_DIR, so they must run on the same host.
+"""
+
+import argparse
+import time
+
+# Importing these registers their queue handlers
+from backend import ai_interview  # noqa: F401
+from backend.services import screening_jobs  # noqa: F401
+from backend.config import config
+from backend.services.job_queue import job_worker
+from backend.services.llm_client import llm_client
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--queues",
+        default=",".join(config.JOB_WORKER_QUEUES),
+        help="comma-separated queues to work on (default: all)"
+    )
+    parser.add_argument("--threads", type=int, default=max(1, config.JOB_WORKER_THREADS))
+    args = parser.parse_args()
+
+    job_worker.threads = max(1, args.threads)
+    job_worker.start([q.strip() for q in args.queues.split(",") if q.strip()])
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("👋 Job worker stopping; running jobs are retried once their lease expires")
+    finally:
+        llm_client.shutdown()
+
+
+if __name__ == "__main__":
+    main()
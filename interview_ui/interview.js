@@ -192,7 +192,7 @@ function startTimer() {
       if (answerBox.value.trim()) {
         submitAnswer();
       } else {
-        fetchQuestion("");
+        requestQuestion("");
       }
     }
   }, 1000);
@@ -272,47 +272,256 @@ recognition.onend = () => {
   }
 }
 */
+/* ================= STREAMED TTS ================= */
+function speakQueued(text, onDone) {
+  if (interviewPaused || interviewCompleted) return;  // 🔒 BLOCK
+
+  const u = new SpeechSynthesisUtterance(text);
+  u.rate = 0.95;
+  u.pitch = 1;
+  u.volume = 1;
+
+  u.onend = () => {
+    if (!interviewPaused && onDone) onDone();
+  };
+
+  speechSynthesis.speak(u);
+}
+
+// Finished sentences are split off the streamed text so TTS starts on
+// the first one while the rest of the question is still being generated
+function splitSentences(buffer) {
+  const sentences = [];
+  let match;
+
+  while ((match = /[.?!]\s+/.exec(buffer))) {
+    const end = match.index + match[0].length;
+    sentences.push(buffer.slice(0, end).trim());
+    buffer = buffer.slice(end);
+  }
+
+  return { sentences, rest: buffer };
+}
+
+function createSentenceSpeaker(onDone) {
+  let pending = "";
+  let queued = 0;
+  let spoken = 0;
+  let closed = false;
+
+  speechSynthesis.cancel();
+
+  function check() {
+    if (closed && spoken === queued && onDone) onDone();
+  }
+
+  function say(sentence) {
+    queued++;
+    speakQueued(sentence, () => {
+      spoken++;
+      check();
+    });
+  }
+
+  return {
+    push(delta) {
+      const { sentences, rest } = splitSentences(pending + delta);
+      pending = rest;
+      sentences.forEach(say);
+    },
+    close() {
+      if (pending.trim()) say(pending.trim());
+      pending = "";
+      closed = true;
+      check();
+    }
+  };
+}
+
+/* ================= QUESTION TURN ================= */
+let currentTurn = null;
+
+function beginTurn(answer = null) {
+  setState("thinking");
+
+  currentTurn = {
+    // Kept until the next question arrives, so a dropped socket can resend it
+    answer,
+    text: "",
+    speaker: createSentenceSpeaker(() => {
+      if (aiState === "asking" && !interviewCompleted && !interviewPaused) {
+        startTimer();
+      }
+    })
+  };
+}
+
+function onQuestionDelta(delta) {
+  if (!currentTurn.text) {
+    answerBox.value = "";
+    setState("asking");
+  }
+
+  currentTurn.text += delta;
+  questionEl.innerText = currentTurn.text;
+  currentTurn.speaker.push(delta);
+}
+
+async function onQuestionDone(data) {
+  if (!data.question && !data.completed) {
+    console.error("Invalid question response:", data);
+    alert("Interview session error. Please refresh.");
+    return;
+  }
+  if (data.completed) {
+    clearInterval(timerInterval);
+    speechSynthesis.cancel();
+    closeInterviewSocket();
+
+    await fetch(`${API_BASE}/ai-interview/evaluate`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ candidate_id: candidateId })
+    });
+
+    finishInterview(false);
+    return;
+  }
+
+  questionEl.innerText = data.question;
+  lastQuestionText = data.question;
+  submitBtn.disabled = false;
+  submitBtn.innerText = "Submit";
+  setState("asking");
+  currentTurn.speaker.close();
+}
+
+function onQuestionError(e) {
+  console.error(e);
+  submitBtn.disabled = false;
+  submitBtn.innerText = "Submit";
+  alert("Interview error. Refresh if needed.");
+}
+
+/* ================= INTERVIEW SOCKET ================= */
+// One WebSocket for the whole interview; questions are pushed on
+// connect and after every answer. Falls back to HTTP if it drops.
+let interviewSocket = null;
+
+function openInterviewSocket() {
+  return new Promise((resolve, reject) => {
+    const url = `${API_BASE.replace(/^http/, "ws")}/ai-interview/ws?candidate_id=${encodeURIComponent(candidateId)}`;
+    const socket = new WebSocket(url);
+    let opened = false;
+
+    socket.onopen = () => {
+      opened = true;
+      interviewSocket = socket;
+      resolve();
+    };
+
+    socket.onmessage = (e) => {
+      const data = JSON.parse(e.data);
+
+      if (data.type === "delta") {
+        onQuestionDelta(data.text);
+      } else if (data.type === "done") {
+        onQuestionDone(data);
+      } else if (data.type === "error") {
+        onQuestionError(new Error(data.detail));
+      }
+    };
+
+    socket.onclose = (e) => {
+      if (!opened) {
+        reject(new Error("Interview socket failed"));
+        return;
+      }
+
+      interviewSocket = null;
+
+      // 4403: the session is inactive, HTTP would be refused as well
+      if (!interviewCompleted && aiState === "thinking" && e.code !== 4403) {
+        console.warn("⚠️ Interview socket closed, continuing over HTTP");
+        fetchQuestion(currentTurn?.answer);
+      }
+    };
+  });
+}
+
+function closeInterviewSocket() {
+  const socket = interviewSocket;
+  interviewSocket = null;
+  socket?.close();
+}
+
+function requestQuestion(answer = null) {
+  if (interviewCompleted || interviewPaused) return;
+
+  if (interviewSocket && interviewSocket.readyState === WebSocket.OPEN) {
+    beginTurn(answer);
+    interviewSocket.send(JSON.stringify({ answer }));
+    return;
+  }
+
+  fetchQuestion(answer);
+}
+
 /* ================= FETCH QUESTION ================= */
+// Reads the server-sent events of /ai-interview/next/stream and returns
+// the final `done` payload
+async function readQuestionStream(res) {
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) >= 0) {
+      const raw = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      const event = (/^event: (.*)$/m.exec(raw) || [])[1];
+      const data = JSON.parse((/^data: (.*)$/m.exec(raw) || [])[1] || "{}");
+
+      if (event === "delta") {
+        onQuestionDelta(data.text);
+      } else if (event === "done") {
+        return data;
+      } else if (event === "error") {
+        throw new Error(data.detail);
+      }
+    }
+  }
+
+  throw new Error("Question stream ended early");
+}
+
 async function fetchQuestion(answer = null) {
   if (interviewCompleted || interviewPaused) return;
 
   try {
-    setState("thinking");
+    beginTurn(answer);
 
-    const res = await fetch(`${API_BASE}/ai-interview/next`, {
+    const res = await fetch(`${API_BASE}/ai-interview/next/stream`, {
       method: "POST",
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({ candidate_id: candidateId, answer })
     });
 
-    const data = await res.json();
-    if (!data.question && !data.completed) {
-      console.error("Invalid question response:", data);
-      alert("Interview session error. Please refresh.");
-      return;
-    }
-    if (data.completed) {
-      clearInterval(timerInterval);
-      speechSynthesis.cancel();
-
-      await fetch(`${API_BASE}/ai-interview/evaluate`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ candidate_id: candidateId })
-      });
-
-      finishInterview(false);
-      return;
+    if (!res.ok || !res.body) {
+      throw new Error(`Question stream failed (${res.status})`);
     }
 
-    submitBtn.disabled = false;
-    submitBtn.innerText = "Submit";
-    showQuestion(data.question, true);
+    await onQuestionDone(await readQuestionStream(res));
 
   } catch (e) {
-    submitBtn.disabled = false;
-    submitBtn.innerText = "Submit";
-    alert("Interview error. Refresh if needed.");
+    onQuestionError(e);
   }
 }
 
@@ -358,7 +567,7 @@ function submitAnswer() {
   clearInterval(timerInterval);
   speechSynthesis.cancel();
 
-  fetchQuestion(answer);
+  requestQuestion(answer);
 }
 
 /* ================= FINISH ================= */
@@ -375,6 +584,7 @@ function finishInterview(force = false) {
   setState("completed");
   clearInterval(timerInterval);
   speechSynthesis.cancel();
+  closeInterviewSocket();
 
   const video = document.getElementById("camera");
   if (video && video.srcObject) {
@@ -648,7 +858,14 @@ window.addEventListener("DOMContentLoaded", () => {
 
       document.getElementById("startScreen")?.remove();
 
-      fetchQuestion();
+      // The socket pushes the first question as soon as it opens
+      beginTurn();
+      try {
+        await openInterviewSocket();
+      } catch (e) {
+        console.warn("⚠️ Interview socket unavailable, using HTTP", e);
+        fetchQuestion();
+      }
 
     } catch (e) {
       console.error(e);